@@ -15,17 +15,27 @@ description: 项目主入口
 --------------------------------------------
 """
 
+import json
+import click
 from datetime import datetime
 from flask import Flask, request, jsonify
-from core.utils.storage import Qiniu
 from core.handle_db import DBManager
+from core.error import SchemaMigrationError
 from core.config import config, pro_logger
 from core.handle_request import RequestHandler
-from core.models import UserCredit, DatabaseHandler
+from core.command import build_command_registry, COMMAND_MODULES
+from core.command.manifest import generate_manifest, write_manifest
+from core.models import UserCredit, DatabaseHandler, remove_sessions
 
 app = Flask(__name__)
 
 
+@app.teardown_appcontext
+def shutdown_session(exception=None):
+    """每次请求结束，归还当前线程的数据库连接"""
+    remove_sessions()
+
+
 def is_pre_check_failed(
         check_database: bool = True,
         check_qiniu_config: bool = False,
@@ -48,7 +58,7 @@ def is_pre_check_failed(
         config.is_debug and pro_logger.error(new_failed_msg)
 
     # 2. 检查request_token：如果服务端没有设置request_token，则不检查
-    request_data = request.args.get('request_token') or request.get_json().get('request_token')
+    request_data = request.args.get('request_token') or (request.get_json(silent=True) or {}).get('request_token')
     if not config.request_token or not check_request_token:
         config.is_debug and pro_logger.info('未设置request_token，不进行接口鉴权')
     elif not request_data or request_data != config.request_token:
@@ -65,34 +75,62 @@ def is_pre_check_failed(
     return failed_msg
 
 
+def get_request_items():
+    """
+    获取批量上传的数据：NDJSON格式（每行一个json对象）按行流式解析，不会把整个请求体读入内存；其他情况按json解析
+    :return: 数据迭代器；json格式不正确时返回None
+    """
+
+    if request.mimetype not in ('application/x-ndjson', 'application/jsonl'):
+        return request.get_json(silent=True)
+
+    def iter_lines():
+        for line in request.stream:
+            if not line.strip():
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # 格式不正确的行，交给后续处理计入跳过的条数
+                yield None
+
+    return iter_lines()
+
+
 @app.route('/update_credit', methods=['post'])
 def update_credit():
     # 1. 此接口操作比较敏感，需先判断请求是否合法
     if is_pre_check_failed():
         return is_pre_check_failed()
 
-    # 2. 获取传入的数据
-    data = request.get_json()
+    # 2. 获取传入的数据：单个积分变化为json对象；批量更新时传入json列表，在一个事务中完成
+    data = request.get_json(silent=True)
     if not data:
         return '请求数据为空或格式不正确，必须以json格式传入数据'
 
-    for item in ['credit_num', 'reason', 'is_add']:
-        if item not in data:
-            return f'请求数据缺少【{item}】参数'
+    for change in (data if isinstance(data, list) else [data]):
+        if not isinstance(change, dict):
+            return '请求数据格式不正确，列表中的元素必须是json对象'
 
-    if 'official_user_id' not in data and 'unique_user_id' not in data:
-        return 'official_user_id和unique_user_id参数至少有一个不能为空'
+        for item in ['credit_num', 'reason', 'is_add']:
+            if item not in change:
+                return f'请求数据缺少【{item}】参数'
 
-    if data['is_add'] not in [0, 1]:
-        return 'is_add参数值不正确，必须是0或1'
+        if 'official_user_id' not in change and 'unique_user_id' not in change:
+            return 'official_user_id和unique_user_id参数至少有一个不能为空'
 
-    database = DatabaseHandler(
-        db_user=config.db_config.db_user,
-        db_password=config.db_config.db_password,
-        db_host=config.db_config.db_host,
-        db_port=config.db_config.db_port,
-        db_name=config.db_config.db_name,
-    )
+        if change['is_add'] not in [0, 1]:
+            return 'is_add参数值不正确，必须是0或1'
+
+    database = DatabaseHandler.from_config()
+
+    if isinstance(data, list):
+        result, total_credits, msg = UserCredit.bulk_update_user_credit(session=database.session, changes=data)
+        return jsonify({
+            'msg': msg,
+            'total_credits': total_credits,
+        })
 
     result, total_credit, msg = UserCredit.update_user_credit(
         is_add=data['is_add'],
@@ -118,9 +156,17 @@ def database_backup() -> str:
     if is_pre_check_failed(check_qiniu_config=True):
         return is_pre_check_failed(check_qiniu_config=True)
 
-    remote_file_name = f"database_backup_{datetime.now().strftime('%Y%m%d')}.zip"
+    # 备份模式：auto（默认，定期全量 + 每日增量）、full（强制全量）、delta（强制增量）
+    mode = request.args.get('mode', 'auto')
+    db_manager = DBManager()
+    backup_type = db_manager.get_backup_type(mode)
+
+    remote_file_name = f"database_backup_{datetime.now().strftime('%Y%m%d')}_{backup_type}.zip"
     remote_file_path = f"database_backup/{remote_file_name}"
 
+    # 惰性引入存储相关的SDK，只有备份时才需要
+    from core.utils.storage import Qiniu
+
     qiniu_handle = Qiniu(
         access_key=config.qiniu_config.access_key,
         secret_key=config.qiniu_config.secret_key,
@@ -130,8 +176,7 @@ def database_backup() -> str:
     if qiniu_handle.get_file_info(remote_file_path):
         return '今日备份文件已存在，跳过备份'
 
-    db_manager = DBManager()
-    zip_file_path = db_manager.database_backup(remote_file_name)
+    zip_file_path = db_manager.database_backup(remote_file_name, backup_type=backup_type)
 
     if not zip_file_path:
         return '数据备份失败，无法生成zip文件'
@@ -143,6 +188,8 @@ def database_backup() -> str:
 
     msg = f'备份失败，文件无法上传到七牛云'
     if result:
+        # 只有上传成功，才记录水位线；否则下一次增量备份仍从上一次成功的备份开始
+        db_manager.save_backup_record()
         msg = f'备份成功，文件【{remote_file_name}】已上传到七牛云'
 
     config.is_debug and pro_logger.info(msg)
@@ -159,11 +206,15 @@ def database_cleanup() -> str:
 
     # 2. 执行数据库操作
     db_manager = DBManager()
-    result = db_manager.delete_expired_data()
+    report = db_manager.delete_expired_data()
 
-    msg = '数据库清理失败'
-    if result:
-        msg = '数据库清理成功'
+    detail = '；'.join(
+        f'{table_name}：{"失败" if count is None else f"删除{count}条"}' for table_name, count in report.items()
+    )
+
+    msg = f'数据库清理失败（{detail}）'
+    if all(count is not None for count in report.values()):
+        msg = f'数据库清理成功（{detail}）'
 
     # 3. 拟删除，不应该由主程序发送微信消息
     # from core.utils.postman import send_wechat_msg
@@ -180,10 +231,10 @@ def add_source():
     if is_pre_check_failed():
         return is_pre_check_failed()
 
-    # 2. 获取传入的数据
-    data = request.get_json()
+    # 2. 获取传入的数据：json列表，或NDJSON（此时request_token需放在url参数中）
+    data = get_request_items()
     if not data:
-        return '请求数据为空或格式不正确，必须以json格式传入数据'
+        return '请求数据为空或格式不正确，必须以json或NDJSON格式传入数据'
 
     # 3. 执行数据库操作
     db_manager = DBManager()
@@ -194,19 +245,69 @@ def add_source():
 @app.route('/add_keywords', methods=['post'])
 def upload_system_keywords():
     # 1. 此接口操作比较敏感，需先判断请求是否合法
-    if not is_pre_check_failed():
-        return 'request_token参数校验失败；或无数据库配置'
+    if is_pre_check_failed():
+        return is_pre_check_failed()
 
-    # 2. 获取传入的数据
-    data = request.get_json()
+    # 2. 获取传入的数据：json列表，或NDJSON（此时request_token需放在url参数中）
+    data = get_request_items()
     if not data:
-        return '请求数据为空或格式不正确，必须以json格式传入数据'
+        return '请求数据为空或格式不正确，必须以json或NDJSON格式传入数据'
 
     # 3. 执行数据库操作
     db_manager = DBManager()
     return db_manager.upload_system_keyword(data)
 
 
+@app.cli.command('init-db')
+def init_database():
+    """初始化/迁移数据库结构：建表、触发器，并写入结构版本号；每次部署执行一次即可"""
+
+    database = DatabaseHandler.from_config(need_check_database=False)
+
+    try:
+        version = database.bootstrap()
+    except SchemaMigrationError as e:
+        raise click.ClickException(str(e))
+
+    print(f'数据库结构已初始化，当前版本：{version}')
+
+
+@app.cli.command('migrate-indexes')
+def migrate_indexes():
+    """为已存在的表在线补建索引（postgresql使用CONCURRENTLY，不锁表）"""
+
+    database = DatabaseHandler.from_config(need_check_database=False)
+    result = database.migrate_indexes()
+
+    for index_name, status in result.items():
+        print(f'{index_name}: {status}')
+
+    if 'failed' in result.values():
+        raise click.ClickException('部分索引创建失败，请根据日志处理后重新执行')
+
+
+@app.cli.command('build-command-manifest')
+def build_command_manifest():
+    """导入全部指令模块，生成指令清单；部署前执行，运行时指令模块按需导入，缩短冷启动时间"""
+
+    registry = build_command_registry(use_manifest=False)
+    manifest = generate_manifest(registry, COMMAND_MODULES)
+    manifest_file_path = write_manifest(manifest)
+
+    print(f'指令清单已生成：{manifest_file_path}')
+    print(f"直接指令：{len(manifest['first_commands'])}个，参数指令：{len(manifest['commands'])}个")
+
+
+@app.cli.command('restore-db')
+@click.argument('zip_file_paths', nargs=-1, required=True)
+def restore_database(zip_file_paths):
+    """从备份文件恢复数据库：传入一个全量备份文件，以及之后任意个增量备份文件（顺序不限）"""
+
+    report = DBManager(need_check_database=False).database_restore(list(zip_file_paths))
+    for table_name, row_count in report.items():
+        print(f'{table_name}: {row_count}')
+
+
 @app.route('/wechat', methods=['get', 'post'])
 def handle_wechat_request():
     # 获取请求方式
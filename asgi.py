@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/28
+contact: 【公众号】思维兵工厂
+description: ASGI入口
+
+/wechat 接口由异步的 AsyncRequestHandler 处理：等待AI回复时不占用线程，一个进程可以同时处理大量慢请求；
+其他接口（数据库备份、批量上传等管理接口）仍由 app.py 中的Flask应用处理，通过 asgiref 转换为ASGI。
+
+启动方式（需要安装 uvicorn 等ASGI服务器）：
+    uvicorn asgi:application --host 0.0.0.0 --port 9000
+--------------------------------------------
+"""
+
+from urllib.parse import parse_qsl
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+from core.config import config, pro_logger
+from core.handle_async import AsyncRequestHandler
+
+
+class WechatASGIApp(object):
+
+    def __init__(self, wsgi_app, wechat_path: str = '/wechat'):
+        """
+        :param wsgi_app: 处理其他接口的WSGI应用
+        :param wechat_path: 微信消息接口的路径
+        """
+
+        self.wechat_path = wechat_path
+        self.wsgi_app = WsgiToAsgi(wsgi_app)
+        self.sync_workers = config.asgi_sync_workers or 16
+        self.executor = ThreadPoolExecutor(max_workers=self.sync_workers, thread_name_prefix='asgi-sync')
+
+        self.request_handler = AsyncRequestHandler(self.executor)
+        self.request_handler.config = config
+
+    async def __call__(self, scope, receive, send):
+
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+
+        if scope['type'] != 'http' or scope['path'].rstrip('/') != self.wechat_path:
+            return await self.wsgi_app(scope, receive, send)
+
+        query_data = dict(parse_qsl(scope.get('query_string', b'').decode('utf-8')))
+        request_method = scope['method'].lower()
+
+        if request_method == 'get':
+            result = self.request_handler.handle_get(query_data)
+        elif request_method == 'post':
+            result = await self.request_handler.post_async(query_data, await self.read_body(receive))
+        else:
+            result = 'not support method!'
+
+        await self.send_text(send, result or '')
+
+    async def lifespan(self, receive, send) -> None:
+        """服务启动、关闭；关闭时等待线程池中的同步操作完成"""
+
+        while True:
+            message = await receive()
+
+            if message['type'] == 'lifespan.startup':
+                config.is_debug and pro_logger.info(f'ASGI服务已启动，同步操作线程数：{self.sync_workers}')
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def read_body(receive) -> bytes:
+        """读取完整的请求体"""
+
+        body = b''
+        more_body = True
+
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+        return body
+
+    @staticmethod
+    async def send_text(send, text: str) -> None:
+        """发送文本响应"""
+
+        body = text.encode('utf-8')
+
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/html; charset=utf-8'),
+                (b'content-length', str(len(body)).encode('latin-1')),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+
+application = WechatASGIApp(app)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/26
+contact: 【公众号】思维兵工厂
+description: 异步回复：在限定时间内应答微信服务器，超时的处理结果通过客服消息接口推送给用户
+
+微信服务器5秒内收不到响应就会重试，AI会话、图片转文本等耗时操作经常超过这个时间，用户最终收不到回复。
+开启配置项 async_reply_enabled 后，每条消息都交给后台线程池处理，请求线程最多等待 async_reply_budget 秒：
+    - 按时处理完成：和同步模式一样，直接被动回复；
+    - 处理超时：先回复 success（微信不再重试，也不会提示用户“该公众号暂时无法提供服务”），
+      后台线程处理完成之后，通过客服消息接口把结果推送给用户。
+
+客服消息的发送方实现 BaseMessageSender 接口；测试时可通过 set_message_sender 替换为自定义的发送方，
+或将配置项 wechat_api_base 指向本地的模拟服务。
+--------------------------------------------
+"""
+
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from .config import config, pro_logger
+from .types import WechatReplyData
+from .utils.http_client import http_client
+
+# 处理函数的返回值：(被动回复的XML, 回复内容)
+ProcessResult = Tuple[Optional[str], Optional[WechatReplyData]]
+
+
+class BaseMessageSender(object):
+    """客服消息发送方的接口"""
+
+    def send(self, official_user_id: str, reply: WechatReplyData) -> bool:
+        """
+        向用户推送一条客服消息
+        :param official_user_id: 公众号用户ID（openid）
+        :param reply: 回复内容
+        :return: 是否发送成功
+        """
+        raise NotImplementedError
+
+
+class WechatMessageSender(BaseMessageSender):
+    """通过微信客服消息接口发送；access_token 在进程内缓存，过期前自动刷新"""
+
+    token_path = '/cgi-bin/token'
+    send_path = '/cgi-bin/message/custom/send'
+    token_expired_codes = (40001, 40014, 42001)  # access_token 无效或过期的错误码
+
+    def __init__(self, app_id: str, app_secret: str, api_base: str = 'https://api.weixin.qq.com',
+                 timeout: float = 5, refresh_ahead: int = 300):
+        """
+        :param app_id: 公众号appID
+        :param app_secret: 公众号appSecret
+        :param api_base: 微信接口地址
+        :param timeout: 单次接口请求的超时时间，单位：秒
+        :param refresh_ahead: access_token 提前刷新的秒数
+        """
+
+        self.app_id = app_id
+        self.app_secret = app_secret
+        self.api_base = api_base.rstrip('/')
+        self.timeout = timeout
+        self.refresh_ahead = refresh_ahead
+
+        self._access_token: str = ''
+        self._expire_time: float = 0
+        self._lock = threading.Lock()
+
+    def get_access_token(self, force_refresh: bool = False) -> str:
+        """
+        获取 access_token，未过期时使用缓存
+        :param force_refresh: 是否忽略缓存，重新获取
+        :return: access_token；获取失败返回空字符串
+        """
+
+        with self._lock:
+            if not force_refresh and self._access_token and time.time() < self._expire_time:
+                return self._access_token
+
+            params = {
+                'grant_type': 'client_credential',
+                'appid': self.app_id,
+                'secret': self.app_secret,
+            }
+
+            try:
+                response = http_client.get(self.api_base + self.token_path, params=params, timeout=self.timeout)
+                json_resp = response.json()
+            except Exception:
+                pro_logger.error('获取公众号access_token失败', exc_info=True)
+                return ''
+
+            access_token = json_resp.get('access_token')
+            if not access_token:
+                pro_logger.error(f'获取公众号access_token失败：{json_resp}')
+                return ''
+
+            expires_in = int(json_resp.get('expires_in') or 7200)
+            self._access_token = access_token
+            self._expire_time = time.time() + max(expires_in - self.refresh_ahead, 0)
+            return access_token
+
+    @staticmethod
+    def make_payload(official_user_id: str, reply: WechatReplyData) -> Optional[dict]:
+        """
+        生成客服消息的请求体
+        :param official_user_id: 公众号用户ID
+        :param reply: 回复内容
+        :return: 请求体；不支持的回复类型返回None
+        """
+
+        if reply.msg_type == 'text':
+            body = {'content': reply.content}
+        elif reply.msg_type in ('image', 'voice'):
+            body = {'media_id': reply.media_id}
+        else:
+            return None
+
+        return {'touser': official_user_id, 'msgtype': reply.msg_type, reply.msg_type: body}
+
+    def send(self, official_user_id: str, reply: WechatReplyData) -> bool:
+
+        payload = self.make_payload(official_user_id, reply)
+        if not payload:
+            pro_logger.error(f'客服消息不支持【{reply.msg_type}】类型的回复')
+            return False
+
+        for force_refresh in (False, True):
+            access_token = self.get_access_token(force_refresh=force_refresh)
+            if not access_token:
+                return False
+
+            try:
+                # 使用 json 参数时中文会被转义为\uXXXX，客服消息会原样显示转义字符
+                response = http_client.post(
+                    self.api_base + self.send_path,
+                    params={'access_token': access_token},
+                    data=json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+                    headers={'Content-Type': 'application/json; charset=utf-8'},
+                    timeout=self.timeout
+                )
+                json_resp = response.json()
+            except Exception:
+                pro_logger.error('发送客服消息失败', exc_info=True)
+                return False
+
+            errcode = json_resp.get('errcode', 0)
+            if not errcode:
+                return True
+
+            if errcode not in self.token_expired_codes:
+                pro_logger.error(f'发送客服消息失败：{json_resp}')
+                return False
+
+            # access_token 在其他地方被刷新过，缓存已失效：强制刷新后重试一次
+            config.is_debug and pro_logger.info('access_token 已失效，重新获取')
+
+        return False
+
+
+class AsyncReplyTask(object):
+    """一条交给后台处理的消息：请求线程限时等待，超时后由后台线程推送结果"""
+
+    def __init__(self, official_user_id: str):
+        self.official_user_id = official_user_id
+        self.message: Optional[str] = None  # 被动回复的XML
+        self.reply: Optional[WechatReplyData] = None  # 回复内容
+
+        self._finished = threading.Event()
+        self._detached = False  # 请求线程是否已经放弃等待
+        self._lock = threading.Lock()
+
+    def run(self, process: Callable[[], ProcessResult]) -> None:
+        """
+        在后台线程中处理消息；请求线程已经放弃等待时，通过客服消息推送结果
+        :param process: 处理函数
+        :return: None
+        """
+
+        try:
+            message, reply = process()
+        except Exception:
+            pro_logger.error('后台处理消息时出现未知错误', exc_info=True)
+            message, reply = None, None
+
+        with self._lock:
+            self.message, self.reply = message, reply
+            self._finished.set()
+            detached = self._detached
+
+        if detached:
+            push_reply(self.official_user_id, reply)
+
+    def wait(self, budget: float) -> str:
+        """
+        限时等待处理结果
+        :param budget: 最长等待时间，单位：秒
+        :return: 按时完成时为被动回复的XML；超时返回 success，之后由后台线程推送结果
+        """
+
+        self._finished.wait(budget)
+
+        with self._lock:
+            if self._finished.is_set():
+                return self.message
+
+            self._detached = True
+
+        config.is_debug and pro_logger.info(f'消息处理超过{budget}秒，先回复success，处理完成后通过客服消息推送')
+        return 'success'
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_message_sender: Optional[BaseMessageSender] = None
+_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    获取进程内共享的后台线程池，线程数由配置项 async_reply_workers 决定
+    :return: ThreadPoolExecutor
+    """
+
+    global _executor
+
+    if _executor is not None:
+        return _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.async_reply_workers or 4,
+                thread_name_prefix='async-reply'
+            )
+        return _executor
+
+
+def get_message_sender() -> BaseMessageSender:
+    """
+    获取进程内共享的客服消息发送方；未通过 set_message_sender 指定时，使用微信客服消息接口
+    :return: BaseMessageSender
+    """
+
+    global _message_sender
+
+    if _message_sender is not None:
+        return _message_sender
+
+    with _lock:
+        if _message_sender is None:
+            _message_sender = WechatMessageSender(
+                app_id=config.wechat_config.app_id,
+                app_secret=config.wechat_config.app_secret,
+                api_base=config.wechat_api_base or 'https://api.weixin.qq.com'
+            )
+        return _message_sender
+
+
+def set_message_sender(sender: Optional[BaseMessageSender]) -> None:
+    """
+    替换客服消息发送方，如测试时替换为记录消息的模拟发送方；传入None则恢复默认
+    :param sender: 发送方
+    :return: None
+    """
+
+    global _message_sender
+    _message_sender = sender
+
+
+def push_reply(official_user_id: str, reply: Optional[WechatReplyData]) -> bool:
+    """
+    处理超时之后，通过客服消息推送处理结果
+    :param official_user_id: 公众号用户ID
+    :param reply: 回复内容
+    :return: 是否推送成功；没有需要推送的内容时返回False
+    """
+
+    if not reply or (reply.msg_type == 'text' and not reply.content):
+        config.is_debug and pro_logger.info(f'消息处理超时，且没有需要推送的回复内容')
+        return False
+
+    is_sent = get_message_sender().send(official_user_id, reply)
+    config.is_debug and pro_logger.info(f'消息处理超时，已通过客服消息推送结果，推送{"成功" if is_sent else "失败"}')
+    return is_sent
+
+
+def reply_within_budget(official_user_id: str, process: Callable[[], ProcessResult], budget: float) -> str:
+    """
+    把消息交给后台线程池处理，并限时等待结果
+    :param official_user_id: 公众号用户ID，超时后向该用户推送客服消息
+    :param process: 处理函数，返回 (被动回复的XML, 回复内容)
+    :param budget: 最长等待时间，单位：秒
+    :return: 被动回复的内容
+    """
+
+    task = AsyncReplyTask(official_user_id)
+    get_executor().submit(task.run, process)
+    return task.wait(budget)
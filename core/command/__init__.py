@@ -10,157 +10,51 @@ description: 指令功能
 --------------------------------------------
 """
 
-from .base import check_keywords
-
-
-def get_all_first_function_dict():
+from .base import check_keywords, CommandRegistry
+from .manifest import load_manifest
+
+# 指令模块，按顺序注册；不同模块的指令重名时，先注册的生效
+COMMAND_MODULES = (
+    'signin',  # 签到功能
+    'text_oracle',  # 文本加密解密功能
+    'weather',  # 天气查询功能
+    'source',  # 网盘资源搜索功能
+    'account',  # 账户相关功能
+    'text_to_voice',  # 文本转语音功能
+    'ocr',  # 图片转文本功能
+    'note',  # 笔记转存功能
+)
+
+
+def build_command_registry(use_manifest: bool = True) -> CommandRegistry:
     """
-    获取所有关键词功能
-    :return:
+    生成指令注册表：存在有效的指令清单时，指令模块按需导入；否则导入全部模块，每个模块只导入、实例化一次
+    :param use_manifest: 是否使用指令清单
+    :return: CommandRegistry
     """
 
-    all_first_function_dict = dict()
-
-    # 1. 添加签到功能
-    try:
-        from . import signin
-        all_first_function_dict.update(signin.add_first_keyword_function())
-    except:
-        pass
-
-    # 2. 添加文本加密解密功能
-    try:
-        from . import text_oracle
-        all_first_function_dict.update(text_oracle.add_first_keyword_function())
-    except:
-        pass
-
-    # 3. 添加个人信息查询功能
-    try:
-        from . import search_personal_info
-        all_first_function_dict.update(search_personal_info.add_first_keyword_function())
-    except:
-        pass
-
-    # 4. 添加天气查询功能
-    try:
-        from . import weather
-        all_first_function_dict.update(weather.add_first_keyword_function())
-    except:
-        pass
-
-    # 6. 添加网盘资源搜索功能
-    try:
-        from . import source
-        all_first_function_dict.update(source.add_first_keyword_function())
-    except:
-        pass
-
-    # 7. 添加账户相关功能
-    try:
-        from . import account
-        all_first_function_dict.update(account.add_first_keyword_function())
-    except:
-        pass
-
-    # 8. 添加文本转语音功能
-    try:
-        from . import text_to_voice
-        all_first_function_dict.update(text_to_voice.add_first_keyword_function())
-    except:
-        pass
-
-    # 9. 添加图片转文本功能
-    try:
-        from . import ocr
-        all_first_function_dict.update(ocr.add_first_keyword_function())
-    except:
-        pass
-
-    # 10. 添加笔记转存功能
-    try:
-        from . import note
-        all_first_function_dict.update(note.add_first_keyword_function())
-    except:
-        pass
-
-    return all_first_function_dict
-
-
-def get_all_function_dict():
-    """
-    获取所有关键词功能
-    :return:
-    """
-
-    all_get_function_dict = dict()
-
-    # 1. 添加文本加密解密功能
-    try:
-        from . import text_oracle
-        all_get_function_dict.update(text_oracle.add_keyword_function())
-    except:
-        pass
-
-    # 2. 添加个人信息查询功能
-    try:
-        from . import search_personal_info
-        all_get_function_dict.update(search_personal_info.add_keyword_function())
-    except:
-        pass
-
-    # 3. 添加天气查询功能
-    try:
-        from . import weather
-        all_get_function_dict.update(weather.add_keyword_function())
-    except:
-        pass
-
-    # 5. 添加网盘资源搜索功能
-    try:
-        from . import source
-        all_get_function_dict.update(source.add_keyword_function())
-    except:
-        pass
-
-    # 6. 添加账户相关功能
-    try:
-        from . import account
-        all_get_function_dict.update(account.add_keyword_function())
-    except:
-        pass
-
-    # 7. 添加文本转语音相关功能
-    try:
-        from . import text_to_voice
-        all_get_function_dict.update(text_to_voice.add_keyword_function())
-    except:
-        pass
+    registry = CommandRegistry(package=__name__, module_names=COMMAND_MODULES)
 
-    # 8. 添加图片转文本功能
-    try:
-        from . import ocr
-        all_get_function_dict.update(ocr.add_keyword_function())
-    except:
-        pass
+    manifest = load_manifest(COMMAND_MODULES) if use_manifest else None
+    if manifest:
+        registry.use_manifest(manifest)
+    else:
+        registry.load_all()
 
-    # 10. 添加笔记转存功能
-    try:
-        from . import note
-        all_get_function_dict.update(note.add_keyword_function())
-    except:
-        pass
+    registry.report()
+    return registry
 
-    return all_get_function_dict
 
+COMMAND_REGISTRY = build_command_registry()
 
-FIRST_FUNCTION_DICT = get_all_first_function_dict()
-ALL_FUNCTION_DICT = get_all_function_dict()
+FIRST_FUNCTION_DICT = COMMAND_REGISTRY.first_function_dict
+ALL_FUNCTION_DICT = COMMAND_REGISTRY.function_dict
 
 __all__ = [
     'check_keywords',
-    'get_all_first_function_dict',
-    'get_all_function_dict',
+    'build_command_registry',
+    'COMMAND_MODULES',
+    'COMMAND_REGISTRY',
     'FIRST_FUNCTION_DICT',
     'ALL_FUNCTION_DICT'
 ]
@@ -12,11 +12,12 @@ description: 【关键词回复功能】与账号相关功能
 
 import time
 import uuid
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 from ..config import config
 from ..constant import cancel_command_list
 from ..models import AuthenticatedCode, WechatUser, KeyWord, UserCredit
+from ..keyword_cache import system_keyword_index
 from ..types import WechatReplyData, Command, SinglePageData
 from .base import WeChatKeyword, register_function
 
@@ -248,6 +249,7 @@ class KeywordFunction(WeChatKeyword):
             if is_exist:
                 post_handler.database.session.delete(is_exist)
                 post_handler.database.session.commit()
+                system_keyword_index.invalidate(post_handler.database)
                 obj.content = obj.content + f"\n\n关键词【{content}】已被删除"
             else:
                 obj.content = obj.content + f"\n\n关键词【{content}】不存在"
@@ -293,6 +295,7 @@ class KeywordFunction(WeChatKeyword):
 
             post_handler.database.session.add(keyword_obj)
             post_handler.database.session.commit()
+            system_keyword_index.invalidate(post_handler.database)
 
             obj.content = f"---关键词回复设置成功：【{content}】---"
 
@@ -335,7 +338,22 @@ class KeywordFunction(WeChatKeyword):
         """获取所有指令，生成菜单"""
 
         post_handler: BasePostHandler = kwargs.get('post_handler')
-        system_function_dict = kwargs.get('function_dict')
+
+        command_obj_list = self.get_command_list(post_handler.function_dict, post_handler.wechat_user.is_master)
+
+        # 指令菜单由注册信息生成，翻页时在内存中重新生成并截取，不需要保存每一页
+        first_page_content = self.paginate(
+            content=content,
+            handle_function=self.command_single_page,
+            load_function=self.load_command_page,
+            total_count=len(command_obj_list),
+            post_handler=post_handler
+        )
+
+        return WechatReplyData(msg_type="text", content=first_page_content)
+
+    def get_command_list(self, system_function_dict: dict, is_master: bool) -> List[Command]:
+        """内部方法：根据注册信息，生成展示给用户的指令列表"""
 
         function_dict = dict()
 
@@ -349,7 +367,7 @@ class KeywordFunction(WeChatKeyword):
                 if not function_obj.function_intro:
                     continue
 
-                if function_obj.is_master and not post_handler.wechat_user.is_master:
+                if function_obj.is_master and not is_master:
                     continue
 
                 if function_obj.function_name not in function_dict:
@@ -374,9 +392,14 @@ class KeywordFunction(WeChatKeyword):
 
             command_obj_list.append(command_obj)
             k += 1
-        first_page_content = self.paginate(content, self.command_single_page, command_obj_list, post_handler)
 
-        return WechatReplyData(msg_type="text", content=first_page_content)
+        return command_obj_list
+
+    def load_command_page(self, post_handler: "BasePostHandler", params: dict, offset: int, limit: int):
+        """内部方法：按页获取指令列表"""
+
+        command_obj_list = self.get_command_list(post_handler.function_dict, post_handler.wechat_user.is_master)
+        return command_obj_list[offset:offset + limit]
 
     @register_function(first_function_dict=FIRST_FUNCTION_DICT, function_dict=FUNCTION_DICT,
                        commands=['当前指令', '指令', ], is_first=True, function_intro='输出当前进入的指令')
@@ -479,13 +502,3 @@ class KeywordFunction(WeChatKeyword):
 连续签到有额外积分奖励；
 单次签到最高可获得 {config.max_credit} 积分"""
         return WechatReplyData(msg_type="text", content=header + msg)
-
-
-def add_keyword_function(agent_id=None, *args, **kwargs):
-    obj = KeywordFunction(agent_id=agent_id, *args, **kwargs)
-    return {obj: FUNCTION_DICT}
-
-
-def add_first_keyword_function(agent_id=None, *args, **kwargs):
-    obj = KeywordFunction(agent_id=agent_id, *args, **kwargs)
-    return {obj: FIRST_FUNCTION_DICT}
@@ -11,20 +11,26 @@ description:
 """
 
 import re
+import json
 import time
 import random
 import logging
-from typing import Optional, Union, List, Callable, Sequence, TYPE_CHECKING
+import threading
+import importlib
+from typing import Optional, Union, List, Dict, Callable, Sequence, TYPE_CHECKING
 
-from ..models import KeyWord
 from ..config import pro_logger, config
 from ..error import WechatReplyTypeError
 from ..constant import sep_char, cancel_command_list
-from ..types import FunctionInfo, ConfigData, WechatReplyData, SinglePageData
+from ..deadline import Deadline, get_deadline
+from ..types import FunctionInfo, ConfigData, WechatReplyData, SinglePageData, CommandEntry, ParsedCommand
 
 if TYPE_CHECKING:
     from ..handle_post import BasePostHandler
 
+# 注册时发现的重名指令，启动时由 CommandRegistry.report 统一输出
+register_conflicts: List[str] = []
+
 
 def register_function(
         commands: Union[str, Sequence[str]],
@@ -62,6 +68,7 @@ def register_function(
                 msg = f"函数重名错误，关键词【{func.strip()}】已与【{old_func_name}】绑定，不可再绑定【{real_func_obj.__name__}】"
 
                 config.is_debug and pro_logger.error(msg)
+                register_conflicts.append(msg)
                 continue
 
             func_dict[func.strip()] = FunctionInfo(
@@ -89,99 +96,237 @@ def register_function(
     return inner
 
 
-def check_keywords(
-        first_function_dict: dict,
-        function_dict: dict,
-        keyword: str,
-        *args,
-        **kwargs
-) -> Optional[WechatReplyData]:
+class CommandRegistry(object):
     """
-    检查关键词是否匹配
-    :param first_function_dict: 存储关键词与实现对应功能的字典；直接功能，即调用时无需参数
-    :param function_dict: 存储关键词与实现对应功能的字典；非直接功能，即调用时需要传递参数
-    :param keyword: 触发关键词（用户发送的原文本内容）
-    :return:
+    指令注册表：将各指令模块的注册信息编译为 指令 -> CommandEntry（处理对象, 方法信息）的映射，
+    分发时只需一次字典查找，不再逐个模块遍历；
+    设置了指令清单（use_manifest）时，指令模块在其指令第一次被调用时才导入
     """
 
-    if not keyword:
-        return
+    def __init__(self, package: str, module_names: Sequence[str]):
 
-    if config.wechat_config.sep_char in keyword:
+        self.package = package  # 指令模块所在的包
+        self.module_names = tuple(module_names)  # 指令模块，按顺序注册
+        self.loaded_modules: Dict[str, bool] = {}  # 已尝试导入的模块 -> 是否导入成功
+        self.manifest: Optional[dict] = None  # 指令清单，为空表示启动时导入全部模块
+        self._lock = threading.RLock()
 
-        command, content = keyword.split(config.wechat_config.sep_char, maxsplit=1)
+        self.first_commands: Dict[str, CommandEntry] = {}  # 直接指令，即调用时无需参数
+        self.commands: Dict[str, CommandEntry] = {}  # 需要参数的指令，即 指令+分隔符+内容
 
-        pro_logger.info(f"用户输入的关键词包含分隔符")
-        pro_logger.info(f"将关键词拆分为两部分：命令【{command}】和 内容【{content}】")
+        # 按模块组织的注册信息 {处理对象: {指令: FunctionInfo}}，用于生成指令菜单
+        self.first_function_dict: dict = {}
+        self.function_dict: dict = {}
 
-        if config.wechat_config.sep_char in content:
-            content, key = content.split(config.wechat_config.sep_char, maxsplit=1)
-            pro_logger.info(f"将内容拆分为两部分：内容【{content}】和 键（key）【{key}】")
-        else:
-            key = None
-            pro_logger.info(f"内容中不包含分隔符，键（key）为空")
+        self.handlers: Dict[str, "WeChatKeyword"] = {}  # 模块名称 -> 处理对象，用于翻页
+        self.handler_modules: Dict["WeChatKeyword", str] = {}  # 处理对象 -> 指令模块名称
+        self.conflicts: List[str] = []  # 模块之间的重名指令
 
-        pro_logger.info(f"逐一判断命令【{command}】是否在注册列表【function_dict】中")
-        for handler_obj, command_dict in function_dict.items():
+    def use_manifest(self, manifest: dict) -> None:
+        """设置指令清单，之后按需导入指令模块"""
 
-            if command in command_dict:
+        self.manifest = manifest
 
-                pro_logger.info(f"匹配到命令【{command}】对应的处理方法")
+    def load_module(self, module_name: str) -> bool:
+        """
+        导入一个指令模块并实例化，添加到注册表；每个模块只导入一次
+        :param module_name: 指令模块名称
+        :return: 是否导入成功
+        """
+
+        with self._lock:
+            if module_name in self.loaded_modules:
+                return self.loaded_modules[module_name]
+
+            # 导入失败也记录下来，避免每条消息都重复导入
+            self.loaded_modules[module_name] = False
+
+            try:
+                module = importlib.import_module(f'.{module_name}', self.package)
+                self.add_handler(module.KeywordFunction(), module.FIRST_FUNCTION_DICT, module.FUNCTION_DICT, module_name)
+            except Exception:
+                pro_logger.error(f'指令模块【{module_name}】加载失败', exc_info=True)
+                return False
 
-                function_info_obj: FunctionInfo = command_dict[command]
+            self.loaded_modules[module_name] = True
+            config.is_debug and pro_logger.info(f'指令模块【{module_name}】已导入')
+            return True
+
+    def load_all(self) -> None:
+        """导入全部指令模块，如生成指令菜单时"""
+
+        if len(self.loaded_modules) == len(self.module_names):
+            return
 
-                pro_logger.info(f"该方法为：【{handler_obj.model_name}.{function_info_obj.function_name}】；即将调用该方法")
+        for module_name in self.module_names:
+            self.load_module(module_name)
 
-                result = function_info_obj.function(
-                    handler_obj, content, key=key,
-                    function_dict=function_dict,
-                    first_function_dict=first_function_dict,
-                    *args, **kwargs
-                )
+    def add_handler(
+            self,
+            handler_obj: "WeChatKeyword",
+            first_function_dict: dict,
+            function_dict: dict,
+            module_name: str = None
+    ) -> None:
+        """
+        添加一个指令模块；与已添加模块重名的指令，保留先添加的；
+        使用指令清单时，重名指令以清单记录的模块为准，与模块的导入顺序无关
+        :param handler_obj: 指令模块的处理对象，每个模块只实例化一次
+        :param first_function_dict: 该模块注册的直接指令
+        :param function_dict: 该模块注册的需要参数的指令
+        :param module_name: 指令模块名称
+        :return: None
+        """
 
-                if not isinstance(result, WechatReplyData):
-                    raise WechatReplyTypeError(
-                        f'【关键词：{command}】对应的函数【{function_info_obj.function_name}】返回值类型错误'
+        self.handlers[handler_obj.model_name] = handler_obj
+        self.first_function_dict[handler_obj] = first_function_dict
+        self.function_dict[handler_obj] = function_dict
+
+        # 按需导入时模块的导入顺序不固定，按模块列表的顺序重新排列，保证指令菜单的顺序不变
+        if module_name:
+            self.handler_modules[handler_obj] = module_name
+            for module_dict in (self.first_function_dict, self.function_dict):
+                items = sorted(module_dict.items(), key=lambda item: self.get_module_order(item[0]))
+                module_dict.clear()
+                module_dict.update(items)
+
+        for table_name, table, command_dict in (
+                ('first_commands', self.first_commands, first_function_dict),
+                ('commands', self.commands, function_dict)
+        ):
+            for command, function_info in command_dict.items():
+
+                # 清单生成时已输出过重名指令，这里直接跳过
+                if self.manifest and self.manifest[table_name].get(command) != module_name:
+                    continue
+
+                exist_entry = table.get(command)
+                if exist_entry:
+                    self.conflicts.append(
+                        f"指令重名：【{command}】已绑定【{exist_entry.handler_obj.model_name}.{exist_entry.function_info.function_name}】，"
+                        f"忽略【{handler_obj.model_name}.{function_info.function_name}】"
                     )
+                    continue
 
-                return result
+                table[command] = CommandEntry(handler_obj=handler_obj, function_info=function_info)
 
-        pro_logger.info(f"未匹配到命令【{command}】对应的处理方法")
-    else:
-        pro_logger.info(f"用户输入的关键词不包含分隔符")
-        pro_logger.info(f"逐一判断命令【{keyword}】是否在注册列表【first_function_dict】中")
+    def get_module_order(self, handler_obj: "WeChatKeyword") -> int:
+        """处理对象所在模块在模块列表中的顺序"""
 
-        for handler_obj, command_dict in first_function_dict.items():
+        module_name = self.handler_modules.get(handler_obj)
+        return self.module_names.index(module_name) if module_name in self.module_names else len(self.module_names)
 
-            if keyword in command_dict:
+    def report(self) -> None:
+        """输出注册结果与重名指令"""
 
-                pro_logger.info(f"匹配到命令【{keyword}】对应的处理方法")
+        for msg in register_conflicts + self.conflicts:
+            pro_logger.warning(msg)
 
-                if config.wechat_config.sep_char in keyword:
-                    keyword, key = keyword.split(config.wechat_config.sep_char, maxsplit=1)
-                else:
-                    key = None
+        if self.manifest:
+            config.is_debug and pro_logger.info(
+                f"指令注册完成：按指令清单注册{len(self.manifest['first_commands'])}个直接指令，"
+                f"{len(self.manifest['commands'])}个参数指令，指令模块按需导入"
+            )
+            return
 
-                function_info_obj: FunctionInfo = command_dict[keyword]
+        config.is_debug and pro_logger.info(
+            f"指令注册完成：共{len(self.handlers)}个模块，{len(self.first_commands)}个直接指令，{len(self.commands)}个参数指令"
+        )
 
-                pro_logger.info(f"该方法为：【{handler_obj.model_name}.{function_info_obj.function_name}】；即将调用该方法")
+    @staticmethod
+    def parse(keyword: str) -> ParsedCommand:
+        """
+        按分隔符拆分用户输入：指令---内容---键（key）
+        :param keyword: 用户发送的原文本
+        :return: ParsedCommand
+        """
 
-                result = function_info_obj.function(
-                    handler_obj, keyword, key=key,
-                    function_dict=function_dict,
-                    first_function_dict=first_function_dict,
-                    *args, **kwargs
+        sep = config.wechat_config.sep_char
 
-                )
+        if not sep or sep not in keyword:
+            return ParsedCommand(command=keyword, content=keyword)
 
-                if not isinstance(result, WechatReplyData):
-                    raise WechatReplyTypeError(
-                        f'【关键词：{keyword}】对应的函数【{function_info_obj.function_name}】返回值类型错误'
-                    )
+        command, content = keyword.split(sep, maxsplit=1)
+
+        key = None
+        if sep in content:
+            content, key = content.split(sep, maxsplit=1)
+
+        return ParsedCommand(command=command, content=content, key=key, has_sep=True)
+
+    def lookup(self, parsed: ParsedCommand) -> Optional[CommandEntry]:
+        """查找指令对应的处理对象与方法；指令所在的模块尚未导入时，先导入该模块"""
+
+        table_name = 'commands' if parsed.has_sep else 'first_commands'
+        table = self.commands if parsed.has_sep else self.first_commands
+
+        entry = table.get(parsed.command)
+        if entry or not self.manifest:
+            return entry
+
+        module_name = self.manifest[table_name].get(parsed.command)
+        if module_name and self.load_module(module_name):
+            return table.get(parsed.command)
+
+    def get_handler(self, model_name: str) -> Optional["WeChatKeyword"]:
+        """根据模块名称获取处理对象；模块尚未导入时，先导入该模块"""
+
+        handler_obj = self.handlers.get(model_name)
+        if handler_obj or not self.manifest:
+            return handler_obj
+
+        module_name = self.manifest['handlers'].get(model_name)
+        if module_name and self.load_module(module_name):
+            return self.handlers.get(model_name)
+
+    def is_first_command(self, keyword: str) -> bool:
+        """文本是否是已注册的直接指令；不需要导入指令模块"""
+
+        if keyword in self.first_commands:
+            return True
+
+        return bool(self.manifest) and keyword in self.manifest['first_commands']
 
-                return result
 
-        pro_logger.info(f"未匹配到命令【{keyword}】对应的处理方法")
+def check_keywords(registry: CommandRegistry, keyword: str, *args,
+                   deadline: Optional[Deadline] = None, **kwargs) -> Optional[WechatReplyData]:
+    """
+    检查关键词是否匹配指令，匹配则调用对应的方法
+    :param registry: 指令注册表
+    :param keyword: 触发关键词（用户发送的原文本内容）
+    :param deadline: 本次消息的截止时间，以关键字参数 deadline 传给指令方法
+    :return: 方法的返回结果；未匹配到指令返回None
+    """
+
+    if not keyword:
+        return
+
+    parsed = registry.parse(keyword)
+    entry = registry.lookup(parsed)
+
+    if not entry:
+        config.is_debug and pro_logger.info(f"未匹配到命令【{parsed.command}】对应的处理方法")
+        return
+
+    function_info_obj: FunctionInfo = entry.function_info
+    config.is_debug and pro_logger.info(
+        f"匹配到命令【{parsed.command}】，对应方法：【{entry.handler_obj.model_name}.{function_info_obj.function_name}】；即将调用该方法"
+    )
+
+    result = function_info_obj.function(
+        entry.handler_obj, parsed.content, key=parsed.key,
+        function_dict=registry.function_dict,
+        first_function_dict=registry.first_function_dict,
+        deadline=deadline or get_deadline(),
+        *args, **kwargs
+    )
+
+    if not isinstance(result, WechatReplyData):
+        raise WechatReplyTypeError(
+            f'【关键词：{parsed.command}】对应的函数【{function_info_obj.function_name}】返回值类型错误'
+        )
+
+    return result
 
 
 class WeChatKeyword(object):
@@ -199,81 +344,110 @@ class WeChatKeyword(object):
         self.command_intro_title = "------ ✍🏻 短指令介绍------\n\n{}"
 
     @staticmethod
-    def save_command_keyword(post_handler: "BasePostHandler", command: str) -> bool:
-
-        try:
-            current_timestamp = int(time.time())
-            expire_time = current_timestamp + config.command_expire_time
-
-            keyword_obj = KeyWord(
-                keyword=post_handler.current_command_key,
-                reply_content=command,  # 注意这里存储的key，得是注册函数时 commands 列表中的值
-                official_user_id=post_handler.request_data.to_user_id,
-                reply_type='text',
-                expire_time=expire_time,
-            )
+    def save_command_state(post_handler: "BasePostHandler", command: str) -> bool:
+        """
+        进入指令模式：将当前指令保存到用户会话状态中，有效期为配置项 command_expire_time
+        :param post_handler: post_handler
+        :param command: 指令名称，注意这里存储的值，得是注册函数时 commands 列表中的值
+        :return: 是否保存成功
+        """
 
-            post_handler.database.session.add(keyword_obj)
-            post_handler.database.session.commit()
+        result = post_handler.state_store.set(
+            official_user_id=post_handler.request_data.to_user_id,
+            state_key=post_handler.command_state_key,
+            state_value=command,
+            ttl=config.command_expire_time
+        )
 
+        if result:
             config.is_debug and pro_logger.info(f"【{command}】指令保存成功")
-            return True
-        except:
-            config.is_debug and pro_logger.error(f"【{command}】指令保存失败", exc_info=True)
-            return False
+        else:
+            config.is_debug and pro_logger.error(f"【{command}】指令保存失败")
+        return result
+
+    @staticmethod
+    def get_per_page_count() -> int:
+        """获取每页数据量"""
 
-    def paginate(self, content: str, handle_function: Callable, item_list: List, post_handler) -> Optional[str]:
+        try:
+            return int(config.per_page_count)
+        except:
+            pro_logger.error(f"【系统配置】每页数据量配置错误；本次处理默认每页数据量：5", exc_info=True)
+            return 5
+
+    def paginate(
+            self,
+            content: str,
+            handle_function: Callable,
+            load_function: Callable,
+            total_count: int,
+            post_handler: "BasePostHandler",
+            params: Optional[dict] = None
+    ) -> str:
         """
-        系统方法：将传入的列表（任何数据类的实例）进行分页、每页数据存入redis缓存
-        :param content: 用户输入的关键词；
-        :param handle_function: 处理方法，该方法接收元素为Command实例的列表，处理成字符串；
-        :param item_list: 所有项目列表，元素为Command实例；
+        系统方法：分页输出结果。不预先生成每一页，只为 (用户, 查询) 保存一个游标：
+        游标记录加载方法、查询参数与总数，用户回复【查询-页码】时，再由 render_page 按需加载、生成该页
+        :param content: 用户输入的关键词，也是翻页指令的前缀；
+        :param handle_function: 处理方法，接收SinglePageData，生成单页的文本；
+        :param load_function: 加载方法，load_function(post_handler, params, offset, limit)，返回一页的数据列表；
+        :param total_count: 数据总数；
         :param post_handler: post_handler；
-        :return:
+        :param params: 查询参数，需可以序列化为json；
+        :return: 第一页的内容
         """
 
-        try:
-            per_page_count = int(config.per_page_count)
-        except:
-            self.logger.error(f"【系统配置】每页数据量配置错误；本次处理默认每页数据量：5", exc_info=True)
-            per_page_count = 5
+        cursor = {
+            'model_name': self.model_name,
+            'load_function': load_function.__name__,
+            'handle_function': handle_function.__name__,
+            'params': params or {},
+            'total_count': total_count,
+        }
+
+        post_handler.state_store.set(
+            official_user_id=post_handler.request_data.to_user_id,
+            state_key=self.get_page_state_key(content),
+            state_value=json.dumps(cursor, ensure_ascii=False),
+            ttl=config.page_cursor_expire_time
+        )
 
-        # 按照系统配置的每页数量进行分页
-        pages = [item_list[i:i + per_page_count] for i in range(0, len(item_list), per_page_count)]
+        return self.render_page(content, 1, cursor, post_handler)
 
-        first_page_content: str = ''
-        current_timestamp = int(time.time())
-        expire_time = current_timestamp + 60 * 60 * 3
+    @staticmethod
+    def get_page_state_key(content: str) -> str:
+        """分页游标在会话状态中的key；状态名称最长100个字符"""
 
-        for index, page in enumerate(pages, start=1):
+        return f"page:{content}"[:100]
 
-            page_obj = SinglePageData(
-                current_page=index,
-                total_page=len(pages),
-                data=page,
-                title=content
-            )
+    def render_page(self, content: str, page_num: int, cursor: dict, post_handler: "BasePostHandler") -> Optional[str]:
+        """
+        系统方法：根据游标，加载并生成指定页的内容
+        :param content: 查询关键词
+        :param page_num: 页码，从1开始
+        :param cursor: paginate 保存的游标
+        :param post_handler: post_handler；
+        :return: 该页的内容；页码超出范围返回None
+        """
 
-            # 将单页数据存入redis缓存
-            reply_content = handle_function(page_obj)
-            keyword = f"{content}-{index}"
+        per_page_count = self.get_per_page_count()
+        total_page = max((cursor['total_count'] + per_page_count - 1) // per_page_count, 1)
 
-            keyword_obj = KeyWord(
-                keyword=keyword,
-                reply_content=reply_content,
-                reply_type='text',
-                official_user_id=post_handler.request_data.to_user_id,
-                expire_time=expire_time,
-            )
+        if page_num < 1 or page_num > total_page:
+            return None
 
-            post_handler.database.session.add(keyword_obj)
+        load_function = getattr(self, cursor['load_function'])
+        handle_function = getattr(self, cursor['handle_function'])
 
-            if index == 1:
-                first_page_content = reply_content
+        page = load_function(post_handler, cursor['params'], (page_num - 1) * per_page_count, per_page_count)
 
-        post_handler.database.session.commit()
+        page_obj = SinglePageData(
+            current_page=page_num,
+            total_page=total_page,
+            data=page,
+            title=content
+        )
 
-        return first_page_content
+        return handle_function(page_obj, post_handler=post_handler)
 
     @staticmethod
     def make_pagination(current_page_num: Union[str, int], pages_num: Union[str, int], search_keyword: str):
@@ -393,17 +567,13 @@ class WeChatKeyword(object):
     @staticmethod
     def cancel_command(post_handler: "BasePostHandler") -> WechatReplyData:
 
-        keywords = post_handler.database.session.query(KeyWord).filter(
-            KeyWord.keyword == post_handler.current_command_key,
-            KeyWord.official_user_id == post_handler.request_data.to_user_id
-        ).all()
-        if not keywords:
+        has_command = post_handler.state_store.delete(
+            official_user_id=post_handler.request_data.to_user_id,
+            state_key=post_handler.command_state_key
+        )
+        if not has_command:
             return WechatReplyData(msg_type="text", content="---已在首页，没有进入指令---")
 
-        for keyword in keywords:
-            post_handler.database.session.delete(keyword)
-        post_handler.database.session.commit()
-
         return WechatReplyData(msg_type="text", content="---已退出指令模式---")
 
     def check_is_cancel_command(self, content: str, post_handler: "BasePostHandler") -> Optional[WechatReplyData]:
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/23
+contact: 【公众号】思维兵工厂
+description: 指令清单：指令 -> 指令模块 的静态映射，用于按需导入指令模块
+
+云函数冷启动时，导入全部指令模块（及其依赖的 requests、pycryptodome、pytz 等）是第一条消息的主要耗时；
+构建镜像/部署前执行 `flask --app app build-command-manifest` 生成清单，运行时只读取清单，
+某个指令第一次被调用时，才导入它所在的模块。
+
+清单中记录了所有指令模块源码的指纹，模块修改之后指纹不一致，清单自动失效，退回到启动时导入全部模块。
+--------------------------------------------
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, Optional, Sequence, TYPE_CHECKING
+
+from ..config import config, pro_logger
+
+if TYPE_CHECKING:
+    from .base import CommandRegistry
+
+command_dir = os.path.dirname(os.path.abspath(__file__))
+manifest_path = os.path.join(command_dir, 'command_manifest.json')
+
+
+def get_modules_fingerprint(module_names: Sequence[str]) -> str:
+    """
+    计算指令模块源码的指纹：模块列表及顺序、各模块文件内容，任何一项变化都会导致指纹变化
+    :param module_names: 指令模块名称列表
+    :return: 指纹字符串
+    """
+
+    sha1 = hashlib.sha1()
+
+    for module_name in ('base',) + tuple(module_names):
+        sha1.update(module_name.encode('utf-8'))
+
+        module_path = os.path.join(command_dir, f'{module_name}.py')
+        if os.path.exists(module_path):
+            with open(module_path, 'rb') as f:
+                sha1.update(f.read())
+
+    return sha1.hexdigest()
+
+
+def generate_manifest(registry: "CommandRegistry", module_names: Sequence[str]) -> Dict:
+    """
+    根据已导入全部模块的指令注册表生成清单；重名指令按注册表的取舍记录所属模块
+    :param registry: 已导入全部指令模块的注册表
+    :param module_names: 指令模块名称列表
+    :return: 清单字典
+    """
+
+    def get_module_name(handler_obj) -> str:
+        return type(handler_obj).__module__.rsplit('.', maxsplit=1)[-1]
+
+    return {
+        'fingerprint': get_modules_fingerprint(module_names),
+        'first_commands': {
+            command: get_module_name(entry.handler_obj) for command, entry in registry.first_commands.items()
+        },
+        'commands': {
+            command: get_module_name(entry.handler_obj) for command, entry in registry.commands.items()
+        },
+        'handlers': {
+            model_name: get_module_name(handler_obj) for model_name, handler_obj in registry.handlers.items()
+        },
+    }
+
+
+def write_manifest(manifest: Dict) -> str:
+    """
+    写入清单文件
+    :param manifest: 清单字典
+    :return: 清单文件路径
+    """
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    return manifest_path
+
+
+def load_manifest(module_names: Sequence[str]) -> Optional[Dict]:
+    """
+    读取清单文件，并校验指纹
+    :param module_names: 指令模块名称列表
+    :return: 清单字典；文件不存在、格式错误或指纹不一致时返回None
+    """
+
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except Exception:
+        pro_logger.error(f'指令清单【{manifest_path}】读取失败，将导入全部指令模块', exc_info=True)
+        return None
+
+    if manifest.get('fingerprint') != get_modules_fingerprint(module_names):
+        pro_logger.warning(f'指令模块已修改，指令清单已过期，将导入全部指令模块；请重新生成指令清单')
+        return None
+
+    config.is_debug and pro_logger.info(f'已读取指令清单，共{len(manifest["handlers"])}个模块，指令模块将按需导入')
+    return manifest
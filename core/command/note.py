@@ -11,13 +11,13 @@ description: 【关键词回复功能】 笔记转存功能
 """
 
 import time
-import requests
 import threading
 from typing import TYPE_CHECKING
 
 from ..config import config, pro_logger
 from ..types import WechatReplyData
 from .base import WeChatKeyword, register_function
+from ..utils.http_client import http_client, get_timeout
 
 if TYPE_CHECKING:
     from ..handle_post import BasePostHandler
@@ -41,7 +41,8 @@ def send_save_note_request(note_url: str, yun_func_token: str, yun_func_url: str
     if not yun_func_url.endswith('/upload_note'):
         yun_func_url = yun_func_url + '/upload_note'
 
-    requests.post(yun_func_url, json=data)
+    # 该函数在后台线程中调用，云函数转存笔记耗时较长，使用较长的读取超时
+    http_client.post(yun_func_url, json=data, timeout=get_timeout(config.http_background_read_timeout))
 
 
 class KeywordFunction(WeChatKeyword):
@@ -228,13 +229,3 @@ class KeywordFunction(WeChatKeyword):
 🌱示例🌱
 输入【{content}---笔记地址URL】，设定独属于您的笔记地址，用于转存笔记。"""
         return WechatReplyData(msg_type="text", content=self.command_intro_title.format(msg))
-
-
-def add_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FUNCTION_DICT}
-
-
-def add_first_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FIRST_FUNCTION_DICT}
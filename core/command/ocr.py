@@ -11,11 +11,12 @@ description: 【关键词回复功能】 图片转文本功能
 """
 
 import time
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from ..config import config
 from ..models import KeyWord
 from ..types import WechatReplyData
+from ..deadline import Deadline, DeadlineExceeded
 from ..utils.api_baidu import BaiduOCR
 from .base import WeChatKeyword, register_function
 
@@ -52,7 +53,7 @@ class KeywordFunction(WeChatKeyword):
 
         if not post_handler.current_command:
             # 注意这里的command参数，传入的值得是 commands 列表中的值
-            result = self.save_command_keyword(post_handler=post_handler, command=self.command)
+            result = self.save_command_state(post_handler=post_handler, command=self.command)
 
             if not result:
                 return WechatReplyData(
@@ -76,6 +77,7 @@ class KeywordFunction(WeChatKeyword):
                 media_id=media_id,
                 content=content,
                 post_handler=post_handler,
+                deadline=kwargs.get('deadline'),
             )
 
         return WechatReplyData(
@@ -84,16 +86,19 @@ class KeywordFunction(WeChatKeyword):
         )
 
     def ocr_one_pic(self, image_url: str, media_id: str, content: str,
-                    post_handler: "BasePostHandler") -> WechatReplyData:
+                    post_handler: "BasePostHandler", deadline: Optional[Deadline] = None) -> WechatReplyData:
         """
         OCR一张图片，该图片由微信参数中的PicUrl获取
         :param image_url: 用户发送图片时，图片的url地址
         :param media_id: 用户发送图片时，图片的media_id
         :param content: 用户发送文本时，文本内容
         :param post_handler:
+        :param deadline: 本次消息的截止时间，时间用完时不再重试
         :return:
         """
 
+        deadline = deadline or post_handler.deadline
+
         result = self.check_is_cancel_command(content, post_handler)
         if result:
             return result
@@ -112,6 +117,10 @@ class KeywordFunction(WeChatKeyword):
         # image_title = f"{datetime.datetime.today().strftime('%Y%m%d')}-{short_uuid}.jpg"
 
         for i in range(3):
+
+            if deadline.expired:
+                break
+
             try:
                 config.is_debug and self.logger.info(f"开始ocr图片，该图片链接为：【{image_url}】")
                 config.is_debug and self.logger.info(f"该图片的media_id为：【{media_id}】")
@@ -151,9 +160,18 @@ class KeywordFunction(WeChatKeyword):
                     content=reply
                 )
 
+            except DeadlineExceeded:
+                break
             except:
                 config.is_debug and self.logger.error(f"ocr图片过程中可能出现网络错误，即将重试...", exc_info=True)
 
+        if deadline.expired:
+            config.is_debug and self.logger.warning(f"处理消息的时间已用完，放弃ocr图片")
+            return WechatReplyData(
+                msg_type="text",
+                content='图片识别超时，请稍后重新发送图片；\n\n返回主页可输入【退出】'
+            )
+
         # 没有成功完成ocr，也需要返回内容
         return WechatReplyData(
             msg_type="text",
@@ -194,13 +212,3 @@ class KeywordFunction(WeChatKeyword):
         info = f'{paragraphs[0]} - - - - - - - - - - - - - - - - \n\n该文本较长，仅显示第一页\n\n可输入以下命令，获取后续：\n' + all_page
 
         return info
-
-
-def add_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FUNCTION_DICT}
-
-
-def add_first_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FIRST_FUNCTION_DICT}
@@ -53,41 +53,27 @@ class KeywordFunction(WeChatKeyword):
         # 获取当前日期
         today = now.date()
 
-        existing_sign_in = post_handler.database.session.query(UserSignIn).filter(
-            UserSignIn.official_user_id == post_handler.request_data.to_user_id,
-            UserSignIn.sign_in_date == today
-        ).first()
-
-        if existing_sign_in:
+        # 一条条件UPDATE完成签到；今天已经签到过，则不会更新任何数据
+        new_sign_in, credit_num = UserSignIn.sign_in(
+            session=post_handler.database.session,
+            wechat_user=post_handler.wechat_user,
+            today=today
+        )
+
+        if new_sign_in is None:
             return WechatReplyData(
                 msg_type='text',
                 content="您今天已经签到过了，请明天再来吧！"
             )
-        else:
-            new_sign_in, credit_num = UserSignIn.update_consecutive_days(
-                session=post_handler.database.session,
-                official_user_id=post_handler.request_data.to_user_id,
-                wechat_user=post_handler.wechat_user
-            )
-
-            if credit_num == 0:
-                return WechatReplyData(
-                    msg_type='text',
-                    content=f"签到操作失败；当前总积分{post_handler.wechat_user.credit}，如果积分未增加，请重试！"
-                )
 
-            msg = f"---签到成功！---\n\n本次签到获取{credit_num}积分，当前总积分{post_handler.wechat_user.credit}\n\n---连续签到{new_sign_in.consecutive_days}天---"
+        if credit_num == 0:
             return WechatReplyData(
                 msg_type='text',
-                content=msg
+                content=f"签到操作失败；当前总积分{post_handler.wechat_user.credit}，如果积分未增加，请重试！"
             )
 
-
-def add_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FUNCTION_DICT}
-
-
-def add_first_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FIRST_FUNCTION_DICT}
+        msg = f"---签到成功！---\n\n本次签到获取{credit_num}积分，当前总积分{post_handler.wechat_user.credit}\n\n---连续签到{new_sign_in.consecutive_days}天---"
+        return WechatReplyData(
+            msg_type='text',
+            content=msg
+        )
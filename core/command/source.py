@@ -49,18 +49,43 @@ class KeywordFunction(WeChatKeyword):
 
         post_handler: BasePostHandler = kwargs.get('post_handler')
 
-        results = post_handler.database.session.query(Source).filter(
-            or_(
-                Source.title.like(f'%{content}%'),
-                Source.check_title.like(f'%{content}%'),
-                Source.description.like(f'%{content}%')
-            )
-        ).all()
-
-        if not results:
+        total_count = post_handler.database.session.query(func.count(Source.id)).filter(
+            self.get_search_condition(content)
+        ).scalar()
+
+        if not total_count:
             return WechatReplyData(msg_type="text", content=f"---【{content}】搜索无结果---")
 
-        results_list = [SourceFile(
+        # 只保存查询游标，翻页时再按页查询数据库
+        first_page_content = self.paginate(
+            content=content,
+            handle_function=self.source_single_page,
+            load_function=self.load_source_page,
+            total_count=total_count,
+            post_handler=post_handler,
+            params={'keyword': content}
+        )
+
+        return WechatReplyData(msg_type="text", content=first_page_content)
+
+    @staticmethod
+    def get_search_condition(keyword: str):
+        """资源搜索的查询条件"""
+
+        return or_(
+            Source.title.like(f'%{keyword}%'),
+            Source.check_title.like(f'%{keyword}%'),
+            Source.description.like(f'%{keyword}%')
+        )
+
+    def load_source_page(self, post_handler: "BasePostHandler", params: dict, offset: int, limit: int):
+        """内部方法：按页查询资源搜索结果"""
+
+        results = post_handler.database.session.query(Source).filter(
+            self.get_search_condition(params['keyword'])
+        ).order_by(Source.id).offset(offset).limit(limit).all()
+
+        return [SourceFile(
             title=result.title,
             check_title=result.check_title,
             share_key=result.share_key,
@@ -70,10 +95,6 @@ class KeywordFunction(WeChatKeyword):
             drive_name=result.drive_name
         ) for result in results]
 
-        first_page_content = self.paginate(content, self.source_single_page, results_list, post_handler)
-
-        return WechatReplyData(msg_type="text", content=first_page_content)
-
     @register_function(first_function_dict=FIRST_FUNCTION_DICT, function_dict=FUNCTION_DICT,
                        commands=['source_single_page', ], is_show=False, )
     def source_single_page(self, single_page: SinglePageData, *args, **kwargs):
@@ -111,13 +132,3 @@ class KeywordFunction(WeChatKeyword):
 输入【{content}---三国演义】，即可搜索与“三国演义”有关的资源"""
 
         return WechatReplyData(msg_type="text", content=self.command_intro_title.format(msg))
-
-
-def add_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FUNCTION_DICT}
-
-
-def add_first_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FIRST_FUNCTION_DICT}
@@ -155,13 +155,3 @@ class KeywordFunction(WeChatKeyword):
 密钥必须由字母、数字或特殊字符组成，不能包含中文。"""
 
         return WechatReplyData(msg_type="text", content=self.command_intro_title.format(msg))
-
-
-def add_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FUNCTION_DICT}
-
-
-def add_first_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FIRST_FUNCTION_DICT}
@@ -11,7 +11,6 @@ description: 【关键词回复功能】 文字转语音功能
 """
 
 import time
-import requests
 import threading
 from typing import Dict, TYPE_CHECKING
 
@@ -19,6 +18,7 @@ from .base import WeChatKeyword, register_function
 from ..config import config, pro_logger
 from ..types import WechatReplyData
 from ..models import KeyWord
+from ..utils.http_client import http_client, get_timeout
 
 if TYPE_CHECKING:
     from ..handle_post import BasePostHandler
@@ -78,7 +78,12 @@ class KeywordFunction(WeChatKeyword):
                 config.is_debug and pro_logger.error(f"[文本转语音] 未配置云函数URL，调用失败")
                 return False
 
-            result = requests.post(config.yun_func_tts_config.func_url, json=data)
+            # 该方法在后台线程中调用，云函数合成语音耗时较长，使用较长的读取超时
+            result = http_client.post(
+                config.yun_func_tts_config.func_url,
+                json=data,
+                timeout=get_timeout(config.http_background_read_timeout)
+            )
 
             config.is_debug and pro_logger.info(f"[文本转语音] 云函数调用结果：{result.text}")
             config.is_debug and pro_logger.info(f"[文本转语音] 云函数调用成功")
@@ -159,13 +164,3 @@ f"🌱示例🌱
 输入【{content}---需要配音的文本】"""
 
         return WechatReplyData(msg_type="text", content=self.command_intro_title.format(msg))
-
-
-def add_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FUNCTION_DICT}
-
-
-def add_first_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FIRST_FUNCTION_DICT}
@@ -140,13 +140,3 @@ class KeywordFunction(WeChatKeyword):
 如：回复【2天后天气】，将给出2天后的天气信息。"""
 
         return WechatReplyData(msg_type="text", content=self.command_intro_title.format(msg))
-
-
-def add_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FUNCTION_DICT}
-
-
-def add_first_keyword_function(*args, **kwargs):
-    obj = KeywordFunction(*args, **kwargs)
-    return {obj: FIRST_FUNCTION_DICT}
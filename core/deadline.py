@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/31
+contact: 【公众号】思维兵工厂
+description: 处理一条消息的截止时间
+
+微信服务器5秒内收不到响应就会重试，总共请求三次；同一条消息的重试请求会等待第一次请求的处理结果，
+所以第一次请求之后约15秒内得到的结果，用户仍然能收到，超过这个时间，再慢的处理也没有意义了。
+
+RequestHandler 收到消息时创建 Deadline，经 PostHandler、check_keywords 传给指令，
+AI接口、OCR等重试循环在每次重试前检查剩余时间，时间不够时直接返回兜底回复；
+处理消息期间截止时间同时记录在上下文变量中，公共HTTP客户端据此缩短请求的超时，不必每个接口都传参。
+
+注意：新建的线程不会继承上下文变量，后台线程中的耗时调用不受截止时间限制。
+--------------------------------------------
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """处理消息的剩余时间已用完"""
+
+
+class Deadline(object):
+    """截止时间；budget 为 None 时不限时"""
+
+    def __init__(self, budget: Optional[float] = None):
+        """
+        :param budget: 从现在开始的可用时间，单位：秒
+        """
+
+        self.budget = budget
+        self.expire_at = None if budget is None else time.monotonic() + budget
+
+    def remaining(self) -> Optional[float]:
+        """剩余时间，单位：秒；不限时返回None"""
+
+        if self.expire_at is None:
+            return None
+
+        return max(self.expire_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.expire_at is not None and time.monotonic() >= self.expire_at
+
+    def has_time(self, seconds: float) -> bool:
+        """剩余时间是否还够 seconds 秒"""
+
+        remaining = self.remaining()
+        return remaining is None or remaining >= seconds
+
+    def cap(self, timeout: Optional[float]) -> Optional[float]:
+        """
+        用剩余时间限制超时时间
+        :param timeout: 原本的超时时间，None表示不限
+        :return: 两者中较小的一个
+        """
+
+        remaining = self.remaining()
+
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+
+        return min(timeout, remaining)
+
+    def check(self, action: str = '') -> None:
+        """剩余时间已用完时抛出 DeadlineExceeded"""
+
+        if self.expired:
+            raise DeadlineExceeded(f'处理消息的时间已用完，放弃{action}' if action else '处理消息的时间已用完')
+
+    def __repr__(self) -> str:
+        return f'Deadline(budget={self.budget}, remaining={self.remaining()})'
+
+
+# 当前正在处理的消息的截止时间；没有设置时不限时
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar('current_deadline', default=None)
+
+_no_deadline = Deadline()
+
+
+def get_deadline() -> Deadline:
+    """获取当前的截止时间；不在消息处理过程中时，返回不限时的 Deadline"""
+
+    return _current_deadline.get() or _no_deadline
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    在 with 语句内把 deadline 设为当前的截止时间，退出时恢复；线程池中的线程会被复用，必须恢复
+    :param deadline: 截止时间
+    :return:
+    """
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
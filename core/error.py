@@ -24,3 +24,13 @@ class ConfigError(Exception):
 class WechatReplyTypeError(Exception):
     """关键词回复异常"""
     msg = "回复类型错误，所有函数的返回结果必须是WechatReplyData类型"
+
+
+class SchemaOutdatedError(Exception):
+    """数据库结构版本落后"""
+    msg = "数据库结构版本落后，请先执行 `flask --app app init-db` 完成迁移！"
+
+
+class SchemaMigrationError(Exception):
+    """数据库结构迁移失败"""
+    msg = "数据库结构迁移失败，请根据日志处理后重新执行 `flask --app app init-db`！"
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/28
+contact: 【公众号】思维兵工厂
+description: 异步处理微信消息，供 asgi.py 使用
+
+消息处理沿用 RequestHandler/PostHandler 的逻辑，分为三段：
+    1. 关键词、指令、数据库读写等同步操作，交给有界线程池执行（线程数由配置项 asgi_sync_workers 决定）；
+    2. 需要AI回复时，在事件循环中 await 异步的AI接口，等待期间不占用线程；
+    3. 写入AI回复、唤醒等待的重试请求，同样交给线程池执行。
+AI会话是最主要的慢请求，一个进程可以同时等待大量AI回复，而线程池只处理耗时很短的数据库操作。
+AI回复超过5秒时微信会重试，同一进程内的重试请求在事件循环中等待第一次请求的结果，同样不占用线程。
+--------------------------------------------
+"""
+
+import sys
+import asyncio
+import importlib
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Set
+
+from .config import config, pro_logger
+from .deadline import Deadline
+from .handle_post import PostHandler, wechat_timeout
+from .handle_request import RequestHandler
+from .async_reply import ProcessResult, push_reply
+from .single_flight import message_flights
+
+# 处理超时、仍在后台运行的任务；事件循环只保留任务的弱引用，需要在这里持有
+_background_tasks: Set[asyncio.Future] = set()
+
+
+class AsyncRequestHandler(RequestHandler):
+
+    def __init__(self, executor: ThreadPoolExecutor) -> None:
+        super().__init__()
+
+        self.executor = executor  # 执行同步操作的线程池
+
+    async def run_sync(self, func: Callable, *args):
+        """在线程池中执行同步函数"""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    async def post_async(self, query_data: dict, body: bytes) -> Optional[str]:
+        """
+        处理post请求
+        :param query_data: 请求的query参数
+        :param body: 请求体
+        :return: 被动回复的内容
+        """
+
+        xml_dict, error_message = self.parse_post(query_data, body)
+        if xml_dict is None:
+            return error_message
+
+        msg_type = xml_dict.get('MsgType')  # 获取本次消息的MsgType
+        deadline = self.make_deadline()
+
+        if not self.config.async_reply_enabled:
+            return (await self.handle_message_async(xml_dict, msg_type, deadline))[0]
+
+        # 异步回复模式：超时先回复success，处理完成后通过客服消息推送
+        task = asyncio.ensure_future(self.handle_message_async(xml_dict, msg_type, deadline))
+        done, _ = await asyncio.wait({task}, timeout=self.config.async_reply_budget)
+
+        if done:
+            return task.result()[0]
+
+        self.config.is_debug and pro_logger.info(
+            f'消息处理超过{self.config.async_reply_budget}秒，先回复success，处理完成后通过客服消息推送'
+        )
+
+        _background_tasks.add(task)
+        task.add_done_callback(partial(self.on_late_result, xml_dict.get('FromUserName')))
+        return 'success'
+
+    async def handle_message_async(self, xml_dict: dict, msg_type: str,
+                                   deadline: Optional[Deadline] = None) -> ProcessResult:
+        """
+        处理一条消息：同步操作在线程池中执行，AI回复在事件循环中等待
+        :param xml_dict: 解析后的请求数据
+        :param msg_type: 消息类型
+        :param deadline: 本次消息的截止时间
+        :return: (被动回复的XML, 回复内容)
+        """
+
+        handler = PostHandler(xml_dict, deadline=deadline)
+        handler.defer_ai = True
+
+        result = await self.wait_in_flight(handler)
+        if result is not None:
+            return result
+
+        result = await self.run_sync(self.process, handler, msg_type)
+        if not handler.ai_request:
+            return result
+
+        # 第一次导入openai需要一秒左右，放在线程池中导入，避免阻塞事件循环
+        if 'openai' not in sys.modules:
+            await self.run_sync(importlib.import_module, 'openai')
+
+        try:
+            ai_answer = await handler.get_ai_answer_async(*handler.ai_request, handler.deadline)
+        except asyncio.CancelledError:
+            # 服务关闭时任务被取消，唤醒等待的重试请求，让其通过数据库判断
+            handler.release_flight(None)
+            raise
+        except Exception:
+            pro_logger.error('获取AI回复时出现未知错误', exc_info=True)
+            ai_answer = None
+
+        return await self.run_sync(self.finish_ai_reply, handler, ai_answer)
+
+    @staticmethod
+    async def wait_in_flight(handler: PostHandler) -> Optional[ProcessResult]:
+        """
+        同一进程内正在处理这条消息时（微信的重试请求），在事件循环中等待第一次请求的结果
+        :param handler: 消息处理对象
+        :return: (被动回复的XML, 回复内容)；没有正在处理的请求，或前一次处理失败时返回None，交给 process 处理
+        """
+
+        request_data = handler.request_data
+        if not request_data.msg_id:
+            return None
+
+        call = message_flights.get((request_data.to_user_id, request_data.msg_id))
+        if not call:
+            return None
+
+        config.is_debug and pro_logger.info('该条消息正在本进程中处理，等待前一次处理完成')
+
+        reply = await call.wait_async(timeout=handler.deadline.cap(wechat_timeout))
+        if reply:
+            handler.reply_obj = reply
+            return handler.real_reply_message, handler.reply_obj
+
+        # 超过5秒，微信将重新发送请求；前一次处理失败时，再通过数据库判断
+        if not call.done:
+            return None, None
+
+        return None
+
+    def on_late_result(self, official_user_id: str, task: asyncio.Future) -> None:
+        """超时的任务完成后，在线程池中推送客服消息"""
+
+        _background_tasks.discard(task)
+
+        if task.cancelled():
+            return
+
+        if task.exception():
+            pro_logger.error('后台处理消息时出现未知错误', exc_info=task.exception())
+            return
+
+        reply = task.result()[1]
+        asyncio.get_running_loop().run_in_executor(self.executor, push_reply, official_user_id, reply)
@@ -6,7 +6,7 @@ project: wechat_official_SCF
 author: 子不语
 date: 2024/12/5
 contact: 【公众号】思维兵工厂
-description: 数据库操作：删除过期数据、批量添加系统关键词、批量添加资源链接等；
+description: 数据库操作：删除过期数据、批量添加系统关键词、批量添加资源链接、备份与恢复数据库等；
 
 eg：设置云函数的时候，可以设置一个定期任务，给数据库瘦身；
 
@@ -19,6 +19,8 @@ upload_source 方法接收post请求，传入的数据类型：
         "description": "非必须",
         "user": "非必须",
         "source_title": "非必须",
+        "pwd": "非必须",
+        "catalog": "非必须",
     },
 ]
 
@@ -29,272 +31,927 @@ upload_system_keyword 方法接收post请求，传入的数据类型：
         "content": "必须",
     },
 ]
+
+两个接口也支持 NDJSON 格式（Content-Type: application/x-ndjson），每行一个json对象，服务端边读取边分批写入；
+资源以 key 去重、系统关键词以 keyword 去重，重复上传会更新已有数据
 --------------------------------------------
 """
 
+import io
 import os
+import re
+import json
 import time
 import zipfile
-from typing import Dict, List
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Iterator, Iterable, Tuple, Callable
 
+from sqlalchemy import select, delete, and_, func, text, tuple_, Table
 from sqlalchemy.schema import CreateTable
+from sqlalchemy.dialects import postgresql, sqlite, mysql
 from sqlalchemy.exc import SQLAlchemyError
 
-from core.constant import file_save_dir_path
+from core.constant import file_save_dir_path, drive_info
 from core.config import config, pro_logger, project_dir
-from .models import DatabaseHandler, BaseModel, Source, KeyWord, AuthenticatedCode, WechatMessage
+from .keyword_cache import system_keyword_index
+from .matcher import normalize_match_type
+from .models import DatabaseHandler, BaseModel, Source, KeyWord, AuthenticatedCode, WechatMessage, BackupRecord, \
+    UserState, SCHEMA_VERSION
 
 
 class DBManager(object):
-    def __init__(self):
-        self.database = DatabaseHandler(
-            db_type=config.db_config.db_type,
-            db_user=config.db_config.db_user,
-            db_password=config.db_config.db_password,
-            db_host=config.db_config.db_host,
-            db_port=config.db_config.db_port,
-            db_name=config.db_config.db_name,
-            need_check_database=True
-        )
+    # 只追加、不修改的数据表，增量备份时按主键水位线只导出新增数据；
+    # 值为：(时间字段, 稳定等待秒数)，时间水位线记录在备份清单中，便于按时间点排查
+    incremental_tables = {
+        'wechat_credit': ('change_date', 0),
+        'wechat_sign_in': ('sign_in_date', 0),
+        'wechat_message': ('receive_time', 60 * 5),
+    }
+
+    # 解析备份文件中的SQL字面量：字符串、NULL、数字、括号与分隔符
+    sql_token_pattern = re.compile(r"'((?:[^']|'')*)'|(NULL)|(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)|([(),;])")
+
+    def __init__(self, need_check_database: bool = True):
+        """
+        :param need_check_database: 是否检查数据库结构版本；恢复数据库时表结构由恢复过程创建，不需要检查
+        """
 
-    def upload_source(self, data: List[Dict]) -> str:
+        self.database = DatabaseHandler.from_config(need_check_database=need_check_database)
+
+    def upsert_rows(
+            self,
+            connection,
+            table: Table,
+            rows: List[Dict],
+            key_column: str,
+            update_columns: List[str],
+            index_where=None
+    ) -> None:
         """
-        向数据库上传资源链接
-        :param data:
+        按自然键批量写入一批数据（一条多行INSERT语句）：键已存在则更新，不存在则插入。
+        postgresql、sqlite使用 ON CONFLICT DO UPDATE；mysql使用 ON DUPLICATE KEY UPDATE；
+        不支持部分唯一索引的情况，先删除已存在的数据，再插入（在同一个事务中完成）
+        :param connection: 数据库连接（事务由调用方控制）
+        :param table: 数据表
+        :param rows: 数据列表，每个元素的字段必须一致，且自然键不重复
+        :param key_column: 自然键字段，需有对应的唯一索引
+        :param update_columns: 键已存在时需要更新的字段
+        :param index_where: 部分唯一索引的条件，需与索引定义完全一致
+        :return: None
+        """
+
+        db_type = self.database.engine.url.get_backend_name()
+
+        if db_type in ('postgresql', 'sqlite'):
+            insert_func = postgresql.insert if db_type == 'postgresql' else sqlite.insert
+            statement = insert_func(table).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[key_column],
+                index_where=index_where,
+                set_={column: statement.excluded[column] for column in update_columns}
+            )
+            connection.execute(statement)
+            return
+
+        if db_type == 'mysql' and index_where is None:
+            statement = mysql.insert(table).values(rows)
+            statement = statement.on_duplicate_key_update(
+                {column: statement.inserted[column] for column in update_columns}
+            )
+            connection.execute(statement)
+            return
+
+        condition = table.c[key_column].in_([row[key_column] for row in rows])
+        if index_where is not None:
+            condition = and_(condition, index_where)
+
+        connection.execute(table.delete().where(condition))
+        connection.execute(table.insert().values(rows))
+
+    def __upload_items(
+            self,
+            items: Iterable[Dict],
+            make_row: Callable[[Dict], Optional[Dict]],
+            table: Table,
+            key_column: str,
+            update_columns: List[str],
+            index_where=None,
+            data_name: str = '数据'
+    ) -> str:
+        """
+        分批上传数据：边读取边写入，每 upload_chunk_size 条执行一次upsert并单独提交，不会把全部数据保留在内存中
+        :param items: 数据迭代器，可以是列表，也可以是逐行解析请求体的生成器
+        :param make_row: 将上传的一条数据转为数据表的一行；数据格式不正确返回None，该条数据会被跳过
+        :param table: 数据表
+        :param key_column: 自然键字段
+        :param update_columns: 键已存在时需要更新的字段
+        :param index_where: 部分唯一索引的条件
+        :param data_name: 数据名称，用于日志与返回信息
         :return: str：上传操作信息
         """
 
-        if not isinstance(data, list):
-            return '数据格式不正确，传入的数据必须是一个列表！'
+        chunk_size = config.upload_chunk_size or 500
+        written_count, skipped_count = 0, 0
 
-        for item in data:
-            if not isinstance(item, dict):
-                return '数据格式不正确，传入的数据元素必须是一个字典！'
+        # 以自然键为键：同一批次中重复的数据只保留最后一条，ON CONFLICT 不允许一条语句中重复更新同一行
+        chunk: Dict[str, Dict] = {}
 
-            if 'key' not in item or 'title' not in item or 'platform' not in item:
-                return '数据格式不正确，传入的元素必须是字典，且字典里必须包含key、title和url字段！'
+        def flush():
+            if not chunk:
+                return 0
+
+            with self.database.engine.begin() as connection:
+                self.upsert_rows(connection, table, list(chunk.values()), key_column, update_columns, index_where)
+
+            count = len(chunk)
+            chunk.clear()
+            return count
 
         try:
-            for item in data:
-                obj = Source(
-                    key=item.get('key'),
-                    title=item.get('title'),
-                    source_title=item.get('source_title'),
-                    description=item.get('description'),
-                    platform=item.get('platform'),
-                    user=item.get('user')
-                )
-                self.database.session.add(obj)
-            self.database.session.commit()
-            return 'success'
+            for item in items:
+                row = make_row(item) if isinstance(item, dict) else None
+                if not row:
+                    skipped_count += 1
+                    continue
+
+                chunk[row[key_column]] = row
+                if len(chunk) >= chunk_size:
+                    written_count += flush()
+
+            written_count += flush()
         except SQLAlchemyError:
-            pro_logger.error(f"添加资源链接操作失败", exc_info=True)
-            self.database.session.rollback()
-            return '数据库操作出现未知错误，数据已经回滚！'
+            pro_logger.error(f"添加{data_name}操作失败，已写入{written_count}条", exc_info=True)
+            return f'数据库操作出现未知错误，当前批次已回滚；此前已写入{written_count}条{data_name}'
 
-    def upload_system_keyword(self, data: List[Dict]) -> str:
+        config.is_debug and pro_logger.info(f"添加{data_name}完成：写入{written_count}条，跳过{skipped_count}条")
+
+        if skipped_count:
+            return f'部分数据格式不正确，已跳过{skipped_count}条；成功写入{written_count}条{data_name}'
+        return 'success'
+
+    @staticmethod
+    def make_source_row(item: Dict) -> Optional[Dict]:
         """
-        向数据库上传系统关键字
-        :param data:
-        :return: str：上传操作信息
+        将上传的一条资源数据转为 wechat_source 表的一行
+        :param item: 上传的数据，必须包含 key、title、platform 字段（platform为网盘类型编号或网盘名称）
+        :return: dict；缺少必须字段或网盘类型无法识别时返回None
         """
 
-        if not isinstance(data, list):
-            return '数据格式不正确，传入的数据必须是一个列表！'
+        share_key = item.get('key') or item.get('share_key')
+        title = item.get('title')
+        platform = item.get('platform') or item.get('drive_type')
+
+        if not share_key or not title or not platform:
+            return None
 
-        for item in data:
+        if isinstance(platform, str) and not platform.isdigit():
+            platform = next(
+                (drive_type for drive_type, info in drive_info.items() if info['drive_name'] == platform), None
+            )
+        if not platform or int(platform) not in drive_info:
+            return None
+
+        return {
+            'share_key': str(share_key),
+            'title': title,
+            'check_title': item.get('source_title'),
+            'description': item.get('description'),
+            'share_pwd': item.get('pwd') or item.get('share_pwd'),
+            'user': item.get('user'),
+            'catalog': item.get('catalog'),
+            'drive_type': int(platform),
+        }
 
-            if not isinstance(item, dict):
-                return '数据格式不正确，传入的数据元素必须是一个字典！'
+    @staticmethod
+    def make_keyword_row(item: Dict) -> Optional[Dict]:
+        """
+        将上传的一条系统关键词转为 wechat_keywords 表的一行
+        :param item: 上传的数据，必须包含 keyword、content 字段；可选 match_type（exact|prefix|contains）、priority 字段
+        :return: dict；缺少必须字段时返回None
+        """
 
-            if 'keyword' not in item or 'content' not in item:
-                return '数据格式不正确，传入的元素必须是字典，且字典里必须包含keyword和content字段！'
+        if not item.get('keyword') or not item.get('content'):
+            return None
 
         try:
-            for item in data:
-                obj = KeyWord(
-                    keyword=item['keyword'],
-                    reply_content=item['content'],
-                    reply_type='text',
-                    official_user_id='系统',
-                    is_delete=0,
-                    is_encrypt=0,
-                    expire_time=0
-                )
-                self.database.session.add(obj)
+            priority = int(item.get('priority') or 0)
+        except (TypeError, ValueError):
+            return None
+
+        return {
+            'keyword': item['keyword'],
+            'reply_content': item['content'],
+            'reply_type': 'text',
+            'match_type': normalize_match_type(item.get('match_type')),
+            'priority': priority,
+            'official_user_id': '系统',
+            'is_delete': 0,
+            'is_encrypt': 0,
+            'expire_time': 0,
+        }
+
+    def upload_source(self, data: Iterable[Dict]) -> str:
+        """
+        向数据库上传资源链接，以 share_key 去重：已存在的资源会被更新
+        :param data: 资源数据列表，或逐条返回资源数据的迭代器
+        :return: str：上传操作信息
+        """
 
-            self.database.session.commit()
-            return 'success'
-        except SQLAlchemyError:
-            pro_logger.error(f"添加关键词操作失败", exc_info=True)
-            self.database.session.rollback()
-            return '数据库操作出现未知错误，数据已经回滚！'
+        if isinstance(data, (dict, str)):
+            return '数据格式不正确，传入的数据必须是一个列表！'
+
+        return self.__upload_items(
+            items=data,
+            make_row=self.make_source_row,
+            table=Source.__table__,
+            key_column='share_key',
+            update_columns=['title', 'check_title', 'description', 'share_pwd', 'user', 'catalog', 'drive_type'],
+            data_name='资源链接'
+        )
 
-    def __delete_expired_data(self, data_model: BaseModel, model_name: str, crt_timestamp: int = None) -> bool:
+    def upload_system_keyword(self, data: Iterable[Dict]) -> str:
+        """
+        向数据库上传系统关键字，以 keyword 去重：已存在的系统关键词会更新回复内容
+        :param data: 关键词数据列表，或逐条返回关键词数据的迭代器
+        :return: str：上传操作信息
         """
-        删除过期数据
+
+        if isinstance(data, (dict, str)):
+            return '数据格式不正确，传入的数据必须是一个列表！'
+
+        try:
+            return self.__upload_items(
+                items=data,
+                make_row=self.make_keyword_row,
+                table=KeyWord.__table__,
+                key_column='keyword',
+                update_columns=['reply_content', 'reply_type', 'match_type', 'priority', 'is_delete', 'is_encrypt', 'expire_time'],
+                index_where=text("official_user_id = '系统'"),
+                data_name='系统关键词'
+            )
+        finally:
+            # 部分批次写入失败时，已提交的批次同样需要生效
+            system_keyword_index.invalidate(self.database)
+
+    def __delete_expired_data(
+            self,
+            data_model: BaseModel,
+            model_name: str,
+            crt_timestamp: int = None,
+            chunk_size: int = None,
+            throttle: float = None
+    ) -> Optional[int]:
+        """
+        分批删除过期数据：每批只查询主键，再以 DELETE ... WHERE id IN (...) 删除，每批单独提交；
+        避免把全部过期数据加载到内存，也避免长事务长时间锁表
         :param data_model: 数据库模型
         :param model_name: 数据库模型名称
         :param crt_timestamp: 当前时间戳，默认为当前时间
-        :return: bool：True表示删除成功，False表示删除失败
+        :param chunk_size: 每批删除的最大条数，默认读取配置 cleanup_chunk_size
+        :param throttle: 每批删除之后休眠的秒数，给线上请求让出数据库资源，默认读取配置 cleanup_throttle
+        :return: 删除的条数；删除失败返回None（失败之前已提交的批次不会回滚）
         """
 
         if not crt_timestamp:
             crt_timestamp = int(time.time())
 
+        chunk_size = chunk_size or config.cleanup_chunk_size or 1000
+        throttle = config.cleanup_throttle if throttle is None else throttle
+
+        if hasattr(data_model, 'expire_time'):
+            condition = and_(data_model.expire_time != 0, data_model.expire_time < crt_timestamp)
+        else:
+            condition = data_model.receive_time < crt_timestamp
+
+        session = self.database.session
+        pk_columns = list(data_model.__table__.primary_key.columns)
+        deleted_count = 0
+
         try:
             config.is_debug and pro_logger.info(f"开始删除{model_name}中的过期数据")
 
-            if hasattr(data_model, 'expire_time'):
-                expired_keywords = self.database.session.query(data_model).filter(
-                    data_model.expire_time != 0,
-                    data_model.expire_time < crt_timestamp
-                ).all()
-            else:
-                expired_keywords = self.database.session.query(data_model).filter(
-                    data_model.receive_time < crt_timestamp
+            while True:
+                expired_ids = session.execute(
+                    select(*pk_columns).where(condition).order_by(*pk_columns).limit(chunk_size)
                 ).all()
 
-            for keyword in expired_keywords:
-                self.database.session.delete(keyword)
+                if not expired_ids:
+                    break
 
-            self.database.session.commit()
-            config.is_debug and pro_logger.info(f"{model_name}中的过期数据删除成功，共删除{len(expired_keywords)}条数据")
-            return True
+                # 单列主键使用 id IN (...)；复合主键使用 (a, b) IN ((...), (...))
+                if len(pk_columns) == 1:
+                    pk_condition = pk_columns[0].in_([row[0] for row in expired_ids])
+                else:
+                    pk_condition = tuple_(*pk_columns).in_([tuple(row) for row in expired_ids])
+
+                result = session.execute(
+                    delete(data_model).where(pk_condition),
+                    execution_options={'synchronize_session': False}
+                )
+                session.commit()
+                deleted_count += result.rowcount
+
+                if len(expired_ids) < chunk_size:
+                    break
+
+                if throttle:
+                    time.sleep(throttle)
+
+            config.is_debug and pro_logger.info(f"{model_name}中的过期数据删除成功，共删除{deleted_count}条数据")
+            return deleted_count
         except:
-            config.is_debug and pro_logger.error(f"{model_name}中的过期数据删除失败", exc_info=True)
-            self.database.session.rollback()
-            return False
+            config.is_debug and pro_logger.error(
+                f"{model_name}中的过期数据删除失败，已删除{deleted_count}条数据", exc_info=True
+            )
+            session.rollback()
+            return None
 
-    def delete_expired_data(self) -> bool:
+    def delete_expired_data(self, chunk_size: int = None, throttle: float = None) -> Dict[str, Optional[int]]:
         """
-        删除KeyWord、AuthenticatedCode、WechatMessage表中的过期数据
-        :return: str：数据库清理完成
+        删除KeyWord、AuthenticatedCode、WechatMessage、UserState表中的过期数据
+        :param chunk_size: 每批删除的最大条数
+        :param throttle: 每批删除之后休眠的秒数
+        :return: dict：每个数据表删除的条数，删除失败的数据表值为None
         """
 
         current_timestamp = int(time.time())
         special_timestamp = current_timestamp - 60 * 60 * 24 * 10
 
-        if all([
-            self.__delete_expired_data(
-                data_model=KeyWord,
-                model_name='数据表【关键词】',
-                crt_timestamp=current_timestamp
-            ),
-
-            self.__delete_expired_data(
-                data_model=AuthenticatedCode,
-                model_name='数据表【授权码】',
-                crt_timestamp=current_timestamp
-            ),
-
-            self.__delete_expired_data(
-                data_model=WechatMessage,
-                model_name='数据表【微信消息】',
-                crt_timestamp=special_timestamp
+        tasks = [
+            (KeyWord, '数据表【关键词】', current_timestamp),
+            (AuthenticatedCode, '数据表【授权码】', current_timestamp),
+            (WechatMessage, '数据表【微信消息】', special_timestamp),
+            (UserState, '数据表【用户会话状态】', current_timestamp),
+        ]
+
+        report = {}
+        for data_model, model_name, crt_timestamp in tasks:
+            report[data_model.__tablename__] = self.__delete_expired_data(
+                data_model=data_model,
+                model_name=model_name,
+                crt_timestamp=crt_timestamp,
+                chunk_size=chunk_size,
+                throttle=throttle
             )
-        ]):
-            return True
-        else:
-            return False
+
+        return report
 
     @staticmethod
-    def export_table_to_sql(table_class, session, file_path):
+    def sql_literal(value) -> str:
         """
-        将数据库中的数据导出到SQL文件
-        :param table_class: 数据库表对应的类
-        :param session: 数据库连接对象
-        :param file_path: 导出SQL文件的路径
-        :return: None
+        将数据库取出的值转为SQL字面量
+        :param value: 字段值
+        :return: str
         """
 
-        # 创建表的SQL语句
-        # 使用inspect来获取创建表的SQL语句
-        # inspector = inspect(session.bind)
-        create_table_stmt = CreateTable(table_class.__table__).compile(dialect=session.bind.dialect)
-        create_table_sql = str(create_table_stmt)
-
-        # 查询表中的数据
-        records = session.query(table_class).all()
-
-        # 构建插入数据的SQL语句
-        insert_sql = []
-        for record in records:
-            columns = ', '.join([column.name for column in table_class.__table__.columns])
-            values = ', '.join(["'" + str(getattr(record, column.name)).replace("'", "''") + "'" if isinstance(
-                getattr(record, column.name), str)
-                                else str(getattr(record, column.name))
-                                for column in table_class.__table__.columns])
-            insert_statement = f"INSERT INTO {table_class.__tablename__} ({columns}) VALUES ({values});"
-            insert_sql.append(insert_statement)
-
-            # 将DDL和DML写入文件
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(create_table_sql + ';\n')
-            for stmt in insert_sql:
-                f.write(stmt + ';\n')
+        if value is None:
+            return 'NULL'
 
-    @staticmethod
-    def pack_files_to_zip(file_paths: List[str], zip_file_path: str) -> bool:
+        if isinstance(value, bool):
+            return '1' if value else '0'
+
+        if isinstance(value, (int, float)):
+            return str(value)
+
+        if isinstance(value, (datetime.date, datetime.time)):
+            value = value.isoformat()
+        elif isinstance(value, bytes):
+            value = value.decode('utf-8', errors='replace')
+
+        return "'" + str(value).replace("'", "''") + "'"
+
+    def export_table_to_zip(
+            self,
+            table: Table,
+            zip_file: zipfile.ZipFile,
+            batch_size: int = None,
+            condition=None
+    ) -> int:
+        """
+        将一个数据表以流的方式导出为zip中的一个SQL文件：
+        使用服务端游标分批读取数据，每批生成一条多行INSERT语句，直接写入zip条目；
+        不生成中间文件，也不会把整个表加载到内存
+        :param table: 数据表
+        :param zip_file: 已打开（写模式）的zip文件对象
+        :param batch_size: 每批读取、写入的行数，默认读取配置 backup_batch_size
+        :param condition: 过滤条件，增量备份时只导出水位线之后的数据；默认导出全表
+        :return: 导出的行数
         """
-        将多个文件打包成一个zip文件。
 
-        :param file_paths: 包含文件路径的列表
-        :param zip_file_path: 输出zip文件的路径
+        batch_size = batch_size or config.backup_batch_size or 500
+        dialect = self.database.engine.dialect
+
+        create_table_sql = str(CreateTable(table).compile(dialect=dialect)).strip()
+        columns = ', '.join(column.name for column in table.columns)
+        insert_header = f"INSERT INTO {table.name} ({columns}) VALUES\n"
+
+        statement = select(table).order_by(*table.primary_key.columns)
+        if condition is not None:
+            statement = statement.where(condition)
+
+        row_count = 0
+        with zip_file.open(f"{table.name}.sql", 'w', force_zip64=True) as raw_file, \
+                io.TextIOWrapper(raw_file, encoding='utf-8', newline='\n') as f, \
+                self.database.engine.connect() as connection:
+
+            f.write(create_table_sql + ';\n\n')
+
+            result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(statement)
+
+            for rows in result.partitions():
+                values = ',\n'.join(
+                    '(' + ', '.join(self.sql_literal(value) for value in row) + ')' for row in rows
+                )
+                f.write(insert_header + values + ';\n')
+                row_count += len(rows)
+
+        return row_count
+
+    def get_last_backup_record(self, backup_type: str = None) -> Optional[BackupRecord]:
+        """
+        获取最近一次成功的备份记录
+        :param backup_type: 备份类型，full|delta；默认不区分类型
+        :return: BackupRecord；没有备份记录则返回None
         """
 
+        statement = select(BackupRecord).order_by(BackupRecord.id.desc()).limit(1)
+        if backup_type:
+            statement = statement.where(BackupRecord.backup_type == backup_type)
+
         try:
-            # 确保zip文件路径的目录存在
-            os.makedirs(os.path.dirname(zip_file_path), exist_ok=True)
-
-            # 创建ZipFile对象，并设置模式为写入
-            with zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in file_paths:
-                    # 确保文件存在
-                    if not os.path.isfile(file_path):
-                        config.is_debug and pro_logger.error(f"文件 {file_path} 不存在，跳过。")
-                        continue
+            return self.database.session.execute(statement).scalars().first()
+        except SQLAlchemyError:
+            config.is_debug and pro_logger.error(f"查询备份记录失败", exc_info=True)
+            self.database.session.rollback()
+            return None
 
-                    # 将文件添加到zip文件中
-                    # arcname参数是zip文件中文件的名称，如果不设置，则默认为文件的完整路径
-                    zipf.write(file_path, os.path.basename(file_path))
-                    config.is_debug and pro_logger.info(f"文件 {file_path} 添加到zip文件中。")
-            config.is_debug and pro_logger.info(f"文件打包完成，保存路径为：【{zip_file_path}】")
-            return True
-        except:
-            config.is_debug and pro_logger.error(f"打包文件失败", exc_info=True)
-            return False
+    def get_backup_type(self, mode: str = 'auto') -> str:
+        """
+        确定本次备份的类型：没有全量备份，或距离上一次全量备份超过 backup_full_interval_days 天，则做全量备份
+        :param mode: auto|full|delta；full、delta表示强制指定类型（没有全量备份时，delta也会改为full）
+        :return: full|delta
+        """
+
+        last_full_record = self.get_last_backup_record(backup_type='full')
+        if not last_full_record or mode == 'full':
+            return 'full'
+
+        if mode == 'delta':
+            return 'delta'
+
+        interval = datetime.timedelta(days=config.backup_full_interval_days or 7)
+        if datetime.datetime.now() - last_full_record.created_at >= interval:
+            return 'full'
+        return 'delta'
+
+    def get_table_watermark(self, table: Table) -> Dict:
+        """
+        获取只追加数据表当前的水位线：最大主键与对应的最大时间
+        wechat_message表在写入之后还会更新回复内容，只取已经“稳定”的数据（接收时间在 settle_seconds 之前）
+        :param table: 数据表
+        :return: dict：{"id": 最大主键, "time": 最大时间}
+        """
+
+        time_column_name, settle_seconds = self.incremental_tables[table.name]
+        id_column, time_column = table.c.id, table.c[time_column_name]
+
+        statement = select(func.max(id_column), func.max(time_column))
+        if settle_seconds:
+            statement = statement.where(time_column <= int(time.time()) - settle_seconds)
+
+        with self.database.engine.connect() as connection:
+            max_id, max_time = connection.execute(statement).one()
 
-    def database_backup(self, remote_file_name: str) -> str:
+        if isinstance(max_time, (datetime.date, datetime.time)):
+            max_time = max_time.isoformat()
+
+        return {"id": max_id or 0, "time": max_time}
+
+    def database_backup(self, remote_file_name: str, backup_type: str = 'full') -> str:
         """
-        备份数据库
-        :return: list, 备份文件路径列表
+        备份数据库：所有数据表流式写入同一个zip文件，zip中附带 manifest.json 备份清单
+
+        全量备份：导出所有数据表的全部数据；
+        增量备份：只追加的数据表（incremental_tables）只导出上一次备份水位线之后新增的数据，其他数据表仍全量导出；
+        增量备份不记录删除操作，被清理的过期数据会在下一次全量备份中消失。
+
+        备份成功后，清单保存在 self.backup_manifest 中；上传成功后需调用 save_backup_record 记录水位线
+        :param remote_file_name: zip文件名称
+        :param backup_type: 备份类型，full|delta
+        :return: zip文件路径；备份失败返回空字符串
         """
 
         save_path = file_save_dir_path if config.is_yun_function else os.path.join(project_dir, 'database_backup')
         if not os.path.exists(save_path):
             os.makedirs(save_path)
 
-        file_path_list = []
+        last_record = self.get_last_backup_record()
+        if backup_type == 'delta' and not last_record:
+            backup_type = 'full'
+
+        last_watermarks = json.loads(last_record.watermarks or '{}') if last_record else {}
+
+        manifest = {
+            "backup_name": remote_file_name,
+            "backup_type": backup_type,
+            "base_name": remote_file_name if backup_type == 'full' else last_record.base_name,
+            "previous_name": last_record.backup_name if (backup_type == 'delta' and last_record) else None,
+            "created_at": datetime.datetime.now().isoformat(timespec='seconds'),
+            "schema_version": SCHEMA_VERSION,
+            "tables": {},
+        }
+
+        zip_file_path = os.path.join(save_path, remote_file_name)
+        success_count = 0
+
+        try:
+            with zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                for table in BaseModel.metadata.sorted_tables:
+                    try:
+                        table_info = {"mode": "full"}
+                        condition = None
+
+                        if table.name in self.incremental_tables:
+                            watermark = self.get_table_watermark(table)
+                            last_id = last_watermarks.get(table.name, {}).get('id', 0) if backup_type == 'delta' else 0
+
+                            condition = table.c.id <= watermark['id']
+                            if backup_type == 'delta':
+                                condition = and_(table.c.id > last_id, condition)
+                                table_info['mode'] = 'delta'
+
+                            table_info.update(from_id=last_id, watermark=watermark)
+
+                        table_info['rows'] = self.export_table_to_zip(table, zip_file, condition=condition)
+                        manifest['tables'][table.name] = table_info
+
+                        success_count += 1
+                        config.is_debug and pro_logger.info(
+                            f"备份表{table.name}成功（{table_info['mode']}），共{table_info['rows']}条数据"
+                        )
+                    except:
+                        config.is_debug and pro_logger.error(f"备份表{table.name}失败", exc_info=True)
+
+                zip_file.writestr('manifest.json', json.dumps(manifest, ensure_ascii=False, indent=2))
+        except:
+            config.is_debug and pro_logger.error(f"生成备份文件失败", exc_info=True)
+            return ''
+
+        if not success_count:
+            return ''
+
+        # 增量备份依赖连续的水位线：有数据表备份失败时，不能把这次备份作为下一次增量的起点
+        self.backup_manifest = manifest if success_count == len(BaseModel.metadata.sorted_tables) else None
+
+        config.is_debug and pro_logger.info(f"数据库备份完成（{backup_type}），保存路径为：【{zip_file_path}】")
+        return zip_file_path
+
+    def save_backup_record(self) -> bool:
+        """
+        备份文件上传成功之后，记录本次备份的水位线
+        :return: bool：是否记录成功
+        """
+
+        manifest = getattr(self, 'backup_manifest', None)
+        if not manifest:
+            return False
+
+        watermarks = {
+            table_name: table_info['watermark']
+            for table_name, table_info in manifest['tables'].items() if 'watermark' in table_info
+        }
+
+        try:
+            self.database.session.add(BackupRecord(
+                backup_name=manifest['backup_name'],
+                backup_type=manifest['backup_type'],
+                base_name=manifest['base_name'],
+                watermarks=json.dumps(watermarks, ensure_ascii=False),
+            ))
+            self.database.session.commit()
+            return True
+        except SQLAlchemyError:
+            config.is_debug and pro_logger.error(f"保存备份记录失败", exc_info=True)
+            self.database.session.rollback()
+            return False
+
+    @classmethod
+    def iter_backup_rows(cls, f) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """
+        逐条解析备份文件（export_table_to_zip 生成的格式）中的INSERT语句，每次只在内存中保留一条语句
+        :param f: 文本模式打开的备份SQL文件
+        :return: 迭代器，每次返回 (字段名列表, 行数据列表)
+        """
+
+        statement_lines, in_quote = [], False
 
-        for table_class in BaseModel.__subclasses__():
-            if not table_class.__tablename__:  # 确保表名已定义
-                config.is_debug and pro_logger.error(f"表{table_class.__name__}没有定义表名，无法备份")
+        for line in f:
+            if not statement_lines and not line.startswith('INSERT INTO '):
                 continue
 
-            try:
-                file_path = os.path.join(save_path, f"{table_class.__tablename__}.sql")
-                self.export_table_to_sql(table_class, self.database.session, file_path)
+            statement_lines.append(line)
+
+            # 单引号转义为两个单引号，所以只需要统计奇偶即可判断是否处于字符串内部
+            if line.count("'") % 2:
+                in_quote = not in_quote
+
+            if in_quote or not line.rstrip().endswith(';'):
+                continue
+
+            header, body = statement_lines[0], ''.join(statement_lines[1:])
+            statement_lines = []
+
+            columns = [name.strip() for name in header[header.index('(') + 1:header.rindex(')')].split(',')]
 
-                file_path_list.append(file_path)
-                config.is_debug and pro_logger.info(f"备份表{table_class.__tablename__}成功")
-            except:
-                config.is_debug and pro_logger.error(f"备份表{table_class.__tablename__}失败", exc_info=True)
+            rows, row = [], None
+            for match in cls.sql_token_pattern.finditer(body):
+                string_value, null_value, number_value, symbol = match.groups()
 
-        if not file_path_list:
+                if symbol == '(':
+                    row = []
+                elif symbol == ')':
+                    rows.append(tuple(row))
+                    row = None
+                elif symbol:
+                    continue
+                elif string_value is not None:
+                    row.append(string_value.replace("''", "'"))
+                elif null_value:
+                    row.append(None)
+                else:
+                    row.append(float(number_value) if '.' in number_value or 'e' in number_value.lower()
+                               else int(number_value))
+
+            yield columns, rows
+
+    @staticmethod
+    def get_column_converter(column):
+        """
+        获取字段值的转换函数：备份文件中日期、时间均以ISO格式字符串保存，写入数据库前需转换为对应的python类型
+        :param column: 数据表字段
+        :return: 转换函数
+        """
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = None
+
+        parser = {
+            datetime.datetime: datetime.datetime.fromisoformat,
+            datetime.date: datetime.date.fromisoformat,
+            datetime.time: datetime.time.fromisoformat,
+        }.get(python_type)
+
+        if not parser:
+            return lambda value: value
+
+        return lambda value: parser(value) if isinstance(value, str) else value
+
+    @staticmethod
+    def csv_literal(value) -> str:
+        """
+        将字段值转为 COPY ... WITH (FORMAT csv) 的字段：NULL为空，字符串始终加引号，以区分空字符串和NULL
+        :param value: 字段值
+        :return: str
+        """
+
+        if value is None:
             return ''
 
-        zip_file_path = os.path.join(save_path, remote_file_name)
-        result = self.pack_files_to_zip(file_path_list, zip_file_path)
+        if isinstance(value, str):
+            return '"' + value.replace('"', '""') + '"'
+
+        return str(value)
+
+    def restore_table(self, zip_file_path: str, table: Table, mode: str = 'full') -> int:
+        """
+        将备份文件中的一个数据表批量导入数据库，整个表在一个事务中完成：
+        postgresql使用 COPY 导入，其他数据库使用 executemany 批量插入；导入期间禁用触发器和约束检查
+        :param zip_file_path: 备份文件路径
+        :param table: 数据表
+        :param mode: full：清空数据表之后导入；delta：在已有数据之后追加
+        :return: 导入的行数
+        """
+
+        batch_size = config.restore_batch_size or 5000
+        db_type = self.database.engine.url.get_backend_name()
+        preparer = self.database.engine.dialect.identifier_preparer
+        table_name = preparer.format_table(table)
+
+        row_count = 0
+        with zipfile.ZipFile(zip_file_path) as zip_file, \
+                zip_file.open(f"{table.name}.sql") as raw_file, \
+                io.TextIOWrapper(raw_file, encoding='utf-8', newline='\n') as f, \
+                self.database.engine.connect() as connection:
+
+            try:
+                with connection.begin():
+                    if db_type == 'postgresql':
+                        connection.execute(text(f"ALTER TABLE {table_name} DISABLE TRIGGER USER"))
+                    elif db_type == 'mysql':
+                        connection.execute(text("SET foreign_key_checks = 0"))
+                        connection.execute(text("SET unique_checks = 0"))
+                    elif db_type == 'sqlite':
+                        connection.execute(text("PRAGMA synchronous = OFF"))
+
+                    if mode == 'full':
+                        if db_type == 'postgresql':
+                            connection.execute(text(f"TRUNCATE TABLE {table_name}"))
+                        else:
+                            connection.execute(table.delete())
+
+                    cursor = connection.connection.cursor() if db_type == 'postgresql' else None
+                    use_copy = hasattr(cursor, 'copy_expert')
+
+                    buffer, buffer_columns = [], None
+
+                    def flush():
+                        if not buffer:
+                            return
+
+                        columns = [column for column in buffer_columns if column in table.c]
+                        indexes = [buffer_columns.index(column) for column in columns]
+
+                        if use_copy:
+                            data = io.StringIO('\n'.join(
+                                ','.join(self.csv_literal(row[i]) for i in indexes) for row in buffer
+                            ) + '\n')
+                            quoted_columns = ', '.join(preparer.quote(column) for column in columns)
+                            cursor.copy_expert(
+                                f"COPY {table_name} ({quoted_columns}) FROM STDIN WITH (FORMAT csv)", data
+                            )
+                        else:
+                            converters = [self.get_column_converter(table.c[column]) for column in columns]
+                            connection.execute(table.insert(), [
+                                {column: converter(row[i]) for column, converter, i in zip(columns, converters, indexes)}
+                                for row in buffer
+                            ])
+
+                        buffer.clear()
+
+                    for columns, rows in self.iter_backup_rows(f):
+                        if buffer_columns is not None and columns != buffer_columns:
+                            flush()
+
+                        buffer_columns = columns
+                        buffer.extend(rows)
+                        row_count += len(rows)
+
+                        if len(buffer) >= batch_size:
+                            flush()
+
+                    flush()
+
+                    if db_type == 'postgresql':
+                        connection.execute(text(f"ALTER TABLE {table_name} ENABLE TRIGGER USER"))
+            finally:
+                # 这些是连接级别的设置，连接归还连接池之前必须恢复，否则后续使用该连接的操作同样不做检查
+                self.reset_restore_settings(connection, db_type)
+
+        return row_count
+
+    @staticmethod
+    def reset_restore_settings(connection, db_type: str) -> None:
+        """
+        导入数据的事务结束之后，恢复导入时关闭的连接级别设置（sqlite不能在事务中修改 synchronous）
+        :param connection: 数据库连接
+        :param db_type: 数据库类型
+        :return: None
+        """
+
+        try:
+            if db_type == 'mysql':
+                connection.execute(text("SET foreign_key_checks = 1"))
+                connection.execute(text("SET unique_checks = 1"))
+            elif db_type == 'sqlite':
+                connection.execute(text("PRAGMA synchronous = FULL"))
+            connection.commit()
+        except Exception:
+            # 连接已不可用时作废该连接，不再放回连接池
+            connection.invalidate()
+            pro_logger.error('恢复数据库连接设置失败，已作废该连接', exc_info=True)
+
+    @staticmethod
+    def read_backup_manifest(zip_file_path: str) -> Dict:
+        """
+        读取备份文件中的清单；旧版本的备份文件没有清单，视为全量备份
+        :param zip_file_path: 备份文件路径
+        :return: dict
+        """
+
+        with zipfile.ZipFile(zip_file_path) as zip_file:
+            names = zip_file.namelist()
+
+            if 'manifest.json' in names:
+                manifest = json.loads(zip_file.read('manifest.json').decode('utf-8'))
+            else:
+                manifest = {
+                    "backup_name": os.path.basename(zip_file_path),
+                    "backup_type": "full",
+                    "tables": {name[:-4]: {"mode": "full"} for name in names if name.endswith('.sql')},
+                }
+
+        manifest['path'] = zip_file_path
+        return manifest
+
+    def sort_backup_chain(self, zip_file_paths: List[str]) -> List[Dict]:
+        """
+        将备份文件排序为恢复顺序：一个全量备份，之后按先后顺序排列的增量备份，并检查增量备份是否连续
+        :param zip_file_paths: 备份文件路径列表
+        :return: 排序后的备份清单列表
+        """
+
+        manifests = [self.read_backup_manifest(path) for path in zip_file_paths]
+
+        full_manifests = [manifest for manifest in manifests if manifest['backup_type'] == 'full']
+        if len(full_manifests) != 1:
+            raise ValueError(f'恢复数据库需要且只能指定一个全量备份文件，当前为{len(full_manifests)}个')
+
+        chain = full_manifests
+        deltas = {manifest.get('previous_name'): manifest for manifest in manifests if manifest['backup_type'] == 'delta'}
+
+        while chain[-1]['backup_name'] in deltas:
+            chain.append(deltas.pop(chain[-1]['backup_name']))
+
+        if deltas:
+            names = '、'.join(manifest['backup_name'] for manifest in deltas.values())
+            raise ValueError(f'增量备份不连续，无法衔接到全量备份【{chain[0]["backup_name"]}】：{names}')
+
+        return chain
+
+    def database_restore(self, zip_file_paths: List[str]) -> Dict[str, int]:
+        """
+        从备份文件恢复数据库：先导入全量备份，再按顺序导入增量备份。
+
+        导入前删除二级索引，全部导入之后再重建；同一个备份文件中的数据表之间没有外键，使用线程池并行导入
+        （sqlite只支持单个写连接，串行导入）；postgresql导入之后重置自增序列。
+        :param zip_file_paths: 备份文件路径列表（一个全量备份 + 任意个增量备份）
+        :return: dict：每个数据表导入的总行数
+        """
+
+        chain = self.sort_backup_chain(zip_file_paths)
+
+        engine = self.database.engine
+        db_type = engine.url.get_backend_name()
+        tables = {table.name: table for table in BaseModel.metadata.sorted_tables}
+
+        self.database.create_db()
+
+        # 先删除二级索引，逐行维护索引比导入之后一次性重建慢得多
+        with engine.begin() as connection:
+            for table in tables.values():
+                for index in table.indexes:
+                    index.drop(bind=connection, checkfirst=True)
+
+        report = {}
+        max_workers = 1 if db_type == 'sqlite' else (config.restore_workers or 4)
+
+        try:
+            for manifest in chain:
+                config.is_debug and pro_logger.info(f"开始导入备份文件【{manifest['backup_name']}】")
+
+                tasks = []
+                for table_name, table_info in manifest['tables'].items():
+                    if table_name not in tables:
+                        pro_logger.warning(f"数据表【{table_name}】不存在于当前模型中，跳过导入")
+                        continue
+                    tasks.append((tables[table_name], table_info.get('mode', 'full')))
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        table.name: executor.submit(self.restore_table, manifest['path'], table, mode)
+                        for table, mode in tasks
+                    }
+
+                    for table_name, future in futures.items():
+                        row_count = future.result()
+
+                        # 全量导入会先清空数据表，增量导入则在已有数据之后追加
+                        if manifest['tables'][table_name].get('mode') == 'delta':
+                            row_count += report.get(table_name, 0)
+                        report[table_name] = row_count
+                        config.is_debug and pro_logger.info(f"数据表【{table_name}】导入完成，当前共{row_count}条数据")
+        finally:
+            with engine.begin() as connection:
+                for table in tables.values():
+                    for index in table.indexes:
+                        index.create(bind=connection, checkfirst=True)
+
+        if db_type == 'postgresql':
+            with engine.begin() as connection:
+                for table in tables.values():
+                    if 'id' not in table.c:
+                        continue
+                    connection.execute(text(
+                        f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                        f"COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {table.name}"
+                    ))
+
+        # 恢复之后，将结构版本、触发器更新到当前代码的版本
+        self.database.bootstrap()
+
+        config.is_debug and pro_logger.info(f"数据库恢复完成：{report}")
+        return report
 
-        return zip_file_path if result else ''
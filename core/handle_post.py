@@ -10,48 +10,65 @@ description: 处理微信端发送的 POST 请求
 --------------------------------------------
 """
 
-import os
+import re
 import uuid
-import time
 import json
+import time
 import random
-import xmltodict
 from typing import Optional, Tuple, Dict, List
 
-from openai import OpenAI, AuthenticationError, PermissionDeniedError
-from sqlalchemy import and_, or_, desc
-from sqlalchemy.exc import PendingRollbackError
+from sqlalchemy import or_, desc
+from sqlalchemy.exc import PendingRollbackError, IntegrityError
 
-from .utils.weather import WeatherHandler
-from .config import config, pro_logger, project_dir
+from .config import config, pro_logger
 from .types import WechatRequestData, WechatReplyData, WechatReactMessage
 from .models import WechatUser, DatabaseHandler, WechatMessage, KeyWord
-from .command import FIRST_FUNCTION_DICT, ALL_FUNCTION_DICT, check_keywords
+from .keyword_cache import system_keyword_index, local_keyword_store, normalize_keyword
+from .state_store import BaseStateStore, get_state_store
+from .single_flight import message_flights
+from .deadline import Deadline, get_deadline
+from .command import COMMAND_REGISTRY, check_keywords
+from .command.base import CommandRegistry
+from .command.base import WeChatKeyword
+from .utils.wechat_xml import make_text_reply, make_image_reply, make_voice_reply
+
+# 翻页请求：关键词-页码，如：帮助-2
+page_request_pattern = re.compile(r'^(.+)-(\d+)$')
+
+# 微信服务器等待响应的时间，单位：秒；超时后会重新发送请求
+wechat_timeout = 5
+
+# 异步AI客户端：api_key -> AsyncOpenAI，只在ASGI模式下使用
+async_ai_clients: Dict[str, "AsyncOpenAI"] = {}
+
+# 剩余时间少于这个值时，不再发起AI请求，单位：秒
+ai_min_time = 1
 
 
 class BasePostHandler(object):
     """处理接收到的POST请求"""
 
-    def __init__(self, xml_dict: dict) -> None:
+    def __init__(self, xml_dict: dict, deadline: Optional[Deadline] = None) -> None:
 
         self._wechat_user: Optional[WechatUser] = None
         self._database: Optional[DatabaseHandler] = None
 
-        self.function_dict: dict = ALL_FUNCTION_DICT
-        self.first_function_dict: dict = FIRST_FUNCTION_DICT
+        self.command_registry: CommandRegistry = COMMAND_REGISTRY
 
-        self.current_command_key: str = '所处指令调用'  # 固定，用作数据库中存储指令的key
+        self.command_state_key: str = 'command'  # 固定，用作会话状态中存储当前指令的key
 
         self.current_command: str = ''  # 当前指令名称
 
         self.message_object: Optional[WechatMessage] = None  # 本次交互的消息对象
+        self.flight_key: Optional[Tuple[str, str]] = None  # 本次请求在进程内登记的消息，处理结束后需要释放
 
+        self.defer_ai: bool = False  # 是否推迟获取AI回复：异步模式下由调用方await获取，不占用线程
+        self.ai_request: Optional[Tuple[str, List[Dict[str, str]]]] = None  # 推迟获取AI回复时，记录(提问文本, 历史会话)
+
+        self.deadline: Deadline = deadline or Deadline()  # 本次消息的截止时间，AI、OCR等耗时调用据此放弃重试
         self.request_data: WechatRequestData = WechatRequestData(xml_dict)  # 本次请求的用户消息
         self.reply_obj: WechatReplyData = WechatReplyData()  # 本次请求处理后的回复消息
 
-        self.keywords_dict: Dict = {}  # 本地的关键词回复
-        self.initialize_keywords()  # 加载本地关键词回复
-
     @property
     def database(self) -> DatabaseHandler:
 
@@ -59,14 +76,7 @@ class BasePostHandler(object):
             config.need_check_database, bool) else True
 
         if not self._database or not isinstance(self._database, DatabaseHandler):
-            self._database = DatabaseHandler(
-                db_user=config.db_config.db_user,
-                db_password=config.db_config.db_password,
-                db_host=config.db_config.db_host,
-                db_port=config.db_config.db_port,
-                db_name=config.db_config.db_name,
-                need_check_database=need_check_database
-            )
+            self._database = DatabaseHandler.from_config(need_check_database=need_check_database)
 
         return self._database
 
@@ -97,6 +107,32 @@ class BasePostHandler(object):
         self._wechat_user = new_user
         return self._wechat_user
 
+    @property
+    def state_store(self) -> BaseStateStore:
+        """用户会话状态存储（当前指令等），进程内共享"""
+
+        return get_state_store()
+
+    @property
+    def function_dict(self) -> dict:
+        """按模块组织的参数指令 {处理对象: {指令: FunctionInfo}}；需要导入全部指令模块，只在生成指令菜单等场景使用"""
+
+        self.command_registry.load_all()
+        return self.command_registry.function_dict
+
+    @property
+    def first_function_dict(self) -> dict:
+        """按模块组织的直接指令 {处理对象: {指令: FunctionInfo}}；需要导入全部指令模块"""
+
+        self.command_registry.load_all()
+        return self.command_registry.first_function_dict
+
+    @property
+    def keywords_dict(self) -> Dict:
+        """本地的关键词回复：进程内共享，关键词文件修改后自动重新加载"""
+
+        return local_keyword_store.keywords
+
     @property
     def user_from(self):
         return f'公众号：{config.wechat_config.app_name}'
@@ -149,18 +185,14 @@ class BasePostHandler(object):
         return msg_list
 
     @staticmethod
-    def get_ai_answer(question: str, history_message: List[Dict[str, str]] = None) -> Optional[str]:
+    def make_ai_messages(question: str, history_message: List[Dict[str, str]] = None) -> List[Dict[str, str]]:
         """
-        调用AI接口，获取AI的回复
+        生成AI接口的会话列表：系统提示词 + 历史会话 + 最新的提问
         :param question: 最新的提问文本
         :param history_message: 历史会话信息
         :return:
         """
 
-        if not config.ai_config.is_valid():
-            config.is_debug and pro_logger.error(f'AI鉴权信息不全，无法获取AI回复！')
-            return
-
         if not history_message:
             history_message = []
 
@@ -177,19 +209,49 @@ class BasePostHandler(object):
         config.is_debug and pro_logger.info(f'本次AI交互上下文是：')
         config.is_debug and pro_logger.info(f'{history_message}')
 
+        return history_message
+
+    @staticmethod
+    def get_ai_answer(question: str, history_message: List[Dict[str, str]] = None,
+                      deadline: Optional[Deadline] = None) -> Optional[str]:
+        """
+        调用AI接口，获取AI的回复
+        :param question: 最新的提问文本
+        :param history_message: 历史会话信息
+        :param deadline: 截止时间，默认使用当前消息的截止时间；剩余时间不够时不再重试
+        :return:
+        """
+
+        if not config.ai_config.is_valid():
+            config.is_debug and pro_logger.error(f'AI鉴权信息不全，无法获取AI回复！')
+            return
+
+        history_message = BasePostHandler.make_ai_messages(question, history_message)
+
+        # 惰性引入openai，缩短云函数冷启动时间
+        from openai import OpenAI, AuthenticationError, PermissionDeniedError
+
+        deadline = deadline or get_deadline()
+
         # 防止访问错误重试两次
         for _ in range(3):
 
+            if not deadline.has_time(ai_min_time):
+                config.is_debug and pro_logger.warning(f'处理消息的剩余时间不足，放弃获取AI回复')
+                return
+
             api_key = random.choice(config.ai_config.key_list)
             model = config.ai_config.model_name
 
             try:
-                client = OpenAI(api_key=api_key, base_url=config.ai_config.base_url)
+                # 重试由这里的循环负责，客户端本身不再重试
+                client = OpenAI(api_key=api_key, base_url=config.ai_config.base_url, max_retries=0)
 
                 response = client.chat.completions.create(
                     model=model,
                     messages=history_message,
-                    response_format={"type": "text"}
+                    response_format={"type": "text"},
+                    **BasePostHandler.make_ai_request_options(deadline)
                 )
 
                 answer: str = response.choices[0].message.content
@@ -210,48 +272,92 @@ class BasePostHandler(object):
 
             config.is_debug and pro_logger.warning(f'AI接口调用失败，正在尝试使用下一个密钥重试...')
 
-    def initialize_keywords(self) -> None:
+    @staticmethod
+    async def get_ai_answer_async(question: str, history_message: List[Dict[str, str]] = None,
+                                  deadline: Optional[Deadline] = None) -> Optional[str]:
         """
-        初始化本地关键词字典
+        get_ai_answer 的异步版本，等待AI回复时不占用线程
+        :param question: 最新的提问文本
+        :param history_message: 历史会话信息
+        :param deadline: 截止时间，默认使用当前消息的截止时间；剩余时间不够时不再重试
         :return:
         """
 
-        try:
-            data_dir_path = os.path.join(project_dir, 'data')
-            keywords_path = os.path.join(data_dir_path, 'keywords.json')
-            if not os.path.exists(keywords_path):
-                return
+        if not config.ai_config.is_valid():
+            config.is_debug and pro_logger.error(f'AI鉴权信息不全，无法获取AI回复！')
+            return
+
+        history_message = BasePostHandler.make_ai_messages(question, history_message)
+
+        from openai import AsyncOpenAI, AuthenticationError, PermissionDeniedError
 
-            with open(keywords_path, 'r', encoding='utf-8') as f:
-                keywords_dict = json.load(f)
+        deadline = deadline or get_deadline()
+
+        # 防止访问错误重试两次
+        for _ in range(3):
 
-            if not isinstance(keywords_dict, dict):
-                config.is_debug and pro_logger.error(f'关键词文件【keywords.json】格式错误，必须是字典格式，请检查！')
+            if not deadline.has_time(ai_min_time):
+                config.is_debug and pro_logger.warning(f'处理消息的剩余时间不足，放弃获取AI回复')
                 return
 
-            for k, v in keywords_dict.items():
-                if not isinstance(k, str) or not isinstance(v, dict):
-                    config.is_debug and pro_logger.error(f'关键词文件格式错误，键必须是字符串，值必须是字典，请检查！')
-                    return
+            api_key = random.choice(config.ai_config.key_list)
+            model = config.ai_config.model_name
 
-            for k, v in keywords_dict.items():
+            try:
+                # 创建客户端需要加载SSL证书，耗时几十毫秒且会阻塞事件循环，每个密钥只创建一次
+                client = async_ai_clients.get(api_key)
+                if not client:
+                    client = async_ai_clients[api_key] = AsyncOpenAI(
+                        api_key=api_key, base_url=config.ai_config.base_url, max_retries=0
+                    )
+
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=history_message,
+                    response_format={"type": "text"},
+                    **BasePostHandler.make_ai_request_options(deadline)
+                )
 
-                if 'content' not in v:
-                    config.is_debug and pro_logger.error(f'关键词【{k}】格式错误，值中必须包含content字段，请检查！')
-                    continue
+                answer: str = response.choices[0].message.content
 
-                if 'media_id' not in v:
-                    config.is_debug and pro_logger.error(f'关键词【{k}】格式错误，值中必须包含media_id字段，请检查！')
-                    continue
+                if not answer:
+                    config.is_debug and pro_logger.error(f'AI回复为空')
+                    config.is_debug and pro_logger.info(f'响应信息：{response}')
 
-                if 'msg_type' not in v:
-                    config.is_debug and pro_logger.error(f'关键词【{k}】格式错误，值中必须包含msg_type字段，请检查！')
-                    continue
+                return answer
+            except AuthenticationError:
+                config.is_debug and pro_logger.error(f'AI密钥【{api_key}】已失效！', exc_info=True)
+                config.ai_config.key_list.remove(api_key)
+                async_ai_clients.pop(api_key, None)
+            except PermissionDeniedError:
+                config.is_debug and pro_logger.error(f'AI密钥【{api_key}】无权限调用【{model}】模型！', exc_info=True)
+                config.ai_config.key_list.remove(api_key)
+                async_ai_clients.pop(api_key, None)
+            except:
+                config.is_debug and pro_logger.error(f'获取AI回复时出现未知错误', exc_info=True)
 
-                self.keywords_dict[k.lower()] = v
-            config.is_debug and pro_logger.info(f'关键词文件【keywords.json】解析成功，共{len(keywords_dict)}个关键词！')
-        except:
-            config.is_debug and pro_logger.error(f'关键词文件【keywords.json】解析出现未知错误！', exc_info=True)
+            config.is_debug and pro_logger.warning(f'AI接口调用失败，正在尝试使用下一个密钥重试...')
+
+    @staticmethod
+    def make_ai_request_options(deadline: Deadline) -> Dict[str, float]:
+        """AI请求的额外参数：有截止时间时，用剩余时间作为请求的超时"""
+
+        remaining = deadline.remaining()
+        return {} if remaining is None else {'timeout': remaining}
+
+    def set_ai_answer(self, ai_answer: Optional[str]) -> None:
+        """
+        设置AI回复；没有获取到AI回复时，原样返回用户的消息
+        :param ai_answer: AI回复
+        :return: None
+        """
+
+        if ai_answer:
+            config.is_debug and pro_logger.info(f"AI回复：{ai_answer}")
+            self.reply_obj.content = ai_answer
+            return
+
+        self.reply_obj.content = self.request_data.content
 
     def check_keyword(self) -> bool:
         """
@@ -265,51 +371,115 @@ class BasePostHandler(object):
             config.is_debug and pro_logger.info(f'文本中包含分隔符，不是关键词自动回复')
             return False
 
-        # 1. 先检查本地
-        if self.request_data.content.lower() in self.keywords_dict:
-            info_dict: Dict = self.keywords_dict[self.request_data.content.lower()]
-            self.reply_obj.content = info_dict['content']
-            self.reply_obj.media_id = info_dict['media_id']
-            self.reply_obj.msg_type = info_dict['msg_type']
+        text = normalize_keyword(self.request_data.content)
+
+        # 1. 先检查本地关键词（完全匹配）
+        rule = local_keyword_store.matcher.match_exact(text)
+        if rule:
+            self.set_keyword_reply(rule.payload)
+            return True
+
+        # 2. 再检查用户是否处于指令模式：按主键读取会话状态
+        command = self.state_store.get(self.request_data.to_user_id, self.command_state_key)
+        if command:
+            self.current_command = command
+
+            self.check_commands(self.current_command)
+            return True
+
+        # 3. 再检查是否是翻页请求，如：【帮助-2】
+        if self.check_page_request():
             return True
 
-        # 2. 再检查云端数据库
+        # 4. 再检查用户专属的关键词（天气、配音结果等，都有有效期），需要查询数据库
         current_timestamp = int(time.time())
         keyword = self.database.session.query(KeyWord).filter(
+            KeyWord.keyword == self.request_data.content,
+            KeyWord.official_user_id == self.request_data.to_user_id,
+            or_(
+                KeyWord.expire_time == 0,
+                current_timestamp <= KeyWord.expire_time
+            )
+        ).order_by(desc(KeyWord.expire_time)).first()
 
-            and_(
+        if keyword:
+            self.reply_obj.content = keyword.reply_content
+            self.reply_obj.msg_type = keyword.reply_type
+            self.reply_obj.media_id = keyword.reply_media_id
+            return True
 
-                or_(
-                    KeyWord.keyword == self.request_data.content,
-                    KeyWord.keyword == self.current_command_key,
-                ),
+        # 5. 再检查系统关键词（完全匹配）：使用进程内的索引，不查询数据库
+        rule = system_keyword_index.match(self.database, self.request_data.content)
+        if rule:
+            self.set_keyword_reply(rule.payload)
+            return True
 
-                or_(
-                    KeyWord.official_user_id == '系统',
-                    KeyWord.official_user_id == self.request_data.to_user_id
-                ),
+        # 6. 最后是前缀、包含匹配；文本是已注册的指令时不做模糊匹配，避免指令被关键词截获
+        if self.is_registered_command(self.request_data.content):
+            return False
 
-                or_(
-                    KeyWord.expire_time == 0,
-                    current_timestamp <= KeyWord.expire_time
-                )
-            )
-        ).order_by(desc(KeyWord.expire_time)).first()
+        rules = [
+            local_keyword_store.matcher.match_fuzzy(text),
+            system_keyword_index.match(self.database, self.request_data.content, fuzzy=True),
+        ]
+        rules = [rule for rule in rules if rule]
+        if not rules:
+            return False
+
+        # 不同来源的添加顺序不可比较，只比较优先级、匹配方式与关键词长度；完全相同时本地关键词优先
+        rule = max(rules, key=lambda item: item.sort_key[:3])
+        config.is_debug and pro_logger.info(f'模糊匹配到关键词：[{rule.keyword}]，匹配方式：{rule.match_type}')
+
+        self.set_keyword_reply(rule.payload)
+        return True
 
-        if not keyword:
+    def set_keyword_reply(self, info_dict: Dict) -> None:
+        """
+        根据关键词的回复信息设置回复内容
+        :param info_dict: 回复信息，包含 reply_type、reply_content、reply_media_id
+        :return: None
+        """
+
+        self.reply_obj.content = info_dict['reply_content']
+        self.reply_obj.msg_type = info_dict['reply_type']
+        self.reply_obj.media_id = info_dict['reply_media_id']
+
+    def is_registered_command(self, content: str) -> bool:
+        """
+        检查文本是否是已注册的直接指令（无需参数的指令）
+        :param content: 用户输入的文本
+        :return: bool
+        """
+
+        return self.command_registry.is_first_command(content)
+
+    def check_page_request(self) -> bool:
+        """
+        检查是否是翻页请求（关键词-页码）：根据用户的分页游标，按需生成该页的内容
+        :return: bool
+        """
+
+        match = page_request_pattern.match(self.request_data.content or '')
+        if not match:
             return False
 
-        # 如果是指令调用，则记录当前指令
-        if keyword.keyword == self.current_command_key:
-            self.current_command = keyword.reply_content
+        content, page_num = match.group(1), int(match.group(2))
 
-            self.check_commands(self.current_command)
-            return True
+        cursor = self.state_store.get(self.request_data.to_user_id, WeChatKeyword.get_page_state_key(content))
+        if not cursor:
+            return False
 
-        # 如果是关键词回复，则获取回复内容
-        self.reply_obj.content = keyword.reply_content
-        self.reply_obj.msg_type = keyword.reply_type
-        self.reply_obj.media_id = keyword.reply_media_id
+        cursor = json.loads(cursor)
+        handler_obj = self.command_registry.get_handler(cursor['model_name'])
+        if not handler_obj:
+            return False
+
+        page_content = handler_obj.render_page(content, page_num, cursor, self)
+        if not page_content:
+            return False
+
+        self.reply_obj.msg_type = 'text'
+        self.reply_obj.content = page_content
         return True
 
     def close_database(self) -> None:
@@ -318,8 +488,12 @@ class BasePostHandler(object):
         :return:
         """
 
+        # 没有用到数据库（或连接失败）时不需要关闭；通过 self.database 获取会重新建立连接
+        if self._database is None:
+            return
+
         try:
-            self.database.session.close()  # 关闭会话
+            self._database.session.close()  # 关闭会话
         except:
             pro_logger.error(f"Error closing session!", exc_info=True)
 
@@ -366,19 +540,44 @@ class BasePostHandler(object):
         这个方法用于检查是否该条消息已经接收过：
             第一次接收：进行处理
             第二次或第三次接收：等待并获取第一次的处理结果
+        同一进程内的重试请求，直接等待第一次请求的处理结果，不查询数据库；
+        第一次请求在其他进程中时，才通过数据库中的消息记录判断、轮询
         :return: result and continue_flag
         """
 
-        msg = self.database.session.query(WechatMessage).filter(
-            WechatMessage.official_user_id == self.request_data.to_user_id,
-            WechatMessage.receive_msg_id == self.request_data.msg_id,
-            # WechatMessage.user_from == self.user_from
-        ).first()
+        if self.request_data.msg_id:
+            flight_key = (self.request_data.to_user_id, self.request_data.msg_id)
+            call, is_first = message_flights.begin(flight_key)
+
+            if is_first:
+                self.flight_key = flight_key
+            else:
+                config.is_debug and pro_logger.info('该条消息正在本进程中处理，等待前一次处理完成')
+
+                reply = call.wait(timeout=self.deadline.cap(wechat_timeout))
+                if reply:
+                    self.reply_obj = reply
+                    return True, True
+
+                # 超过5秒，微信将重新发送请求；前一次处理失败时，再通过数据库判断
+                if not call.done:
+                    return False, False
+
+        msg = self.get_message_record()
 
         if not msg:
             config.is_debug and pro_logger.info('该条消息从未处理过')
-            self.save_message(has_handled=False)
-            return False, True
+
+            try:
+                # 消息记录的唯一索引保证只有一个进程能写入成功，写入成功的进程负责处理
+                self.save_message(has_handled=False)
+                return False, True
+            except IntegrityError:
+                config.is_debug and pro_logger.info('该条消息已被其他进程登记，等待其处理结果')
+
+            msg = self.get_message_record()
+            if not msg:
+                return False, False
 
         self.message_object = msg
 
@@ -396,18 +595,16 @@ class BasePostHandler(object):
         if not isinstance(retry_time, int):
             retry_time = 1
 
-        while waiting_time < 5:
-            config.is_debug and pro_logger.info('该条消息正在处理中，等待前一次处理完成')
+        while waiting_time < wechat_timeout and self.deadline.has_time(retry_time):
+            config.is_debug and pro_logger.info('该条消息正在其他进程中处理，等待前一次处理完成')
             time.sleep(retry_time)
             waiting_time += retry_time
 
-            msg = self.database.session.query(WechatMessage).filter(
-                WechatMessage.official_user_id == self.request_data.to_user_id,
-                WechatMessage.receive_msg_id == self.request_data.msg_id,
-                # WechatMessage.user_from == self.user_from
-            ).first()
+            # 结束上一次查询的事务，否则读到的仍是会话中缓存的旧记录
+            self.database.session.rollback()
+            msg = self.get_message_record()
 
-            if msg.reply_type:
+            if msg and msg.reply_type:
                 self.reply_obj.msg_type = msg.reply_type
                 self.reply_obj.content = msg.reply_content
                 self.reply_obj.media_id = msg.reply_media_id
@@ -416,7 +613,35 @@ class BasePostHandler(object):
         # 超过5秒，微信将重新发送请求
         return False, False
 
+    def get_message_record(self) -> Optional[WechatMessage]:
+        """查询本条消息在数据库中的记录（同一用户的同一 MsgId）"""
+
+        return self.database.session.query(WechatMessage).filter(
+            WechatMessage.official_user_id == self.request_data.to_user_id,
+            WechatMessage.receive_msg_id == self.request_data.msg_id,
+            # WechatMessage.user_from == self.user_from
+        ).first()
+
+    def release_flight(self, result: Optional[WechatReplyData]) -> None:
+        """
+        释放本次请求在进程内登记的消息，唤醒等待的重试请求；只有第一次请求需要释放，重复调用无影响
+        :param result: 处理结果；处理失败时传入None，等待的重试请求将通过数据库判断
+        :return: None
+        """
+
+        if not self.flight_key:
+            return
+
+        message_flights.finish(self.flight_key, result)
+        self.flight_key = None
+
     def save_message(self, has_handled: bool = True):
+        """
+        写入消息记录
+        :param has_handled: False：登记收到的消息；True：写入本次的回复
+        :return:
+        :raises IntegrityError: 登记消息时，该消息已被其他进程登记（唯一索引冲突）
+        """
 
         try:
             if not has_handled:
@@ -433,6 +658,10 @@ class BasePostHandler(object):
                 self.database.session.add(msg)
                 logger_msg = '本次请求已记录'
             else:
+                if self.message_object not in self.database.session:
+                    # 推迟获取AI回复时，回复在另一个线程中写入，消息对象需要合并到当前线程的会话
+                    self.message_object = self.database.session.merge(self.message_object)
+
                 self.message_object.reply_content = self.reply_obj.content
                 self.message_object.reply_media_id = self.reply_obj.media_id
                 self.message_object.reply_type = self.reply_obj.msg_type
@@ -445,7 +674,19 @@ class BasePostHandler(object):
             self.database.session.rollback()
             # 重试操作，或者重新启动事务
             self.database.session.commit()
+        except IntegrityError:
+            # 微信重试请求落在其他进程，并发登记同一条消息，触发唯一索引冲突；回滚后会话才能继续使用
+            self.database.session.rollback()
+
+            if has_handled:
+                pro_logger.error(f'将交互信息写入数据库时出现错误', exc_info=True)
+                return
+
+            self.message_object = None
+            raise
         except Exception:
+            # 回滚后会话才能继续使用
+            self.database.session.rollback()
             pro_logger.info(self.reply_obj)
             pro_logger.error(f'将交互信息写入数据库时出现错误', exc_info=True)
 
@@ -507,19 +748,8 @@ class BasePostHandler(object):
         :return:
         """
 
-        time_stamp = int(time.time())
-
-        resp_dict = {
-            'xml': {
-                'ToUserName': self.request_data.to_user_id,
-                'FromUserName': self.request_data.my_user_id,
-                'CreateTime': time_stamp,
-                'MsgType': 'text',
-                'Content': content[0:600],  # 注意：微信的文本回复有长度限制，最多600字，此处做兜底处理。
-            }
-        }
-        resp_xml = xmltodict.unparse(resp_dict)
-        return resp_xml
+        # 注意：微信的文本回复有长度限制，最多600字，此处做兜底处理。
+        return make_text_reply(self.request_data.to_user_id, self.request_data.my_user_id, content[0:600])
 
     def make_reply_picture(self, media_id: str) -> str:
         """
@@ -529,45 +759,17 @@ class BasePostHandler(object):
         :return:
         """
 
-        time_stamp = int(time.time())
-
-        resp_dict = {
-            'xml': {
-                'ToUserName': self.request_data.to_user_id,
-                'FromUserName': self.request_data.my_user_id,
-                'CreateTime': time_stamp,
-                'MsgType': 'image',
-                'Image': {
-                    'MediaId': media_id
-                },
-            }
-        }
-        resp_xml = xmltodict.unparse(resp_dict)
-        return resp_xml
+        return make_image_reply(self.request_data.to_user_id, self.request_data.my_user_id, media_id)
 
     def make_reply_voice(self, media_id: str) -> str:
         """
-        接收图片的media_id（该值在图片上传到腾讯服务器后获取）
-        生成符合微信服务器要求的图片回复信息
+        接收语音的media_id（该值在语音上传到腾讯服务器后获取）
+        生成符合微信服务器要求的语音回复信息
         :param media_id:
         :return:
         """
 
-        time_stamp = int(time.time())
-
-        resp_dict = {
-            'xml': {
-                'ToUserName': self.request_data.to_user_id,
-                'FromUserName': self.request_data.my_user_id,
-                'CreateTime': time_stamp,
-                'MsgType': 'voice',
-                'Voice': {
-                    'MediaId': media_id
-                },
-            }
-        }
-        resp_xml = xmltodict.unparse(resp_dict)
-        return resp_xml
+        return make_voice_reply(self.request_data.to_user_id, self.request_data.my_user_id, media_id)
 
     def check_commands(self, command: str = None, *args, **kwargs) -> bool:
 
@@ -575,12 +777,12 @@ class BasePostHandler(object):
             command = self.request_data.content
 
         result: WechatReplyData = check_keywords(
-            first_function_dict=self.first_function_dict,
-            function_dict=self.function_dict,
+            registry=self.command_registry,
             keyword=command,
             user=self.wechat_user,
             user_from=self.user_from,
             post_handler=self,
+            deadline=self.deadline,
             *args, **kwargs
         )
 
@@ -604,14 +806,12 @@ class PostHandler(BasePostHandler):
 
         msg_limit = config.history_message_limit
         message = self.parse_history_message(self.get_history_message(msg_limit))
-        ai_answer = self.get_ai_answer(self.request_data.content, message)
 
-        if ai_answer:
-            config.is_debug and pro_logger.info(f"AI回复：{ai_answer}")
-            self.reply_obj.content = ai_answer
+        if self.defer_ai:
+            self.ai_request = (self.request_data.content, message)
             return
 
-        self.reply_obj.content = self.request_data.content
+        self.set_ai_answer(self.get_ai_answer(self.request_data.content, message, self.deadline))
 
     def image(self) -> None:
         """
@@ -634,6 +834,8 @@ class PostHandler(BasePostHandler):
             self.reply_obj.content = "请先配置彩云天气token，否则无法获取天气信息"
             return
 
+        from .utils.weather import WeatherHandler
+
         weather_tip = WeatherHandler.caiyun_weather(
             longitude=self.request_data.location_y,
             latitude=self.request_data.location_x,
@@ -10,17 +10,21 @@ description: 处理微信消息
 
 get方法处理get请求，主要是微信验证接口有效性;
 post方法处理post请求;
+开启异步回复时，post请求在后台线程中处理，超时的结果通过客服消息推送;
 --------------------------------------------
 """
 
 import hashlib
-import xmltodict
+from xml.etree.ElementTree import ParseError
 from flask import Request
-from typing import Optional
+from typing import Optional, Tuple
 
-from .types import ConfigData
+from .types import ConfigData, WechatReplyData
 from .config import pro_logger
+from .deadline import Deadline, deadline_scope
 from .handle_post import PostHandler
+from .async_reply import reply_within_budget, ProcessResult
+from .utils.wechat_xml import parse_message
 
 
 class RequestHandler(object):
@@ -56,54 +60,159 @@ class RequestHandler(object):
     def get(self, request: Request) -> str:
         """处理get请求"""
 
-        echo_str = request.args.get('echostr')
+        return self.handle_get(request.args)
+
+    def handle_get(self, query_data: dict) -> str:
+        """根据get请求的参数，验证接口有效性"""
+
+        echo_str = query_data.get('echostr')
         if not echo_str:
             self.config.is_debug and pro_logger.info("get请求中没有echostr参数，并非微信服务器请求")
             return "This get request is not for authenticated."
 
-        if self.authenticate(request.args):
+        if self.authenticate(query_data):
             return echo_str
 
         return 'authenticate failed!'
 
-    def post(self, request: Request) -> str:
-        """处理post请求"""
+    def parse_post(self, query_data: dict, body: bytes) -> Tuple[Optional[dict], str]:
+        """
+        验证post请求，并解析请求体
+        :param query_data: 请求的query参数
+        :param body: 请求体
+        :return: (解析后的请求数据, 错误信息)；验证或解析失败时，请求数据为None
+        """
 
         # 先验证是否为微信服务器发送的信息
-        if not self.authenticate(request.args):
-            return "not wechat post request"
+        if not self.authenticate(query_data):
+            return None, "not wechat post request"
 
         # 获取请求携带的参数
-        xml_dict = xmltodict.parse(request.data.decode('utf-8')).get('xml', {})
-
-        msg_type = xml_dict.get('MsgType')  # 获取本次消息的MsgType
+        try:
+            xml_dict = parse_message(body)
+        except (ParseError, ValueError):
+            pro_logger.error("请求体不是有效的微信消息XML", exc_info=True)
+            return None, "invalid xml"
 
         # 测试模式时打印每次请求的信息
         if self.config.is_debug:
             print(xml_dict)
-            pro_logger.info(f"用户发送的消息类型是【{msg_type}】")
+            pro_logger.info(f"用户发送的消息类型是【{xml_dict.get('MsgType')}】")
 
-        handler = PostHandler(xml_dict)
+        return xml_dict, ''
 
-        try:
-
-            if handler.check_keyword():
-                return handler.real_reply_message
-
-            result, continue_flag = handler.check_message()
+    def post(self, request: Request) -> str:
+        """处理post请求"""
 
-            if result:
-                return handler.real_reply_message
+        xml_dict, error_message = self.parse_post(request.args, request.data)
+        if xml_dict is None:
+            return error_message
 
-            if continue_flag:
-                handle_method = getattr(handler, msg_type, 'unknown')
-                handle_method()
+        msg_type = xml_dict.get('MsgType')  # 获取本次消息的MsgType
+        deadline = self.make_deadline()
+
+        if self.config.async_reply_enabled:
+            # 异步回复模式：后台处理消息，超时先回复success，处理完成后通过客服消息推送
+            return reply_within_budget(
+                official_user_id=xml_dict.get('FromUserName'),
+                process=lambda: self.handle_message(xml_dict, msg_type, deadline),
+                budget=self.config.async_reply_budget
+            )
+
+        return self.handle_message(xml_dict, msg_type, deadline)[0]
+
+    def make_deadline(self) -> Deadline:
+        """
+        创建本次消息的截止时间：异步回复模式下结果通过客服消息推送，可以等待更长时间
+        :return: Deadline
+        """
+
+        if self.config.async_reply_enabled:
+            return Deadline(self.config.async_reply_deadline or None)
+
+        return Deadline(self.config.message_deadline or None)
+
+    @staticmethod
+    def handle_message(xml_dict: dict, msg_type: str, deadline: Optional[Deadline] = None) -> ProcessResult:
+        """
+        处理一条消息；异步回复模式下在后台线程中执行，数据库会话也在该线程内打开、关闭
+        :param xml_dict: 解析后的请求数据
+        :param msg_type: 消息类型
+        :param deadline: 本次消息的截止时间
+        :return: (被动回复的XML, 回复内容)
+        """
+
+        return RequestHandler.process(PostHandler(xml_dict, deadline=deadline), msg_type)
+
+    @staticmethod
+    def process(handler: PostHandler, msg_type: str) -> ProcessResult:
+        """
+        使用指定的消息处理对象处理消息
+        handler.defer_ai 为真且需要AI回复时，处理到获取AI回复之前为止：返回 (None, None)，handler.ai_request 记录了AI请求，
+        调用方获取AI回复之后，再调用 finish_ai_reply 完成处理
+        :param handler: 消息处理对象
+        :param msg_type: 消息类型
+        :return: (被动回复的XML, 回复内容)
+        """
+
+        # 处理期间把截止时间记录到上下文变量中，供HTTP客户端等读取
+        with deadline_scope(handler.deadline):
+            try:
+
+                if handler.check_keyword():
+                    return handler.real_reply_message, handler.reply_obj
+
+                result, continue_flag = handler.check_message()
+
+                if result:
+                    handler.release_flight(handler.reply_obj)
+                    return handler.real_reply_message, handler.reply_obj
+
+                if continue_flag:
+                    handle_method = getattr(handler, msg_type, 'unknown')
+                    handle_method()
+
+                    if handler.ai_request:
+                        return None, None
+
+                    # 将本次交互信息写入数据库
+                    handler.save_message()
+
+                    # 唤醒同一进程内等待这条消息的重试请求
+                    handler.release_flight(handler.reply_obj)
+                    return handler.real_reply_message, handler.reply_obj
+            except Exception:
+                pro_logger.error("出现未知错误", exc_info=True)
+                handler.ai_request = None
+                error_reply = WechatReplyData(msg_type='text', content="服务器内部错误，请联系管理员！")
+                return handler.make_reply_text(error_reply.content), error_reply
+            finally:
+                # 等待AI回复的消息，仍在进程内登记，由 finish_ai_reply 释放
+                if not handler.ai_request:
+                    handler.release_flight(None)
+                handler.close_database()
+
+        return None, None
+
+    @staticmethod
+    def finish_ai_reply(handler: PostHandler, ai_answer: Optional[str]) -> ProcessResult:
+        """
+        推迟获取AI回复时，设置AI回复并完成处理：写入数据库、唤醒等待的重试请求
+        :param handler: 消息处理对象，已经过 process 处理
+        :param ai_answer: AI回复
+        :return: (被动回复的XML, 回复内容)
+        """
 
-                # 将本次交互信息写入数据库
-                handler.save_message()
-                return handler.real_reply_message
+        try:
+            handler.ai_request = None
+            handler.set_ai_answer(ai_answer)
+            handler.save_message()
+            handler.release_flight(handler.reply_obj)
+            return handler.real_reply_message, handler.reply_obj
         except Exception:
             pro_logger.error("出现未知错误", exc_info=True)
-            return handler.make_reply_text("服务器内部错误，请联系管理员！")
+            error_reply = WechatReplyData(msg_type='text', content="服务器内部错误，请联系管理员！")
+            return handler.make_reply_text(error_reply.content), error_reply
         finally:
+            handler.release_flight(None)
             handler.close_database()
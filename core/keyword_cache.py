@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/20
+contact: 【公众号】思维兵工厂
+description: 关键词的进程内缓存：系统关键词索引、本地关键词文件
+
+official_user_id 为“系统”的关键词对所有用户有效、很少修改，每条消息都查询一次数据库代价太高；
+这里在进程内维护一个关键词匹配器（见 matcher.py），支持完全匹配、前缀匹配、包含匹配：
+    - 每隔 keyword_cache_refresh_interval 秒，检查一次数据库中的缓存版本号（CacheVersion），
+      版本号变化时全量重新加载，否则按主键水位线增量加载新增的系统关键词；
+    - 通过指令或接口新增、修改、删除关键词之后，调用 invalidate(database)：本进程的索引立即失效，
+      同时数据库中的版本号加1，其他进程（多进程部署）最迟在一个刷新间隔之后重新加载；
+    - 每隔 keyword_cache_ttl 秒，全量重新加载一次，兜底同步直接在数据库中做的修改（不经过 invalidate）。
+
+已过期的关键词在加载时跳过；加载之后才过期的关键词在匹配时过滤，不会挡住同一条消息命中的其他有效关键词。
+
+本地关键词文件 data/keywords.json 每个进程只解析一次，文件的修改时间或大小变化之后自动重新加载；
+关键词的值中可以额外指定 match_type（exact|prefix|contains，默认exact）与 priority（默认0）。
+--------------------------------------------
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+
+from .config import config, pro_logger, project_dir
+from .models import DatabaseHandler, KeyWord, CacheVersion
+from .matcher import KeywordMatcher, KeywordRule
+
+
+def normalize_keyword(keyword: str) -> str:
+    """关键词统一去除首尾空白并转为小写，与本地关键词文件的匹配方式一致"""
+
+    return (keyword or '').strip().lower()
+
+
+class SystemKeywordIndex(object):
+    """系统关键词索引，进程内共享一个实例"""
+
+    cache_name = 'system_keyword'  # 在缓存版本表中的名称
+
+    columns = (
+        KeyWord.id,
+        KeyWord.keyword,
+        KeyWord.reply_type,
+        KeyWord.reply_content,
+        KeyWord.reply_media_id,
+        KeyWord.expire_time,
+        KeyWord.match_type,
+        KeyWord.priority,
+    )
+
+    def __init__(self):
+        self._matcher: KeywordMatcher = KeywordMatcher()  # 规范化之后的关键词 -> 回复信息
+        self._max_id: int = 0  # 已加载的最大主键，增量刷新的水位线
+        self._version: int = 0  # 已加载的缓存版本号，与数据库中的不一致时全量重新加载
+        self._loaded_at: float = 0  # 最近一次全量加载的时间，为0表示需要重新加载
+        self._refreshed_at: float = 0  # 最近一次增量刷新的时间
+        self._lock = threading.Lock()
+
+    def invalidate(self, database: Optional[DatabaseHandler] = None) -> None:
+        """
+        使索引失效，下一次查询时全量重新加载；应在修改关键词的事务提交之后调用
+        :param database: 数据库连接对象；传入时同时将数据库中的版本号加1，使其他进程的索引失效
+        :return: None
+        """
+
+        self._loaded_at = 0
+        config.is_debug and pro_logger.info('系统关键词索引已失效，下次查询时重新加载')
+
+        if database is None:
+            return
+
+        try:
+            with database.engine.begin() as connection:
+                CacheVersion.bump(connection, self.cache_name)
+        except Exception:
+            # 其他进程最迟在 keyword_cache_ttl 秒后全量重新加载
+            pro_logger.error('更新系统关键词的缓存版本号失败', exc_info=True)
+
+    def _load(self, database: DatabaseHandler, full: bool) -> None:
+        """
+        从数据库加载系统关键词；新的匹配器构建完成后整体替换，读取方不需要加锁
+        :param database: 数据库连接对象
+        :param full: True：全量加载；False：只加载主键大于水位线的关键词，数据库中的版本号变化时改为全量加载
+        :return: None
+        """
+
+        with database.engine.connect() as connection:
+            # 先读版本号再读关键词：读取期间发生的修改会让版本号再次变化，下次刷新时重新加载
+            version = CacheVersion.get_version(connection, self.cache_name)
+            if version != self._version:
+                full = True
+
+            statement = select(*self.columns).where(KeyWord.official_user_id == '系统').order_by(KeyWord.id)
+            if not full:
+                statement = statement.where(KeyWord.id > self._max_id)
+
+            rows = connection.execute(statement).all()
+
+        # 增量加载时在副本上添加新规则，没有新规则时不复制
+        if not full and not rows:
+            matcher = self._matcher
+        else:
+            matcher = KeywordMatcher() if full else self._matcher.copy()
+
+        max_id = 0 if full else self._max_id
+        current_timestamp = int(time.time())
+
+        for row in rows:
+            max_id = max(max_id, row.id)
+
+            # 已过期的关键词不加载，等待定期清理
+            if row.expire_time and row.expire_time < current_timestamp:
+                continue
+
+            # 同一个关键词存在多条时，主键大的（后添加的）优先，过期之后由其余有效的规则生效
+            matcher.add(normalize_keyword(row.keyword), row.match_type, row.priority, row._asdict())
+
+        matcher.build()
+        self._matcher, self._max_id, self._version = matcher, max_id, version
+
+        now = time.time()
+        self._refreshed_at = now
+        if full:
+            self._loaded_at = now
+
+        if full or rows:
+            config.is_debug and pro_logger.info(
+                f"系统关键词索引{'全量' if full else '增量'}加载完成，本次加载{len(rows)}条，共{len(matcher)}个关键词"
+            )
+
+    def refresh(self, database: DatabaseHandler) -> None:
+        """
+        按需刷新索引：过期则全量加载，到达增量刷新间隔则增量加载，否则直接返回
+        :param database: 数据库连接对象
+        :return: None
+        """
+
+        now = time.time()
+        ttl = config.keyword_cache_ttl or 300
+        interval = config.keyword_cache_refresh_interval or 10
+
+        need_full = not self._loaded_at or now - self._loaded_at >= ttl
+        if not need_full and now - self._refreshed_at < interval:
+            return
+
+        with self._lock:
+            # 等锁期间，其他线程可能已经完成了刷新
+            now = time.time()
+            need_full = not self._loaded_at or now - self._loaded_at >= ttl
+            if not need_full and now - self._refreshed_at < interval:
+                return
+
+            try:
+                self._load(database, full=need_full)
+            except Exception:
+                # 刷新失败时继续使用旧的索引，等下一个间隔再重试
+                self._refreshed_at = now
+                pro_logger.error('系统关键词索引刷新失败', exc_info=True)
+
+    def match(self, database: DatabaseHandler, keyword: str, fuzzy: bool = False) -> Optional[KeywordRule]:
+        """
+        查询系统关键词
+        :param database: 数据库连接对象，只在需要刷新索引时使用
+        :param keyword: 用户输入的文本
+        :param fuzzy: False：只做完全匹配；True：只做前缀、包含匹配
+        :return: 命中的规则，rule.payload 为回复信息字典（reply_type、reply_content、reply_media_id等）；未命中或已过期返回None
+        """
+
+        self.refresh(database)
+
+        text = normalize_keyword(keyword)
+        matcher = self._matcher
+        current_timestamp = int(time.time())
+
+        def is_valid(rule: KeywordRule) -> bool:
+            expire_time = rule.payload['expire_time']
+            return not expire_time or expire_time >= current_timestamp
+
+        # 在挑选规则时就跳过已过期的，否则过期的高优先级规则会挡住其他有效的规则
+        if fuzzy:
+            return matcher.match_fuzzy(text, is_valid)
+        return matcher.match_exact(text, is_valid)
+
+
+class LocalKeywordStore(object):
+    """本地关键词文件（data/keywords.json）的缓存，进程内共享一个实例"""
+
+    def __init__(self, keywords_path: str):
+        self.keywords_path = keywords_path
+
+        self._keywords: Dict[str, Dict] = {}
+        self._matcher: KeywordMatcher = KeywordMatcher()
+        self._signature: Optional[Tuple[int, int]] = None  # 已加载文件的 (修改时间, 大小)
+        self._lock = threading.Lock()
+
+    def _get_signature(self) -> Optional[Tuple[int, int]]:
+        """获取文件的 (修改时间, 大小)；文件不存在返回None"""
+
+        try:
+            stat = os.stat(self.keywords_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _parse(self) -> Dict[str, Dict]:
+        """
+        解析并校验关键词文件
+        :return: {小写关键词: 回复信息}；文件不存在或格式错误时返回空字典
+        """
+
+        if not os.path.exists(self.keywords_path):
+            return {}
+
+        with open(self.keywords_path, 'r', encoding='utf-8') as f:
+            keywords_dict = json.load(f)
+
+        if not isinstance(keywords_dict, dict):
+            config.is_debug and pro_logger.error(f'关键词文件【keywords.json】格式错误，必须是字典格式，请检查！')
+            return {}
+
+        for k, v in keywords_dict.items():
+            if not isinstance(k, str) or not isinstance(v, dict):
+                config.is_debug and pro_logger.error(f'关键词文件格式错误，键必须是字符串，值必须是字典，请检查！')
+                return {}
+
+        keywords = {}
+        for k, v in keywords_dict.items():
+
+            if 'content' not in v:
+                config.is_debug and pro_logger.error(f'关键词【{k}】格式错误，值中必须包含content字段，请检查！')
+                continue
+
+            if 'media_id' not in v:
+                config.is_debug and pro_logger.error(f'关键词【{k}】格式错误，值中必须包含media_id字段，请检查！')
+                continue
+
+            if 'msg_type' not in v:
+                config.is_debug and pro_logger.error(f'关键词【{k}】格式错误，值中必须包含msg_type字段，请检查！')
+                continue
+
+            keywords[k.lower()] = v
+
+        return keywords
+
+    def reload(self) -> None:
+        """重新加载关键词文件；新字典与匹配器构建完成后整体替换，解析失败时继续使用旧数据"""
+
+        with self._lock:
+            signature = self._get_signature()
+
+            try:
+                keywords = self._parse()
+            except Exception:
+                config.is_debug and pro_logger.error(f'关键词文件【keywords.json】解析出现未知错误！', exc_info=True)
+            else:
+                matcher = KeywordMatcher()
+                for k, v in keywords.items():
+                    matcher.add(normalize_keyword(k), v.get('match_type'), v.get('priority'), {
+                        'reply_type': v['msg_type'],
+                        'reply_content': v['content'],
+                        'reply_media_id': v['media_id'],
+                        'expire_time': 0,
+                    })
+                matcher.build()
+
+                self._keywords, self._matcher = keywords, matcher
+                config.is_debug and pro_logger.info(f'关键词文件【keywords.json】解析成功，共{len(keywords)}个关键词！')
+
+            # 解析失败也记录文件签名，避免每条消息都重复解析同一个错误文件；文件再次修改后会重新加载
+            self._signature = signature
+
+    @property
+    def keywords(self) -> Dict[str, Dict]:
+        """获取本地关键词字典：只在文件的修改时间或大小变化时重新加载"""
+
+        if self._get_signature() != self._signature:
+            self.reload()
+
+        return self._keywords
+
+    @property
+    def matcher(self) -> KeywordMatcher:
+        """获取本地关键词的匹配器：只在文件的修改时间或大小变化时重新构建"""
+
+        if self._get_signature() != self._signature:
+            self.reload()
+
+        return self._matcher
+
+
+system_keyword_index = SystemKeywordIndex()
+local_keyword_store = LocalKeywordStore(os.path.join(project_dir, 'data', 'keywords.json'))
+
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/22
+contact: 【公众号】思维兵工厂
+description: 关键词匹配引擎：完全匹配、前缀匹配、包含匹配，支持优先级
+
+    - 完全匹配（exact）：字典查找；
+    - 前缀匹配（prefix）、包含匹配（contains）：所有规则编译进同一个 Aho-Corasick 自动机（字典树 + 失败指针），
+      扫描一遍消息即可找出全部命中的规则，耗时与消息长度相关，与规则数量无关；
+      前缀规则只在命中位置从消息开头算起时有效。
+
+命中多条规则时的取舍：
+    1. 完全匹配优先于前缀、包含匹配；
+    2. 再比较优先级（priority），数值越大越优先；
+    3. 优先级相同时，前缀匹配优先于包含匹配，关键词更长的优先，后添加的优先。
+
+同一个关键词、同一种匹配方式的规则可以有多条，全部保留；匹配时可传入 accept 过滤规则（如已过期的规则），
+被过滤的规则不参与取舍，由其余命中的规则中最优先的一条生效。
+
+新增规则时只修改字典树，失败指针在 build() 或下一次匹配时统一重新计算；只新增完全匹配规则时不需要重新计算。
+匹配器在多个线程间共享时，应在副本（copy）上添加规则并调用 build()，完成后整体替换。
+--------------------------------------------
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MATCH_EXACT = 'exact'
+MATCH_PREFIX = 'prefix'
+MATCH_CONTAINS = 'contains'
+
+MATCH_TYPES = (MATCH_EXACT, MATCH_PREFIX, MATCH_CONTAINS)
+
+# 优先级相同时，匹配方式的先后顺序
+_match_type_rank = {MATCH_CONTAINS: 0, MATCH_PREFIX: 1, MATCH_EXACT: 2}
+
+
+# 规则过滤函数：返回False的规则在匹配时跳过
+RuleFilter = Callable[['KeywordRule'], bool]
+
+
+def normalize_match_type(match_type: Optional[str]) -> str:
+    """匹配方式统一转为小写；为空或不支持时按完全匹配处理"""
+
+    match_type = (match_type or '').strip().lower()
+    return match_type if match_type in MATCH_TYPES else MATCH_EXACT
+
+
+@dataclass
+class KeywordRule:
+    keyword: str  # 规范化之后的关键词
+    match_type: str = MATCH_EXACT  # 匹配方式：exact|prefix|contains
+    priority: int = 0  # 优先级，数值越大越优先
+    payload: Any = None  # 命中后返回的回复信息
+    order: int = 0  # 添加顺序，优先级相同时后添加的优先
+
+    @property
+    def sort_key(self) -> Tuple[int, int, int, int]:
+        return self.priority, _match_type_rank[self.match_type], len(self.keyword), self.order
+
+
+class KeywordMatcher(object):
+    """关键词匹配器；关键词需要调用方事先规范化（如去除空白、转小写），匹配时传入同样规范化之后的文本"""
+
+    def __init__(self):
+
+        self._exact: Dict[str, List[KeywordRule]] = {}  # 关键词 -> 规则列表，按优先顺序从高到低排列
+
+        # 字典树：节点以下标表示，0为根节点
+        self._goto: List[Dict[str, int]] = [{}]  # 节点的子节点：{字符: 子节点}
+        self._outputs: List[List[KeywordRule]] = [[]]  # 以该节点结尾的规则
+
+        # 自动机：由 build 根据字典树计算
+        self._fail: List[int] = [0]  # 失败指针
+        self._output_link: List[int] = [0]  # 沿失败指针找到的下一个有规则的节点，0表示没有
+
+        self._count: int = 0  # 已添加的规则数量，同时用作规则的添加顺序
+        self._exact_count: int = 0  # 完全匹配规则的数量
+        self._fuzzy_count: int = 0  # 前缀、包含规则的数量
+        self._dirty: bool = False  # 字典树有变化，需要重新计算失败指针
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._exact_count + self._fuzzy_count
+
+    def copy(self) -> 'KeywordMatcher':
+        """
+        复制一个匹配器，用于在副本上增量添加规则，添加完成后整体替换，正在使用旧匹配器的线程不受影响
+        :return: KeywordMatcher
+        """
+
+        matcher = KeywordMatcher()
+
+        matcher._exact = {keyword: list(rules) for keyword, rules in self._exact.items()}
+        matcher._goto = [dict(children) for children in self._goto]
+        matcher._outputs = [list(rules) for rules in self._outputs]
+        matcher._fail = list(self._fail)
+        matcher._output_link = list(self._output_link)
+
+        matcher._count = self._count
+        matcher._exact_count = self._exact_count
+        matcher._fuzzy_count = self._fuzzy_count
+        matcher._dirty = self._dirty
+        return matcher
+
+    def add(self, keyword: str, match_type: str = MATCH_EXACT, priority: int = 0, payload: Any = None) -> None:
+        """
+        添加一条规则；同一个关键词、同一种匹配方式添加多次时全部保留，匹配时以优先级高的为准，优先级相同时以后添加的为准
+        :param keyword: 规范化之后的关键词，为空时忽略
+        :param match_type: 匹配方式：exact|prefix|contains
+        :param priority: 优先级，数值越大越优先
+        :param payload: 命中后返回的回复信息
+        :return: None
+        """
+
+        if not keyword:
+            return
+
+        self._count += 1
+        rule = KeywordRule(
+            keyword=keyword,
+            match_type=normalize_match_type(match_type),
+            priority=int(priority or 0),
+            payload=payload,
+            order=self._count,
+        )
+
+        if rule.match_type == MATCH_EXACT:
+            rules = self._exact.setdefault(keyword, [])
+            rules.append(rule)
+            rules.sort(key=lambda item: item.sort_key, reverse=True)
+            self._exact_count += 1
+            return
+
+        node = 0
+        for char in keyword:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._outputs.append([])
+            node = child
+
+        self._outputs[node].append(rule)
+        self._fuzzy_count += 1
+
+        self._dirty = True
+
+    def build(self) -> None:
+        """按层遍历字典树，计算每个节点的失败指针与输出链接"""
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            node_count = len(self._goto)
+            fail = [0] * node_count
+            output_link = [0] * node_count
+
+            queue = deque(self._goto[0].values())
+            while queue:
+                node = queue.popleft()
+
+                for char, child in self._goto[node].items():
+                    queue.append(child)
+
+                    # 根节点的子节点，失败指针指向根节点
+                    if node == 0:
+                        continue
+
+                    state = fail[node]
+                    while state and char not in self._goto[state]:
+                        state = fail[state]
+                    state = self._goto[state].get(char, 0)
+
+                    fail[child] = state
+                    output_link[child] = state if self._outputs[state] else output_link[state]
+
+            self._fail, self._output_link = fail, output_link
+            self._dirty = False
+
+    def match_exact(self, text: str, accept: Optional[RuleFilter] = None) -> Optional[KeywordRule]:
+        """
+        完全匹配
+        :param text: 规范化之后的文本
+        :param accept: 规则过滤函数，返回False的规则跳过；为None时不过滤
+        :return: 命中的规则；未命中返回None
+        """
+
+        for rule in self._exact.get(text, ()):
+            if accept is None or accept(rule):
+                return rule
+
+        return None
+
+    def match_fuzzy(self, text: str, accept: Optional[RuleFilter] = None) -> Optional[KeywordRule]:
+        """
+        前缀匹配、包含匹配：扫描一遍文本，返回命中的规则中最优先的一条
+        :param text: 规范化之后的文本
+        :param accept: 规则过滤函数，返回False的规则跳过；为None时不过滤
+        :return: 命中的规则；未命中返回None
+        """
+
+        if not self._fuzzy_count or not text:
+            return None
+
+        if self._dirty:
+            self.build()
+
+        goto, fail, outputs, output_link = self._goto, self._fail, self._outputs, self._output_link
+
+        best: Optional[KeywordRule] = None
+        state = 0
+
+        for position, char in enumerate(text, start=1):
+
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            node = state if outputs[state] else output_link[state]
+            while node:
+                for rule in outputs[node]:
+
+                    # 前缀规则只在从文本开头命中时有效
+                    if rule.match_type == MATCH_PREFIX and position != len(rule.keyword):
+                        continue
+
+                    if best is not None and rule.sort_key <= best.sort_key:
+                        continue
+
+                    if accept is None or accept(rule):
+                        best = rule
+
+                node = output_link[node]
+
+        return best
+
+    def match(self, text: str, accept: Optional[RuleFilter] = None) -> Optional[KeywordRule]:
+        """
+        匹配文本：完全匹配优先，其次是前缀、包含匹配
+        :param text: 规范化之后的文本
+        :param accept: 规则过滤函数，返回False的规则跳过；为None时不过滤
+        :return: 命中的规则；未命中返回None
+        """
+
+        return self.match_exact(text, accept) or self.match_fuzzy(text, accept)
@@ -11,17 +11,98 @@ description: 数据库连接
 """
 
 import os
-from typing import Tuple
+import threading
+from typing import Tuple, Dict, List, Optional
 from datetime import date, timedelta, datetime
 
 from .constant import drive_info
+from .error import SchemaOutdatedError, SchemaMigrationError
 from .config import pro_logger, project_dir, config
 
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
-from sqlalchemy import create_engine, Column, Integer, String, text, inspect, Date, Time, TEXT, DateTime, func
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import create_engine, Column, Integer, String, text, inspect, Date, Time, TEXT, DateTime, func, Index, \
+    select, update, insert, delete, case, or_
 
 BaseModel = declarative_base()
 
+# 进程级的数据库引擎与会话注册表：同一个数据库连接串，整个进程只创建一次引擎（连接池）
+_engine_registry: Dict[str, Engine] = {}
+_session_registry: Dict[str, scoped_session] = {}
+_registry_lock = threading.Lock()
+
+# 数据库结构版本号：修改表结构、触发器、索引时需要加1，部署后执行一次 `flask --app app init-db` 即可完成迁移
+SCHEMA_VERSION = 8
+
+# 本进程内已确认结构为最新版本的数据库连接串，请求过程中只检查这个标记
+_schema_checked: set = set()
+
+
+def get_engine(conn_str: str) -> Engine:
+    """
+    获取连接串对应的数据库引擎；进程内首次调用时创建，之后复用同一个连接池
+    :param conn_str: 数据库连接串
+    :return: Engine
+    """
+
+    engine = _engine_registry.get(conn_str)
+    if engine is not None:
+        return engine
+
+    with _registry_lock:
+        engine = _engine_registry.get(conn_str)
+        if engine is not None:
+            return engine
+
+        if conn_str.startswith('sqlite'):
+            engine = create_engine(conn_str, pool_pre_ping=config.db_pool_pre_ping)
+        else:
+            engine = create_engine(
+                conn_str,
+                pool_size=config.db_pool_size,
+                max_overflow=config.db_max_overflow,
+                pool_recycle=config.db_pool_recycle,
+                pool_pre_ping=config.db_pool_pre_ping,
+            )
+
+        _engine_registry[conn_str] = engine
+        _session_registry[conn_str] = scoped_session(sessionmaker(bind=engine))
+
+    return engine
+
+
+def get_session_registry(conn_str: str) -> scoped_session:
+    """获取连接串对应的线程级会话注册表"""
+
+    if conn_str not in _session_registry:
+        get_engine(conn_str)
+    return _session_registry[conn_str]
+
+
+def remove_sessions() -> None:
+    """请求结束时调用：关闭并移除当前线程持有的所有数据库会话，连接归还连接池"""
+
+    for registry in list(_session_registry.values()):
+        try:
+            registry.remove()
+        except Exception:
+            pro_logger.error(f"移除数据库会话时出现错误", exc_info=True)
+
+
+def dispose_engines() -> None:
+    """
+    多进程部署时，在子进程fork之后调用：丢弃从主进程继承的数据库连接（不关闭，主进程可能仍在使用），子进程重新建立连接；
+    当前线程的会话同样直接丢弃，不执行回滚，避免在共享的连接上发送命令
+    """
+
+    for registry in list(_session_registry.values()):
+        registry.registry.clear()
+
+    for engine in list(_engine_registry.values()):
+        engine.dispose(close=False)
+
 
 class WechatUser(BaseModel):
     """
@@ -48,6 +129,8 @@ class WechatUser(BaseModel):
     phone = Column(String(20), unique=True, comment='用户手机', default=None)
 
     credit = Column(Integer, comment='用户积分', default=50)
+    last_sign_in_date = Column(Date, comment='最近一次签到日期', default=None)
+    current_streak = Column(Integer, comment='当前连续签到天数', default=0)
     has_cancel_subscribed = Column(Integer, comment='是否取消过关注，0：取消过，1：未取消过', default=0)
 
     is_master = Column(Integer, comment='是否是管理员，0：不是，1：是', default=0)
@@ -75,6 +158,8 @@ class WechatUser(BaseModel):
             "email": self.email,
             "phone": self.phone,
             "credit": self.credit,
+            "last_sign_in_date": self.last_sign_in_date,
+            "current_streak": self.current_streak,
             "has_cancel_subscribed": self.has_cancel_subscribed,
             "is_master": self.is_master,
             "is_vip": self.is_vip,
@@ -103,6 +188,43 @@ class UserCredit(BaseModel):
     change_date = Column(Date, default=date.today, nullable=False, comment='添加日期：年月日')
     change_time = Column(Time, default=lambda: datetime.now().time(), nullable=False, comment='添加时间：时分秒')
 
+    @classmethod
+    def apply_credit_change(cls, session: scoped_session, user_condition, credit_delta: int):
+        """
+        在数据库中原子地修改用户积分：UPDATE wechat_user SET credit = credit + :n ... RETURNING credit；
+        不在python中读取再写回，多个进程同时修改同一用户的积分也不会丢失更新。本方法不提交事务
+        :param session: 数据库会话
+        :param user_condition: 定位用户的条件，如：WechatUser.official_user_id == 'xxx'
+        :param credit_delta: 积分变化数，减积分时为负数
+        :return: Row(credit, official_user_id, unique_user_id, username)；未找到用户返回None
+        """
+
+        statement = update(WechatUser).where(user_condition).values(credit=WechatUser.credit + credit_delta)
+        columns = (WechatUser.credit, WechatUser.official_user_id, WechatUser.unique_user_id, WechatUser.username)
+        execution_options = {'synchronize_session': False}
+
+        if session.get_bind().dialect.update_returning:
+            return session.execute(statement.returning(*columns), execution_options=execution_options).first()
+
+        # 不支持 UPDATE ... RETURNING 的数据库（如mysql）：更新之后在同一事务中读取，该行已被本事务锁定
+        result = session.execute(statement, execution_options=execution_options)
+        if not result.rowcount:
+            return None
+        return session.execute(select(*columns).where(user_condition)).first()
+
+    @staticmethod
+    def get_user_condition(wechat_user: "WechatUser" = None, official_user_id: str = None, unique_user_id: str = None):
+        """
+        获取定位用户的条件：优先使用用户对象的主键，其次是official_user_id，最后是unique_user_id
+        :return: 查询条件
+        """
+
+        if wechat_user is not None:
+            return WechatUser.id == wechat_user.id
+        if official_user_id:
+            return WechatUser.official_user_id == official_user_id
+        return WechatUser.unique_user_id == unique_user_id
+
     @classmethod
     def update_user_credit(
             cls,
@@ -115,7 +237,7 @@ class UserCredit(BaseModel):
             unique_user_id: str = None,
     ) -> Tuple[bool, int, str]:
         """
-        更新用户积分
+        更新用户积分：积分的修改在数据库中原子完成，并在同一事务中写入积分变化记录
         :param session: 数据库会话
         :param credit_num: 积分变化数
         :param reason: 积分消耗原因
@@ -126,50 +248,109 @@ class UserCredit(BaseModel):
         :return: 是否更新成功、当前总积分、提示信息
         """
 
-        if not wechat_user:
-            if official_user_id:
-                wechat_user = session.query(WechatUser).filter(WechatUser.official_user_id == official_user_id).first()
-            else:
-                wechat_user = session.query(WechatUser).filter(WechatUser.unique_user_id == unique_user_id).first()
-
-        msg = '积分更新失败'
-        if not wechat_user:
-            msg = '积分更新失败，未找到用户'
-            pro_logger.error(f"{msg}；official_user_id:【{official_user_id}】, unique_user_id:【{unique_user_id}】")
-            return False, 0, msg
+        is_add = 1 if is_add else 0
+        credit_delta = credit_num if is_add else -credit_num
 
         try:
-            is_add = 1 if is_add else 0
-            credit_obj = cls(
-                unique_user_id=wechat_user.unique_user_id,
-                official_user_id=wechat_user.official_user_id,
+            row = cls.apply_credit_change(
+                session=session,
+                user_condition=cls.get_user_condition(wechat_user, official_user_id, unique_user_id),
+                credit_delta=credit_delta
+            )
+
+            if not row:
+                msg = '积分更新失败，未找到用户'
+                pro_logger.error(f"{msg}；official_user_id:【{official_user_id}】, unique_user_id:【{unique_user_id}】")
+                return False, 0, msg
+
+            session.add(cls(
+                unique_user_id=row.unique_user_id,
+                official_user_id=row.official_user_id,
                 is_add=is_add,
                 reason=reason,
                 this_credit=credit_num,
-                total_credit=wechat_user.credit + credit_num,
-            )
-
-            session.add(credit_obj)
-            wechat_user.credit += credit_num
+                total_credit=row.credit,
+            ))
             session.commit()
 
-            msg = f"""成功更新用户【{wechat_user.username or official_user_id or unique_user_id}】的积分，
+            # 同步内存中的用户对象，避免再次查询数据库
+            if wechat_user is not None:
+                set_committed_value(wechat_user, 'credit', row.credit)
+
+            msg = f"""成功更新用户【{row.username or row.official_user_id or row.unique_user_id}】的积分，
 原因：【{reason}】
 {'增加' if is_add else '减少'} {credit_num} 积分；
-当前用户总积分：{wechat_user.credit}"""
+当前用户总积分：{row.credit}"""
 
             pro_logger.info(msg)
-            return True, wechat_user.credit, '更新成功'
+            return True, row.credit, '更新成功'
         except:
             msg = f"积分更新失败，数据库操作失败"
             pro_logger.error(f"积分更新失败，数据库操作失败", exc_info=True)
             session.rollback()
-            return False, wechat_user.credit, msg
+            return False, wechat_user.credit if wechat_user is not None else 0, msg
+
+    @classmethod
+    def bulk_update_user_credit(cls, session: scoped_session, changes: List[Dict]) -> Tuple[bool, List[Optional[int]], str]:
+        """
+        在一个事务中批量更新多个用户的积分，积分变化记录一次性批量写入
+        :param session: 数据库会话
+        :param changes: 积分变化列表，每个元素包含：credit_num、reason、is_add，以及official_user_id或unique_user_id
+        :return: 是否更新成功、每个积分变化对应的当前总积分（未找到用户为None）、提示信息
+        """
+
+        totals, credit_rows = [], []
+
+        try:
+            for change in changes:
+                is_add = 1 if change.get('is_add', 1) else 0
+                credit_num = change['credit_num']
+
+                row = cls.apply_credit_change(
+                    session=session,
+                    user_condition=cls.get_user_condition(
+                        official_user_id=change.get('official_user_id'),
+                        unique_user_id=change.get('unique_user_id')
+                    ),
+                    credit_delta=credit_num if is_add else -credit_num
+                )
+
+                if not row:
+                    totals.append(None)
+                    continue
+
+                totals.append(row.credit)
+                credit_rows.append(dict(
+                    unique_user_id=row.unique_user_id,
+                    official_user_id=row.official_user_id,
+                    is_add=is_add,
+                    reason=change.get('reason'),
+                    this_credit=credit_num,
+                    total_credit=row.credit,
+                    change_date=date.today(),
+                    change_time=datetime.now().time(),
+                ))
+
+            if credit_rows:
+                session.execute(insert(cls), credit_rows)
+            session.commit()
+
+            msg = f'成功更新{len(credit_rows)}条积分变化，{len(totals) - len(credit_rows)}条未找到对应用户'
+            pro_logger.info(msg)
+            return True, totals, msg
+        except:
+            pro_logger.error(f"批量更新积分失败，数据库操作失败，数据已回滚", exc_info=True)
+            session.rollback()
+            return False, [None] * len(changes), '批量更新积分失败，数据库操作失败，数据已回滚'
 
 
 class UserSignIn(BaseModel):
     """用户签到表"""
     __tablename__ = 'wechat_sign_in'
+    __table_args__ = (
+        # 查询用户最近一次签到
+        Index('ix_wechat_sign_in_user_date', 'official_user_id', 'sign_in_date'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     official_user_id = Column(String(100), comment='公众号用户ID', default=None)
@@ -180,49 +361,68 @@ class UserSignIn(BaseModel):
     consecutive_days = Column(Integer, default=1, nullable=False)
 
     @classmethod
-    def update_consecutive_days(
+    def sign_in(
             cls,
             session: scoped_session,
-            official_user_id: str,
-            wechat_user: "WechatUser"
-    ) -> tuple["UserSignIn", int]:
-        """
-        更新用户连续签到天数，并返回本次签到的积分实例和积分数量
-        :param session:
-        :param official_user_id:
-        :param wechat_user:
-        :return:
+            wechat_user: "WechatUser",
+            today: date = None
+    ) -> Tuple[Optional["UserSignIn"], int]:
+        """
+        用户签到：连续签到天数、最近签到日期保存在用户表中，一条条件UPDATE同时完成
+        “今天是否已签到”的判断、连续天数与积分的更新，不需要查询签到表；签到表只追加记录。
+        :param session: 数据库会话
+        :param wechat_user: 用户对象
+        :param today: 签到日期（按公众号所在时区计算），默认为服务器当前日期
+        :return: (本次签到记录, 本次签到积分)；今天已经签到过返回 (None, 0)；数据库操作失败返回 (UserSignIn(), 0)
         """
 
-        today = date.today()
-
-        # 获取该用户昨天的签到记录
-        yesterday_sign_in = session.query(UserSignIn).filter(
-            UserSignIn.official_user_id == official_user_id
-        ).order_by(UserSignIn.sign_in_date.desc()).first()
-
-        if yesterday_sign_in and yesterday_sign_in.sign_in_date == today - timedelta(days=1):
-            # 如果昨天有签到记录，则今天的连续签到天数加1
-            consecutive_days = yesterday_sign_in.consecutive_days + 1
-        else:
-            # 否则，连续签到天数重新从1开始计数
-            consecutive_days = 1
+        today = today or date.today()
+        yesterday = today - timedelta(days=1)
 
         # 从配置信息中获取一次签到的最小积分和最大积分
         min_credit = config.min_credit or 2
         max_credit = config.max_credit or 10
-
         credit_count = int(max_credit / min_credit)
 
+        # 本次连续签到天数：昨天签到过则加1，否则重新从1开始计数
+        streak = case(
+            (WechatUser.last_sign_in_date == yesterday, func.coalesce(WechatUser.current_streak, 0) + 1),
+            else_=1
+        )
+
         # 本次签到获得的积分
-        credit_num = consecutive_days * min_credit if consecutive_days < credit_count else max_credit
+        credit_num = case((streak < credit_count, streak * min_credit), else_=max_credit)
+
+        # 积分、连续天数都由更新前的值计算：mysql按SET的顺序依次赋值，所以最近签到日期必须最后更新
+        statement = update(WechatUser).where(
+            WechatUser.id == wechat_user.id,
+            or_(WechatUser.last_sign_in_date.is_(None), WechatUser.last_sign_in_date < today)
+        ).ordered_values(
+            (WechatUser.credit, WechatUser.credit + credit_num),
+            (WechatUser.current_streak, streak),
+            (WechatUser.last_sign_in_date, today),
+        )
+        columns = (WechatUser.credit, WechatUser.current_streak)
+        execution_options = {'synchronize_session': False}
 
-        # 将签到积分添加到用户积分中
-        wechat_user.credit += credit_num
         try:
-            # 创建新的签到记录并设置连续签到天数
-            new_sign_in = UserSignIn(
-                official_user_id=official_user_id,
+            if session.get_bind().dialect.update_returning:
+                row = session.execute(statement.returning(*columns), execution_options=execution_options).first()
+            else:
+                result = session.execute(statement, execution_options=execution_options)
+                row = session.execute(select(*columns).where(WechatUser.id == wechat_user.id)).first() \
+                    if result.rowcount else None
+
+            # 没有更新任何数据：今天已经签到过了
+            if not row:
+                return None, 0
+
+            total_credit, consecutive_days = row
+            this_credit = consecutive_days * min_credit if consecutive_days < credit_count else max_credit
+
+            new_sign_in = cls(
+                official_user_id=wechat_user.official_user_id,
+                unique_user_id=wechat_user.unique_user_id,
                 sign_in_date=today,
                 consecutive_days=consecutive_days
             )
@@ -232,21 +432,48 @@ class UserSignIn(BaseModel):
                 unique_user_id=wechat_user.unique_user_id,
                 is_add=1,
                 reason="签到",
-                this_credit=credit_num,
-                total_credit=wechat_user.credit
+                this_credit=this_credit,
+                total_credit=total_credit
             )
 
             session.add(credit_change)
             session.add(new_sign_in)
             session.commit()
+
+            # 同步内存中的用户对象，避免再次查询数据库
+            set_committed_value(wechat_user, 'credit', total_credit)
+            set_committed_value(wechat_user, 'current_streak', consecutive_days)
+            set_committed_value(wechat_user, 'last_sign_in_date', today)
+
             pro_logger.info(f"""【{wechat_user.username or wechat_user.official_user_id}】成功签到;
-连续签到天数：{consecutive_days}；本次签到积分：{credit_num}；当前用户总积分：{wechat_user.credit}""")
-            return new_sign_in, credit_num
+连续签到天数：{consecutive_days}；本次签到积分：{this_credit}；当前用户总积分：{total_credit}""")
+            return new_sign_in, this_credit
         except:
             session.rollback()
             pro_logger.error(f"签到失败，数据库操作失败", exc_info=True)
             return cls(), 0
 
+    @staticmethod
+    def backfill_user_streak(connection) -> int:
+        """
+        根据签到表，补充用户表中的最近签到日期、连续签到天数；只处理尚未填充的用户，可重复执行
+        :param connection: 数据库连接
+        :return: 更新的用户数
+        """
+
+        def latest(column):
+            return select(column).where(
+                UserSignIn.official_user_id == WechatUser.official_user_id
+            ).order_by(UserSignIn.sign_in_date.desc(), UserSignIn.id.desc()).limit(1).scalar_subquery()
+
+        result = connection.execute(
+            update(WechatUser).where(WechatUser.last_sign_in_date.is_(None)).values(
+                last_sign_in_date=latest(UserSignIn.sign_in_date),
+                current_streak=func.coalesce(latest(UserSignIn.consecutive_days), 0),
+            )
+        )
+        return result.rowcount
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -266,6 +493,12 @@ class WechatMessage(BaseModel):
     """
 
     __tablename__ = 'wechat_message'
+    __table_args__ = (
+        # 微信重试时，根据用户与消息ID判断消息是否处理过
+        Index('uq_wechat_message_user_msg', 'official_user_id', 'receive_msg_id', unique=True),
+        # 获取用户最近的历史消息
+        Index('ix_wechat_message_user_time', 'official_user_id', 'receive_time'),
+    )
 
     id = Column(Integer, primary_key=True)
 
@@ -285,6 +518,28 @@ class WechatMessage(BaseModel):
 
     has_encrypt = Column(Integer, comment='是否已经加密过，0：未加密，1：已加密', default=0)
 
+    @staticmethod
+    def remove_duplicates(connection) -> int:
+        """
+        删除重复的消息记录（同一用户的同一 MsgId），建立唯一索引之前执行；
+        每组保留一条：优先保留已写入回复的记录，其次保留最早的记录
+        :param connection: 数据库连接
+        :return: 删除的记录数
+        """
+
+        ranked = select(
+            WechatMessage.id,
+            func.row_number().over(
+                partition_by=(WechatMessage.official_user_id, WechatMessage.receive_msg_id),
+                order_by=(case((WechatMessage.reply_type.is_(None), 1), else_=0), WechatMessage.id)
+            ).label('row_num')
+        ).where(WechatMessage.receive_msg_id.isnot(None)).subquery()
+
+        result = connection.execute(
+            delete(WechatMessage).where(WechatMessage.id.in_(select(ranked.c.id).where(ranked.c.row_num > 1)))
+        )
+        return result.rowcount
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -308,6 +563,18 @@ class KeyWord(BaseModel):
     """
 
     __tablename__ = 'wechat_keywords'
+    __table_args__ = (
+        # 关键词回复查询
+        Index('ix_wechat_keywords_lookup', 'keyword', 'official_user_id', 'expire_time'),
+
+        # 系统关键词唯一，批量上传时以此去重（upsert）；mysql不支持部分索引，不创建该索引
+        Index(
+            'uq_wechat_keywords_system', 'keyword',
+            unique=True,
+            postgresql_where=text("official_user_id = '系统'"),
+            sqlite_where=text("official_user_id = '系统'"),
+        ).ddl_if(dialect=('postgresql', 'sqlite')),
+    )
 
     id = Column(Integer, primary_key=True)
 
@@ -317,6 +584,9 @@ class KeyWord(BaseModel):
     reply_content = Column(TEXT, comment='回复的文本内容', default=None)
     reply_media_id = Column(String(100), comment='回复的媒体ID', default=None)
 
+    match_type = Column(String(10), comment='匹配方式，exact：完全匹配，prefix：前缀匹配，contains：包含匹配', default='exact')
+    priority = Column(Integer, comment='优先级，数值越大越优先；同时命中多条前缀、包含匹配的关键词时使用', default=0)
+
     official_user_id = Column(String(100), comment='公众号用户ID；“系统”表示对所有用户有效', default='系统')
     expire_time = Column(Integer, comment='回复的有效期，单位：秒；0表示永久有效', default=0)
     is_encrypt = Column(Integer, comment='回复的内容是否已经加密过，0：未加密，1：已加密', default=0)
@@ -324,6 +594,24 @@ class KeyWord(BaseModel):
 
     other_info = Column(String(300), comment='其他信息', default=None)
 
+    @staticmethod
+    def remove_duplicates(connection) -> int:
+        """
+        删除重复的系统关键词，建立系统关键词的唯一索引之前执行；每个关键词保留主键最大（最后上传）的一条
+        :param connection: 数据库连接
+        :return: 删除的记录数
+        """
+
+        ranked = select(
+            KeyWord.id,
+            func.row_number().over(partition_by=KeyWord.keyword, order_by=KeyWord.id.desc()).label('row_num')
+        ).where(KeyWord.official_user_id == '系统').subquery()
+
+        result = connection.execute(
+            delete(KeyWord).where(KeyWord.id.in_(select(ranked.c.id).where(ranked.c.row_num > 1)))
+        )
+        return result.rowcount
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -331,6 +619,8 @@ class KeyWord(BaseModel):
             "reply_type": self.reply_type,
             "reply_content": self.reply_content,
             "reply_media_id": self.reply_media_id,
+            "match_type": self.match_type,
+            "priority": self.priority,
             "official_user_id": self.official_user_id,
             "expire_time": self.expire_time,
             "is_encrypt": self.is_encrypt,
@@ -338,6 +628,27 @@ class KeyWord(BaseModel):
         }
 
 
+class UserState(BaseModel):
+    """
+    用户会话状态表：如当前所处的指令；以 (用户ID, 状态名) 为主键，按主键读取
+    """
+
+    __tablename__ = 'wechat_user_state'
+
+    official_user_id = Column(String(100), primary_key=True, comment='公众号用户ID')
+    state_key = Column(String(100), primary_key=True, comment='状态名称，如：command')
+    state_value = Column(TEXT, comment='状态值', default=None)
+    expire_time = Column(Integer, comment='过期时间，单位：秒；0表示永久有效', default=0)
+
+    def to_dict(self):
+        return {
+            "official_user_id": self.official_user_id,
+            "state_key": self.state_key,
+            "state_value": self.state_value,
+            "expire_time": self.expire_time,
+        }
+
+
 class AuthenticatedCode(BaseModel):
     """
     一次性鉴权码表，用于各种用户操作
@@ -356,6 +667,10 @@ class AuthenticatedCode(BaseModel):
 
 class Source(BaseModel):
     __tablename__ = 'wechat_source'
+    __table_args__ = (
+        # 资源ID唯一，批量上传时以此去重（upsert）
+        Index('uq_wechat_source_share_key', 'share_key', unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
 
@@ -387,6 +702,24 @@ class Source(BaseModel):
 
         return drive_info.get(self.drive_type, {}).get('drive_name', '未知')
 
+    @staticmethod
+    def remove_duplicates(connection) -> int:
+        """
+        删除重复的资源（同一个 share_key），建立唯一索引之前执行；每个资源保留主键最大（最后上传）的一条
+        :param connection: 数据库连接
+        :return: 删除的记录数
+        """
+
+        ranked = select(
+            Source.id,
+            func.row_number().over(partition_by=Source.share_key, order_by=Source.id.desc()).label('row_num')
+        ).where(Source.share_key.isnot(None)).subquery()
+
+        result = connection.execute(
+            delete(Source).where(Source.id.in_(select(ranked.c.id).where(ranked.c.row_num > 1)))
+        )
+        return result.rowcount
+
     @property
     def share_url(self):
         """获取分享链接"""
@@ -414,8 +747,90 @@ class Source(BaseModel):
         }
 
 
+class SchemaVersion(BaseModel):
+    """数据库结构版本表，只有一行数据，记录当前数据库已完成的结构版本"""
+
+    __tablename__ = 'wechat_schema_version'
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, comment='数据库结构版本号', nullable=False, default=0)
+    updated_at = Column(DateTime, comment='最近一次迁移时间', default=datetime.now)
+
+
+class CacheVersion(BaseModel):
+    """进程内缓存的版本表：修改缓存对应的数据之后版本号加1，各进程发现版本号变化时重新加载缓存"""
+
+    __tablename__ = 'wechat_cache_version'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), comment='缓存名称', nullable=False, unique=True)
+    version = Column(Integer, comment='版本号', nullable=False, default=0)
+    updated_at = Column(DateTime, comment='最近一次修改时间', default=datetime.now)
+
+    @staticmethod
+    def get_version(connection, name: str) -> int:
+        """
+        读取缓存的版本号
+        :param connection: 数据库连接
+        :param name: 缓存名称
+        :return: 版本号；没有记录时返回0
+        """
+
+        version = connection.execute(select(CacheVersion.version).where(CacheVersion.name == name)).scalar()
+        return version or 0
+
+    @staticmethod
+    def bump(connection, name: str) -> None:
+        """
+        缓存的版本号加1；没有记录时新增一条
+        :param connection: 数据库连接
+        :param name: 缓存名称
+        :return: None
+        """
+
+        result = connection.execute(
+            update(CacheVersion).where(CacheVersion.name == name).values(
+                version=CacheVersion.version + 1,
+                updated_at=datetime.now()
+            )
+        )
+
+        if not result.rowcount:
+            connection.execute(insert(CacheVersion).values(name=name, version=1, updated_at=datetime.now()))
+
+
+class BackupRecord(BaseModel):
+    """数据库备份记录表：每次备份成功上传之后写入一行，记录各数据表导出到的水位线，供下一次增量备份使用"""
+
+    __tablename__ = 'wechat_backup_record'
+
+    id = Column(Integer, primary_key=True)
+    backup_name = Column(String(200), comment='备份文件名称', nullable=False)
+    backup_type = Column(String(10), comment='备份类型，full：全量备份，delta：增量备份', nullable=False)
+    base_name = Column(String(200), comment='增量备份所依赖的全量备份文件名称；全量备份为自身', nullable=False)
+    watermarks = Column(TEXT, comment='各数据表的水位线，JSON格式：{表名: {"id": 最大主键, "time": 最大时间}}', default='{}')
+    created_at = Column(DateTime, comment='备份时间', default=datetime.now)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "backup_name": self.backup_name,
+            "backup_type": self.backup_type,
+            "base_name": self.base_name,
+            "watermarks": self.watermarks,
+            "created_at": self.created_at,
+        }
+
+
 class DatabaseHandler(object):
 
+    # 唯一索引 -> 建立索引之前删除重复数据的方法；旧版本没有这些索引，已有数据中可能存在重复
+    duplicate_removers = {
+        'uq_wechat_message_user_msg': WechatMessage.remove_duplicates,
+        'uq_wechat_keywords_system': KeyWord.remove_duplicates,
+        'uq_wechat_source_share_key': Source.remove_duplicates,
+    }
+
     def __init__(
             self,
             sqlite_db_path: str = 'database.db',
@@ -438,7 +853,7 @@ class DatabaseHandler(object):
         :param db_host: 数据库地址
         :param db_port: 数据库端口，默认为5432
         :param db_name: 数据库名称
-        :param need_check_database: 是否需要检查数据库中的表是否已创建，如果为False，则不会检查，直接连接数据库。
+        :param need_check_database: 是否检查数据库结构版本；版本落后时抛出 SchemaOutdatedError，如果为False，则不会检查，直接连接数据库。
         """
 
         self.database_path = sqlite_db_path
@@ -447,23 +862,220 @@ class DatabaseHandler(object):
             self.database_path = os.path.join(project_dir, 'database.db')
 
         if not all([db_user, db_password, db_host, db_port, db_name, db_type]):
-            self.engine = create_engine("sqlite:///" + sqlite_db_path)
+            self.conn_str = "sqlite:///" + sqlite_db_path
             config.is_debug and pro_logger.info(f"使用sqlite数据库，数据库文件路径：【{self.database_path}】")
         else:
             if db_type.lower() == 'postgresql':
-                conn_str = f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+                self.conn_str = f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
             elif db_type.lower() == 'mysql':
-                conn_str = f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+                self.conn_str = f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
             else:
                 raise ValueError('不支持的数据库类型')
 
             config.is_debug and pro_logger.info(f"使用{db_type}数据库，数据库地址：【{db_host}:{db_port}/{db_name}】")
-            self.engine = create_engine(conn_str)
 
-        if need_check_database:
-            self.create_db()
+        # 引擎与会话注册表在进程内共享，不再每次实例化都重新建立连接
+        self.engine = get_engine(self.conn_str)
+        self.session_registry = get_session_registry(self.conn_str)
+
+        if need_check_database and self.conn_str not in _schema_checked:
+            self.check_schema()
+
+    @classmethod
+    def from_config(cls, need_check_database: bool = True) -> "DatabaseHandler":
+        """根据配置文件中的数据库信息，创建数据库连接对象"""
+
+        return cls(
+            db_type=config.db_config.db_type,
+            db_user=config.db_config.db_user,
+            db_password=config.db_config.db_password,
+            db_host=config.db_config.db_host,
+            db_port=config.db_config.db_port,
+            db_name=config.db_config.db_name,
+            need_check_database=need_check_database
+        )
+
+    @property
+    def session(self):
+        """当前线程的数据库会话；同一线程内多次获取得到的是同一个会话"""
+        return self.session_registry()
+
+    def get_schema_version(self) -> int:
+        """读取数据库中记录的结构版本号；版本表不存在时返回0，连接失败等其他错误直接抛出"""
+
+        with self.engine.connect() as connection:
+            if not inspect(connection).has_table(SchemaVersion.__tablename__):
+                return 0
+
+            version = connection.execute(
+                text(f"SELECT MAX(version) FROM {SchemaVersion.__tablename__}")
+            ).scalar()
+
+        return version or 0
+
+    def check_schema(self) -> None:
+        """
+        检查数据库结构版本（一次查询），版本一致后，本进程之后的请求只检查进程内标记；
+        请求过程中不执行任何DDL操作：版本落后时抛出 SchemaOutdatedError，需执行 `flask --app app init-db` 完成迁移
+        :return:
+        """
+
+        version = self.get_schema_version()
+
+        if version < SCHEMA_VERSION:
+            pro_logger.error(f"数据库结构版本【{version}】落后于代码版本【{SCHEMA_VERSION}】，请执行 `flask --app app init-db`")
+            raise SchemaOutdatedError(SchemaOutdatedError.msg)
+
+        _schema_checked.add(self.conn_str)
+
+    def bootstrap(self) -> int:
+        """
+        初始化/迁移数据库结构：建表、添加触发器，并写入结构版本号；可重复执行。
+        只在命令行（init-db、restore-db）中调用，不在请求过程中执行
+        :return: 当前结构版本号
+        """
+
+        self.create_db()
+
+        added_columns = self.migrate_columns()
+        if 'wechat_user.last_sign_in_date' in added_columns:
+            with self.engine.begin() as connection:
+                count = UserSignIn.backfill_user_streak(connection)
+                config.is_debug and pro_logger.info(f"已根据签到记录，补充{count}个用户的连续签到天数")
+
+        # 索引没有全部建好时不更新版本号，下次执行时重试
+        failed_indexes = [name for name, status in self.migrate_indexes().items() if status == 'failed']
+        if failed_indexes:
+            raise SchemaMigrationError(f"索引【{'、'.join(failed_indexes)}】创建失败，数据库结构版本未更新")
+
+        with self.engine.begin() as connection:
+            connection.execute(SchemaVersion.__table__.delete())
+            connection.execute(SchemaVersion.__table__.insert().values(
+                version=SCHEMA_VERSION,
+                updated_at=datetime.now()
+            ))
+
+        _schema_checked.add(self.conn_str)
+        config.is_debug and pro_logger.info(f"数据库结构已更新到版本【{SCHEMA_VERSION}】")
+        return SCHEMA_VERSION
+
+    def migrate_columns(self) -> List[str]:
+        """
+        为已存在的表补充模型中新增的字段：只增加字段，不修改、不删除已有字段；新增字段的已有数据为NULL
+        :return: 新增的字段列表，格式：表名.字段名
+        """
+
+        added_columns = []
+        inspector = inspect(self.engine)
+        tables = inspector.get_table_names()
+        preparer = self.engine.dialect.identifier_preparer
+
+        for table in BaseModel.metadata.sorted_tables:
+            if table.name not in tables:
+                continue
 
-        self.session = self.get_session()
+            exist_columns = {column['name'] for column in inspector.get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name in exist_columns:
+                    continue
+
+                column_type = column.type.compile(dialect=self.engine.dialect)
+                with self.engine.begin() as connection:
+                    connection.execute(text(
+                        f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.quote(column.name)} {column_type}"
+                    ))
+
+                added_columns.append(f"{table.name}.{column.name}")
+                config.is_debug and pro_logger.info(f"数据表【{table.name}】添加字段【{column.name}】成功")
+
+        return added_columns
+
+    def migrate_indexes(self) -> Dict[str, str]:
+        """
+        为已存在的表补建模型中定义的索引；新建的表在create_all时已包含索引。
+        postgresql使用 CREATE INDEX CONCURRENTLY，建索引期间不锁表，不影响线上读写；
+        并发建索引失败时会残留INVALID状态的索引，下次执行时先删除再重建；
+        其他数据库按普通方式建立索引。
+        建立唯一索引之前，先删除重复的数据（见各模型的 remove_duplicates）。
+        :return: 每个索引的处理结果：exists|created|failed
+        """
+
+        result = {}
+        db_type = self.engine.url.get_backend_name()
+        inspector = inspect(self.engine)
+        tables = inspector.get_table_names()
+        invalid_indexes = self.get_invalid_indexes() if db_type == 'postgresql' else set()
+
+        for table in BaseModel.metadata.sorted_tables:
+            if table.name not in tables or not table.indexes:
+                continue
+
+            exist_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+
+            for index in sorted(table.indexes, key=lambda i: i.name):
+
+                # 部分索引只在支持的数据库中创建，如：ddl_if(dialect=('postgresql', 'sqlite'))
+                ddl_if = getattr(index, '_ddl_if', None)
+                if ddl_if is not None and ddl_if.dialect and db_type not in ddl_if.dialect:
+                    continue
+
+                try:
+                    if index.name in invalid_indexes:
+                        self.drop_index_concurrently(index.name)
+                        exist_indexes.discard(index.name)
+                        pro_logger.warning(f"已删除上次创建失败的索引【{index.name}】，重新创建")
+
+                    if index.name in exist_indexes:
+                        result[index.name] = 'exists'
+                        continue
+
+                    remove_duplicates = self.duplicate_removers.get(index.name)
+                    if remove_duplicates:
+                        with self.engine.begin() as connection:
+                            count = remove_duplicates(connection)
+                        count and pro_logger.warning(f"数据表【{table.name}】删除了{count}条重复数据，准备建立索引【{index.name}】")
+
+                    if db_type == 'postgresql':
+                        # 由模型定义编译出建索引语句（包含部分索引的WHERE条件），再改为并发创建
+                        sql = str(CreateIndex(index, if_not_exists=True).compile(dialect=self.engine.dialect))
+                        sql = sql.replace('INDEX IF NOT EXISTS', 'INDEX CONCURRENTLY IF NOT EXISTS', 1)
+
+                        # CONCURRENTLY 不能在事务中执行，需使用自动提交的连接
+                        with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+                            connection.execute(text(sql))
+                    else:
+                        with self.engine.begin() as connection:
+                            index.create(bind=connection, checkfirst=True)
+
+                    result[index.name] = 'created'
+                    config.is_debug and pro_logger.info(f"数据表【{table.name}】添加索引【{index.name}】成功")
+                except Exception:
+                    # 如唯一索引遇到已有重复数据；postgresql中失败的并发索引残留为INVALID，下次执行时删除重建
+                    result[index.name] = 'failed'
+                    pro_logger.error(f"数据表【{table.name}】添加索引【{index.name}】失败", exc_info=True)
+
+        return result
+
+    def get_invalid_indexes(self) -> set:
+        """postgresql中当前schema下处于INVALID状态的索引（并发建索引失败后残留）"""
+
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(
+                "SELECT c.relname FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE NOT i.indisvalid AND n.nspname = current_schema()"
+            )).scalars().all()
+
+        return set(rows)
+
+    def drop_index_concurrently(self, index_name: str) -> None:
+        """postgresql中在线删除索引；CONCURRENTLY 不能在事务中执行，需使用自动提交的连接"""
+
+        preparer = self.engine.dialect.identifier_preparer
+        with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {preparer.quote(index_name)}"))
 
     def create_db(self):
         """ 创建数据表。如果表已经存在，则跳过 """
@@ -473,8 +1085,9 @@ class DatabaseHandler(object):
         # 先创建所有表
         BaseModel.metadata.create_all(self.engine)
 
+        # 触发器使用 plpgsql 编写，只在postgresql数据库中添加
         db_type = self.engine.url.get_backend_name()
-        if not db_type == 'postgresql' or not not db_type == 'mysql':
+        if db_type != 'postgresql':
             return
 
         # 检查表是否创建成功
@@ -570,9 +1183,6 @@ EXECUTE FUNCTION fill_wechatmessage_fields();
             return
 
     def get_session(self):
-        """ 创建一个session，用于操作数据库 """
-
-        session_class = scoped_session(sessionmaker(bind=self.engine))
-        session = session_class()
+        """ 获取当前线程的session，用于操作数据库 """
 
-        return session
+        return self.session_registry()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/29
+contact: 【公众号】思维兵工厂
+description: 多进程部署（gunicorn）的预加载与fork之后的处理
+
+主进程在fork之前调用 warm_up，把配置、指令注册表、城市编码、关键词索引等只读数据加载好，
+子进程以写时复制的方式共享这部分内存，也不需要各自再冷启动一次；
+子进程fork之后调用 after_fork，丢弃从主进程继承的数据库连接。
+--------------------------------------------
+"""
+
+import time
+import importlib
+
+from .config import config, pro_logger
+from .command import COMMAND_REGISTRY
+from .models import DatabaseHandler, dispose_engines
+from .keyword_cache import system_keyword_index, local_keyword_store
+
+
+def warm_up() -> None:
+    """在fork之前加载只读数据；单项加载失败只记录日志，子进程中会按需重新加载"""
+
+    start_time = time.time()
+
+    # 导入全部指令模块（使用指令清单时默认按需导入）
+    COMMAND_REGISTRY.load_all()
+
+    # 城市编码表
+    importlib.import_module('core.utils.weather')
+
+    # 本地关键词及其匹配器
+    local_keyword_store.matcher.build()
+
+    # 系统关键词索引，同时完成数据库结构检查
+    try:
+        database = DatabaseHandler.from_config(need_check_database=config.need_check_database)
+        system_keyword_index.refresh(database)
+        database.session.close()
+    except Exception:
+        pro_logger.error('预加载系统关键词索引失败', exc_info=True)
+
+    # openai 的导入耗时在一秒左右
+    if config.ai_config.is_valid():
+        importlib.import_module('openai')
+
+    pro_logger.info(f'预加载完成，耗时{time.time() - start_time:.2f}秒')
+
+
+def after_fork() -> None:
+    """子进程fork之后调用：数据库连接不能在进程间共享，丢弃继承的连接池"""
+
+    dispose_engines()
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/25
+contact: 【公众号】思维兵工厂
+description: 进程内的“单飞”（single-flight）协调：同一条消息只处理一次，重试请求等待第一次请求的结果
+
+微信服务器在5秒内收不到响应，会以相同的 MsgId 重试，总共三次。
+第一次请求在 message_flights 中登记 (用户ID, MsgId)，处理完成后发布回复；
+同一进程内的重试请求直接等待这个结果，不再轮询数据库。
+
+重试请求落在其他进程（多进程部署、云函数多实例）时，进程内找不到登记，仍通过数据库中的消息记录判断、轮询。
+ASGI模式下，重试请求在事件循环中等待（wait_async），不占用处理同步操作的线程。
+--------------------------------------------
+"""
+
+import asyncio
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from .config import config, pro_logger
+from .types import WechatReplyData
+
+
+class InFlightCall(object):
+    """一次正在处理的调用：处理完成后，所有等待者都会拿到同一个结果"""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []  # 处理完成时调用的回调
+        self._lock = threading.Lock()
+        self.result: Optional[WechatReplyData] = None  # 处理结果；处理失败时为None
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float) -> Optional[WechatReplyData]:
+        """
+        等待处理完成
+        :param timeout: 最长等待时间，单位：秒
+        :return: 处理结果；超时或处理失败返回None
+        """
+
+        self._done.wait(timeout)
+        return self.result
+
+    async def wait_async(self, timeout: float) -> Optional[WechatReplyData]:
+        """
+        wait 的异步版本，等待期间不占用线程
+        :param timeout: 最长等待时间，单位：秒
+        :return: 处理结果；超时或处理失败返回None
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake():
+            # 处理方在其他线程中完成，需要切换回事件循环所在的线程
+            try:
+                loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+            except RuntimeError:
+                # 事件循环已关闭
+                pass
+
+        self.add_done_callback(wake)
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        return self.result
+
+    def add_done_callback(self, callback: Callable[[], None]) -> None:
+        """处理完成时调用 callback；已经完成时立即调用"""
+
+        with self._lock:
+            if not self.done:
+                self._callbacks.append(callback)
+                return
+
+        callback()
+
+    def resolve(self, result: Optional[WechatReplyData]) -> None:
+        self.result = result
+
+        with self._lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            callback()
+
+
+class SingleFlight(object):
+    """进程内的调用登记表，进程内共享一个实例"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, InFlightCall] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def get(self, key: Hashable) -> Optional[InFlightCall]:
+        """获取正在处理的调用，不登记；没有时返回None"""
+
+        return self._calls.get(key)
+
+    def begin(self, key: Hashable) -> Tuple[InFlightCall, bool]:
+        """
+        登记一次调用
+        :param key: 调用的唯一标识，如 (用户ID, MsgId)
+        :return: (调用对象, 是否是第一次调用)；不是第一次调用时，应等待调用对象的结果
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            if call:
+                return call, False
+
+            call = InFlightCall()
+            self._calls[key] = call
+            return call, True
+
+    def finish(self, key: Hashable, result: Optional[WechatReplyData]) -> None:
+        """
+        结束一次调用，唤醒所有等待者；第一次调用的处理方必须调用此方法（包括处理失败时）
+        :param key: 调用的唯一标识
+        :param result: 处理结果，会复制一份发布给等待者；处理失败时传入None
+        :return: None
+        """
+
+        if result is not None:
+            result = WechatReplyData(msg_type=result.msg_type, content=result.content, media_id=result.media_id)
+
+        with self._lock:
+            call = self._calls.pop(key, None)
+
+        if call:
+            call.resolve(result)
+            config.is_debug and pro_logger.info(f'消息【{key}】处理结束，已唤醒等待的重试请求')
+
+
+message_flights = SingleFlight()
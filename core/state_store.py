@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/22
+contact: 【公众号】思维兵工厂
+description: 用户会话状态存储
+
+以 (公众号用户ID, 状态名) 为键，保存带有效期的短期状态，如用户当前所处的指令；
+根据配置项 state_store 选择存储方式：
+    - memory：进程内的LRU字典，只适用于单进程部署；
+    - database：数据表 wechat_user_state，按主键读写，适用于多进程、云函数部署（默认）；
+    - redis：兼容redis协议的服务，需要额外安装 redis 库。
+--------------------------------------------
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from sqlalchemy import select, delete, and_
+from sqlalchemy.dialects import postgresql, sqlite, mysql
+
+from .config import config, pro_logger
+from .models import DatabaseHandler, UserState
+
+
+class BaseStateStore(object):
+    """会话状态存储的接口"""
+
+    def get(self, official_user_id: str, state_key: str) -> Optional[str]:
+        """
+        读取状态
+        :param official_user_id: 公众号用户ID
+        :param state_key: 状态名称
+        :return: 状态值；不存在或已过期返回None
+        """
+        raise NotImplementedError
+
+    def set(self, official_user_id: str, state_key: str, state_value: str, ttl: int = 0) -> bool:
+        """
+        写入状态，已存在则覆盖
+        :param official_user_id: 公众号用户ID
+        :param state_key: 状态名称
+        :param state_value: 状态值
+        :param ttl: 有效期，单位：秒；0表示永久有效
+        :return: 是否写入成功
+        """
+        raise NotImplementedError
+
+    def delete(self, official_user_id: str, state_key: str) -> bool:
+        """
+        删除状态
+        :param official_user_id: 公众号用户ID
+        :param state_key: 状态名称
+        :return: 是否存在该状态
+        """
+        raise NotImplementedError
+
+
+class MemoryStateStore(BaseStateStore):
+    """进程内的LRU存储"""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._data: OrderedDict[Tuple[str, str], Tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, official_user_id: str, state_key: str) -> Optional[str]:
+        key = (official_user_id, state_key)
+
+        with self._lock:
+            item = self._data.get(key)
+            if not item:
+                return None
+
+            state_value, expire_time = item
+            if expire_time and expire_time < int(time.time()):
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return state_value
+
+    def set(self, official_user_id: str, state_key: str, state_value: str, ttl: int = 0) -> bool:
+        expire_time = int(time.time()) + ttl if ttl else 0
+
+        with self._lock:
+            self._data[(official_user_id, state_key)] = (state_value, expire_time)
+            self._data.move_to_end((official_user_id, state_key))
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+        return True
+
+    def delete(self, official_user_id: str, state_key: str) -> bool:
+        with self._lock:
+            return self._data.pop((official_user_id, state_key), None) is not None
+
+
+class DatabaseStateStore(BaseStateStore):
+    """数据表存储：按主键 (official_user_id, state_key) 读写，每次操作一条SQL"""
+
+    def __init__(self, database: DatabaseHandler):
+        self.database = database
+        self.table = UserState.__table__
+
+    def get(self, official_user_id: str, state_key: str) -> Optional[str]:
+        current_timestamp = int(time.time())
+
+        with self.database.engine.connect() as connection:
+            row = connection.execute(
+                select(self.table.c.state_value, self.table.c.expire_time).where(
+                    self.table.c.official_user_id == official_user_id,
+                    self.table.c.state_key == state_key
+                )
+            ).first()
+
+        if not row or (row.expire_time and row.expire_time < current_timestamp):
+            return None
+        return row.state_value
+
+    def set(self, official_user_id: str, state_key: str, state_value: str, ttl: int = 0) -> bool:
+        values = dict(
+            official_user_id=official_user_id,
+            state_key=state_key,
+            state_value=state_value,
+            expire_time=int(time.time()) + ttl if ttl else 0,
+        )
+        update_values = {'state_value': state_value, 'expire_time': values['expire_time']}
+        db_type = self.database.engine.url.get_backend_name()
+
+        try:
+            with self.database.engine.begin() as connection:
+                if db_type in ('postgresql', 'sqlite'):
+                    insert_func = postgresql.insert if db_type == 'postgresql' else sqlite.insert
+                    connection.execute(insert_func(self.table).values(values).on_conflict_do_update(
+                        index_elements=['official_user_id', 'state_key'],
+                        set_=update_values
+                    ))
+                elif db_type == 'mysql':
+                    connection.execute(mysql.insert(self.table).values(values).on_duplicate_key_update(update_values))
+                else:
+                    connection.execute(self.table.delete().where(self.__condition(official_user_id, state_key)))
+                    connection.execute(self.table.insert().values(values))
+            return True
+        except Exception:
+            pro_logger.error(f"保存用户状态【{state_key}】失败", exc_info=True)
+            return False
+
+    def delete(self, official_user_id: str, state_key: str) -> bool:
+        with self.database.engine.begin() as connection:
+            result = connection.execute(delete(self.table).where(self.__condition(official_user_id, state_key)))
+        return bool(result.rowcount)
+
+    def __condition(self, official_user_id: str, state_key: str):
+        return and_(self.table.c.official_user_id == official_user_id, self.table.c.state_key == state_key)
+
+
+class RedisStateStore(BaseStateStore):
+    """redis存储：使用redis自身的过期机制"""
+
+    def __init__(self, redis_url: str, prefix: str = 'wechat_state:'):
+        import redis
+
+        self.client = redis.Redis.from_url(redis_url, decode_responses=True)
+        self.prefix = prefix
+
+    def __key(self, official_user_id: str, state_key: str) -> str:
+        return f"{self.prefix}{official_user_id}:{state_key}"
+
+    def get(self, official_user_id: str, state_key: str) -> Optional[str]:
+        return self.client.get(self.__key(official_user_id, state_key))
+
+    def set(self, official_user_id: str, state_key: str, state_value: str, ttl: int = 0) -> bool:
+        try:
+            return bool(self.client.set(self.__key(official_user_id, state_key), state_value, ex=ttl or None))
+        except Exception:
+            pro_logger.error(f"保存用户状态【{state_key}】失败", exc_info=True)
+            return False
+
+    def delete(self, official_user_id: str, state_key: str) -> bool:
+        return bool(self.client.delete(self.__key(official_user_id, state_key)))
+
+
+_state_store: Optional[BaseStateStore] = None
+_state_store_lock = threading.Lock()
+
+
+def get_state_store() -> BaseStateStore:
+    """
+    获取进程内共享的会话状态存储，存储方式由配置项 state_store 决定
+    :return: BaseStateStore
+    """
+
+    global _state_store
+
+    if _state_store is not None:
+        return _state_store
+
+    with _state_store_lock:
+        if _state_store is not None:
+            return _state_store
+
+        store_type = (config.state_store or 'database').lower()
+
+        if store_type == 'memory':
+            _state_store = MemoryStateStore(max_size=config.state_store_max_size or 10000)
+        elif store_type == 'redis':
+            _state_store = RedisStateStore(redis_url=config.state_store_redis_url)
+        else:
+            _state_store = DatabaseStateStore(DatabaseHandler.from_config(need_check_database=False))
+
+        config.is_debug and pro_logger.info(f"用户会话状态使用【{store_type}】存储")
+        return _state_store
@@ -14,6 +14,8 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Optional, Callable, Literal, List, Union
 
+from .utils.wechat_xml import parse_message
+
 
 @dataclass
 class YunFuncTTSConfig:
@@ -123,12 +125,45 @@ class ConfigData:
     command_expire_time: int = 60 * 30  # 指令过期时间，单位为秒；默认30分钟；
 
     per_page_count: int = 5  # 每页显示的条数
+    page_cursor_expire_time: int = 60 * 60 * 3  # 分页结果的有效期，单位为秒；有效期内可回复【关键词-页码】翻页
+    cleanup_chunk_size: int = 1000  # 清理过期数据时，每批删除的最大条数
+    cleanup_throttle: float = 0  # 清理过期数据时，每批删除之后休眠的秒数，避免长时间占用数据库
+    backup_batch_size: int = 500  # 备份数据库时，每批读取的行数（同时也是每条INSERT语句包含的行数）
+    backup_full_interval_days: int = 7  # 增量备份时，距离上一次全量备份超过该天数，则重新做一次全量备份
+    restore_batch_size: int = 5000  # 恢复数据库时，每批写入的行数
+    restore_workers: int = 4  # 恢复数据库时，并行导入数据表的线程数（sqlite固定为1）
+    upload_chunk_size: int = 500  # 批量上传资源、系统关键词时，每批写入（并提交）的条数
+    keyword_cache_ttl: int = 300  # 系统关键词进程内缓存的有效期，单位为秒；过期后全量重新加载（同步直接在数据库中做的修改、删除）
+    keyword_cache_refresh_interval: int = 10  # 系统关键词刷新的间隔，单位为秒；检查缓存版本号（其他进程的修改、删除），并加载新增的关键词
+    state_store: str = 'database'  # 用户会话状态（当前指令等）的存储方式：memory（单进程）| database | redis
+    state_store_max_size: int = 10000  # memory存储方式最多保存的用户状态数，超出后淘汰最久未使用的
+    state_store_redis_url: str = 'redis://127.0.0.1:6379/0'  # redis存储方式的连接地址，兼容redis协议的服务均可
     need_check_database: bool = True  # 是否检查数据库中所有的表是否已经创建；确保数据库的表已全部创建后可以关闭，减少一次查询，提升速度
+    db_pool_size: int = 5  # 数据库连接池保持的连接数（sqlite不生效）
+    db_max_overflow: int = 10  # 连接池满时，允许额外创建的连接数（sqlite不生效）
+    db_pool_recycle: int = 1800  # 连接的最长复用时间，单位为秒，避免使用被数据库服务端断开的连接
+    db_pool_pre_ping: bool = True  # 从连接池取出连接时，是否先检测连接是否可用
     is_yun_function: bool = False  # 是否使用云函数部署项目，如果是，则关闭日志的文件记录
     is_debug: bool = True  # 是否开启debug模式
     logger_config: dict = None  # 日志配置
     command_another_count: int = 2  # 指令别名显示数
     retry_time: int = 1  # 当消息已经在处理时，获取处理结果的时间间隔，单位为秒
+    message_deadline: float = 14  # 处理一条消息的最长时间，单位为秒；微信共请求三次、每次等待5秒，超过15秒的结果用户收不到
+    async_reply_enabled: bool = False  # 是否开启异步回复：处理超时先回复success，处理完成后通过客服消息推送结果（需要公众号有客服消息接口权限）
+    async_reply_budget: float = 4  # 异步回复模式下，请求最多等待处理结果的秒数；须小于微信的5秒超时
+    async_reply_workers: int = 4  # 异步回复模式下，后台处理消息的线程数
+    async_reply_deadline: float = 60  # 异步回复模式下，后台处理一条消息的最长时间，单位为秒；超时的AI、OCR等调用直接放弃
+    wechat_api_base: str = 'https://api.weixin.qq.com'  # 微信接口地址，测试时可指向本地的模拟服务
+    asgi_sync_workers: int = 16  # ASGI模式下，执行数据库读写、指令等同步操作的线程数
+    server_bind: str = '0.0.0.0:9000'  # gunicorn 监听的地址
+    server_workers: int = 0  # gunicorn 的工作进程数；0表示按CPU核数自动计算（核数*2+1）
+    server_threads: int = 4  # gunicorn 每个工作进程的线程数
+    server_timeout: int = 30  # gunicorn 工作进程无响应多少秒后重启；也是平滑重启时等待请求处理完成的秒数
+    http_connect_timeout: float = 2  # 调用外部接口的连接超时，单位为秒
+    http_read_timeout: float = 4  # 调用外部接口的读取超时，单位为秒；默认小于微信的5秒等待时间
+    http_background_read_timeout: float = 60  # 后台线程中调用的外部接口（文本转语音、笔记转存等云函数）的读取超时
+    http_max_retries: int = 2  # 幂等请求（GET等）连接失败或返回429/5xx时的重试次数，间隔按指数退避
+    http_host_concurrency: int = 10  # 同一个外部主机的最大并发请求数（也是连接池大小）
 
 
 @dataclass
@@ -197,6 +232,16 @@ class WechatRequestData:
     event_key: Optional[str] = field(default=None, init=False)
     """事件的EventKey"""
 
+    @classmethod
+    def from_xml(cls, data: Union[bytes, str]) -> "WechatRequestData":
+        """
+        直接从微信推送的XML生成请求数据
+        :param data: 请求体
+        :return: WechatRequestData
+        """
+
+        return cls(parse_message(data))
+
     def __post_init__(self):
         # 基础字段
         self.my_user_id = self.xml_dict.get('ToUserName')
@@ -252,6 +297,24 @@ class FunctionInfo:
     random_id: str = uuid.uuid4().hex  # 随机ID值，用于唯一标识，无意义
 
 
+@dataclass
+class CommandEntry:
+    """指令分发表中的一项：指令对应的处理对象与方法"""
+
+    handler_obj: object  # 处理对象，即各指令模块的 KeywordFunction 实例
+    function_info: FunctionInfo  # 方法信息
+
+
+@dataclass
+class ParsedCommand:
+    """按分隔符拆分之后的用户输入"""
+
+    command: str  # 指令名称；不包含分隔符时为用户输入的原文本
+    content: str  # 传给处理方法的内容；不包含分隔符时为用户输入的原文本
+    key: Optional[str] = None  # 第二个分隔符之后的内容
+    has_sep: bool = False  # 是否包含分隔符：包含时查找需要参数的指令，否则查找直接指令
+
+
 @dataclass
 class Command:
     """存储指令信息"""
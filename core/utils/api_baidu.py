@@ -13,7 +13,8 @@ description:
 import base64
 import urllib
 import logging
-import requests
+from .http_client import http_client
+from ..deadline import DeadlineExceeded
 
 
 class BaiduOCR(object):
@@ -67,9 +68,11 @@ class BaiduOCR(object):
         }
 
         try:
-            response = requests.post(token_url, params=params)
+            response = http_client.post(token_url, params=params)
             access_token = response.json().get("access_token")
             return access_token
+        except DeadlineExceeded:
+            raise
         except Exception:
             self.logger.error("获取Access Token失败了！请检查api_key与secret_key。", exc_info=True)
 
@@ -125,14 +128,16 @@ class BaiduOCR(object):
         if ocr_type not in self.ocr_host:
             return {}
 
-        # OCR过程若出现错误，重试两次
+        # OCR过程若出现错误，重试两次；处理消息的时间用完时不再重试
         for i in range(3):
             try:
                 ocr_host = self.ocr_host[ocr_type] + access_token
                 encoded_data = urllib.parse.urlencode(data)
-                response = requests.request("POST", ocr_host, headers=headers, data=encoded_data)
+                response = http_client.post(ocr_host, headers=headers, data=encoded_data)
 
                 return self.handler_text(response.json())
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 self.logger.error("orc过程出现错误", exc_info=True)
 
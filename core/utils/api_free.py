@@ -40,8 +40,7 @@ from datetime import datetime
 import asyncio
 import time
 
-import aiohttp
-import requests
+from .http_client import http_client, async_http_client
 from typing import Optional, List
 from dataclasses import dataclass
 
@@ -180,7 +179,7 @@ class FreeApi(object):
 
         data = self.voice_choice_dict[voice_choice]
         data.update({'msg': text})
-        response = requests.get(self.tts_url, params=data, headers=self.header)
+        response = http_client.get(self.tts_url, params=data, headers=self.header)
 
         data = response.json()
 
@@ -211,7 +210,7 @@ class FreeApi(object):
         """
 
         try:
-            response = requests.get(self.music_url, params=data, headers=self.header)
+            response = http_client.get(self.music_url, params=data, headers=self.header)
             response_data = response.json()
             code = response_data.get('code')
 
@@ -252,13 +251,12 @@ class FreeApi(object):
         """异步请求公共方法"""
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.music_url, params=data, headers=self.header) as response:
-                    response_data = await response.json()
-                    code = response_data.get('code')
-                    if code != 200:
-                        return
-                    return response_data
+            response = await async_http_client.get(self.music_url, params=data, headers=self.header)
+            response_data = response.json()
+            code = response_data.get('code')
+            if code != 200:
+                return
+            return response_data
         except Exception:
             pass
 
@@ -285,6 +283,8 @@ class FreeApi(object):
 
         while True:
             if all([task.done() for task in tasks]):
+                # asyncio.run 结束后事件循环随之关闭，先关闭该事件循环的会话
+                await async_http_client.close()
                 return result_list
             else:
                 await asyncio.sleep(0.5)
@@ -303,14 +303,14 @@ class FreeApi(object):
 
         try:
             host = f"{self.short_url}?url={url}"
-            response = requests.get(host, headers=self.header)
+            response = http_client.get(host, headers=self.header)
             return response.text
         except Exception:
             pass
 
     def _get(self, host, data: dict = None):
         try:
-            response = requests.get(host, headers=self.header, data=data)
+            response = http_client.get(host, headers=self.header, data=data)
             data = response.json()
             return data
         except Exception:
@@ -13,7 +13,7 @@ description: 一个信息查询接口，支持qq查手机号，手机号查询qq
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
+from .http_client import http_client
 
 
 @dataclass
@@ -35,7 +35,7 @@ class PrivacyHandler(object):
     def _get(url: str, params: dict) -> dict:
 
         try:
-            data = requests.get(url, params=params)
+            data = http_client.get(url, params=params)
             return data.json()
         except Exception as e:
             print(e)
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/30
+contact: 【公众号】思维兵工厂
+description: 调用外部接口的公共HTTP客户端
+
+项目中的外部接口（天气、OCR、免费API、云函数等）统一通过这里发送请求：
+    - 每个主机一个 requests.Session，连接保持复用，不必每次请求都重新握手；
+    - 默认的连接、读取超时（配置项 http_connect_timeout、http_read_timeout）小于微信的5秒等待时间，
+      外部接口无响应时不会一直占用工作线程；后台线程中的耗时调用可以传入更长的 timeout；
+    - 幂等请求（GET等）在连接失败、返回429/5xx时按指数退避重试；POST请求不重试，读取超时也不重试；
+    - 同一个主机的并发请求数有上限（配置项 http_host_concurrency），超过时短暂等待，等不到则抛出 HostBusyError；
+    - 处理消息期间（见 core/deadline.py），超时不超过消息的剩余时间，剩余时间用完时抛出 DeadlineExceeded。
+异步代码使用 async_http_client，接口与 http_client 一致。
+--------------------------------------------
+"""
+
+import os
+import json
+import asyncio
+import weakref
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import config
+from ..deadline import DeadlineExceeded, get_deadline
+
+# 可以安全重试的请求方法
+idempotent_methods = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'])
+
+# 需要重试的响应状态码
+retry_status_codes = frozenset([429, 500, 502, 503, 504])
+
+
+class HostBusyError(requests.exceptions.RequestException):
+    """同一个主机的并发请求数已达上限"""
+
+
+def get_host(url: str) -> str:
+    """获取url的 协议://主机:端口 部分"""
+
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+def get_timeout(read_timeout: Optional[float] = None) -> Tuple[float, float]:
+    """
+    生成 (连接超时, 读取超时)
+    :param read_timeout: 读取超时，默认使用配置项 http_read_timeout
+    :return:
+    """
+
+    return config.http_connect_timeout or 2, read_timeout or config.http_read_timeout or 4
+
+
+def cap_timeout(timeout: Union[float, Tuple[float, float], None]) -> Union[float, Tuple[float, float], None]:
+    """
+    用当前消息的剩余时间限制超时
+    :param timeout: 超时，可以是 (连接超时, 读取超时)
+    :return: 限制后的超时
+    """
+
+    remaining = get_deadline().remaining()
+    if remaining is None:
+        return timeout
+
+    if remaining <= 0:
+        raise DeadlineExceeded('处理消息的时间已用完，放弃请求外部接口')
+
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+class HttpClient(object):
+    """同步HTTP客户端，进程内共享一个实例"""
+
+    def __init__(self):
+        self._sessions: Dict[str, requests.Session] = {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _get_host_state(self, host: str) -> Tuple[requests.Session, threading.BoundedSemaphore]:
+        """获取主机对应的会话与并发信号量，首次请求时创建"""
+
+        # fork出的子进程不能复用主进程的连接
+        if os.getpid() != self._pid:
+            with self._lock:
+                if os.getpid() != self._pid:
+                    self._sessions, self._semaphores = {}, {}
+                    self._pid = os.getpid()
+
+        session = self._sessions.get(host)
+        if session is not None:
+            return session, self._semaphores[host]
+
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is not None:
+                return session, self._semaphores[host]
+
+            concurrency = config.http_host_concurrency or 10
+            retries = config.http_max_retries or 0
+
+            retry = Retry(
+                total=retries,
+                connect=retries,
+                read=False,  # 读取超时不重试，直接抛出 ReadTimeout
+                status=retries,
+                backoff_factor=0.3,
+                status_forcelist=retry_status_codes,
+                allowed_methods=idempotent_methods,
+                raise_on_status=False,
+                respect_retry_after_header=False,
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency, max_retries=retry)
+
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+            self._sessions[host] = session
+            self._semaphores[host] = threading.BoundedSemaphore(concurrency)
+            return session, self._semaphores[host]
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        发送请求，参数与 requests.request 一致；未指定 timeout 时使用默认超时
+        :param method: 请求方法
+        :param url: 请求地址
+        :return: requests.Response
+        """
+
+        kwargs['timeout'] = cap_timeout(kwargs.get('timeout') or get_timeout())
+
+        session, semaphore = self._get_host_state(get_host(url))
+
+        if not semaphore.acquire(timeout=cap_timeout(get_timeout()[0])):
+            raise HostBusyError(f'请求【{get_host(url)}】的并发数已达上限')
+
+        try:
+            return session.request(method.upper(), url, **kwargs)
+        finally:
+            semaphore.release()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+
+@dataclass
+class AsyncHttpResponse:
+    """异步请求的响应，响应体已读取完毕"""
+
+    status_code: int
+    content: bytes = b''
+    headers: Dict[str, str] = field(default_factory=dict)
+    encoding: str = 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncHttpClient(object):
+    """异步HTTP客户端：每个事件循环一个 aiohttp 会话；aiohttp 在第一次请求时才导入"""
+
+    def __init__(self):
+        self._sessions = weakref.WeakKeyDictionary()
+
+    def get_session(self):
+        """获取当前事件循环的会话"""
+
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connect_timeout, read_timeout = get_timeout()
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=config.http_host_concurrency or 10),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout),
+            )
+            self._sessions[loop] = session
+
+        return session
+
+    async def request(self, method: str, url: str, **kwargs) -> AsyncHttpResponse:
+        """
+        发送请求，参数与 aiohttp.ClientSession.request 一致；timeout 可以传入 (连接超时, 读取超时)
+        :param method: 请求方法
+        :param url: 请求地址
+        :return: AsyncHttpResponse
+        """
+
+        import aiohttp
+
+        method = method.upper()
+
+        timeout = kwargs.pop('timeout', None)
+        retries = (config.http_max_retries or 0) if method in idempotent_methods else 0
+
+        for attempt in range(retries + 1):
+
+            # 每次重试都按当前的剩余时间重新计算超时
+            if timeout is None or isinstance(timeout, tuple):
+                connect_timeout, read_timeout = cap_timeout(timeout or get_timeout())
+                kwargs['timeout'] = aiohttp.ClientTimeout(
+                    total=get_deadline().remaining(), sock_connect=connect_timeout, sock_read=read_timeout
+                )
+            else:
+                kwargs['timeout'] = timeout
+
+            try:
+                async with self.get_session().request(method, url, **kwargs) as response:
+                    content = await response.read()
+                    encoding = response.get_encoding()
+
+                if response.status in retry_status_codes and attempt < retries:
+                    await asyncio.sleep(0.3 * 2 ** attempt)
+                    continue
+
+                return AsyncHttpResponse(
+                    status_code=response.status,
+                    content=content,
+                    headers=dict(response.headers),
+                    encoding=encoding,
+                )
+            except aiohttp.ServerTimeoutError:
+                # 超时不重试，避免超出微信的等待时间
+                raise
+            except aiohttp.ClientConnectionError:
+                if attempt >= retries:
+                    raise
+                await asyncio.sleep(0.3 * 2 ** attempt)
+
+    async def get(self, url: str, **kwargs) -> AsyncHttpResponse:
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> AsyncHttpResponse:
+        return await self.request('POST', url, **kwargs)
+
+    async def close(self) -> None:
+        """关闭当前事件循环的会话；使用 asyncio.run 等临时事件循环时，应在事件循环结束前调用"""
+
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+http_client = HttpClient()
+async_http_client = AsyncHttpClient()
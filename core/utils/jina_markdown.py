@@ -12,7 +12,8 @@ description: 基于Jina Reader，将html内容转为markdown格式
 --------------------------------------------
 """
 
-import requests
+from .http_client import http_client, get_timeout
+from ..config import config
 from dataclasses import dataclass
 
 
@@ -40,7 +41,8 @@ def convert_url_to_md(url: str):
     content_obj = Markdown()
 
     try:
-        response = requests.get(url)
+        # 网页转换耗时较长，该函数在后台线程中调用，使用较长的读取超时
+        response = http_client.get(url, timeout=get_timeout(config.http_background_read_timeout))
 
         lines = response.text.split('\n')
 
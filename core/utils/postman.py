@@ -10,7 +10,7 @@ description: 消息发送，可发送微信消息或者邮件
 --------------------------------------------
 """
 
-import requests
+from .http_client import http_client
 
 
 def send_wechat_msg(token: str, msg: str = '', img_url: str = '') -> bool:
@@ -32,7 +32,7 @@ def send_wechat_msg(token: str, msg: str = '', img_url: str = '') -> bool:
     }
 
     try:
-        response = requests.post(host, json=data)
+        response = http_client.post(host, json=data)
         json_resp = response.json()
 
         return json_resp.get('success', False)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/27
+contact: 【公众号】思维兵工厂
+description: 微信消息的XML编解码
+
+微信推送的消息是扁平、字段固定的XML，每条消息都要解析一次请求、生成一次回复：
+    - parse_message：使用 xml.etree 一次解析，直接得到 {标签: 文本} 字典，结果与 xmltodict.parse 的 xml 节点一致；
+    - make_text_reply 等：预先编译的回复模板，只需填入字段，字段内容放在CDATA中，不需要逐个转义。
+
+与 xmltodict 的对比见 script/benchmark_xml.py。
+--------------------------------------------
+"""
+
+import re
+import time
+from typing import Dict, Optional, Union
+from xml.etree.ElementTree import Element, fromstring
+
+# XML 1.0 不允许出现的控制字符，CDATA中也不行，回复前剔除，避免微信服务器解析失败
+_invalid_char_pattern = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_reply_head = (
+    '<xml>'
+    '<ToUserName><![CDATA[{to_user_id}]]></ToUserName>'
+    '<FromUserName><![CDATA[{from_user_id}]]></FromUserName>'
+    '<CreateTime>{create_time}</CreateTime>'
+)
+
+TEXT_REPLY_TEMPLATE = _reply_head + '<MsgType><![CDATA[text]]></MsgType><Content><![CDATA[{content}]]></Content></xml>'
+IMAGE_REPLY_TEMPLATE = _reply_head + '<MsgType><![CDATA[image]]></MsgType><Image><MediaId><![CDATA[{media_id}]]></MediaId></Image></xml>'
+VOICE_REPLY_TEMPLATE = _reply_head + '<MsgType><![CDATA[voice]]></MsgType><Voice><MediaId><![CDATA[{media_id}]]></MediaId></Voice></xml>'
+
+
+def _element_to_value(element: Element) -> Union[str, Dict, None]:
+    """
+    叶子节点返回去除首尾空白的文本（空节点返回None），有子节点时返回字典，与 xmltodict 一致
+    """
+
+    if len(element):
+        return {child.tag: _element_to_value(child) for child in element}
+
+    text = element.text
+    if text is None:
+        return None
+
+    return text.strip() or None
+
+
+def parse_message(data: Union[bytes, str]) -> Dict:
+    """
+    解析微信推送的消息
+    :param data: 请求体
+    :return: <xml> 节点下的 {标签: 文本} 字典；事件中嵌套的节点（如 SendLocationInfo）解析为字典
+    """
+
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    # 微信的消息不会带有DTD，拒绝带有DTD的请求体，避免实体展开攻击
+    if b'<!DOCTYPE' in data or b'<!ENTITY' in data:
+        raise ValueError('不支持带有DTD的XML')
+
+    root = fromstring(data)
+    if root.tag != 'xml':
+        return {}
+
+    return {child.tag: _element_to_value(child) for child in root}
+
+
+def cdata(value: Optional[str]) -> str:
+    """
+    处理放入CDATA中的文本：拆分其中的 ]]> ，并剔除XML不允许的控制字符
+    :param value: 原始文本
+    :return: 可以放入 <![CDATA[...]]> 中的文本
+    """
+
+    if not value:
+        return ''
+
+    value = str(value)
+
+    if ']]>' in value:
+        value = value.replace(']]>', ']]]]><![CDATA[>')
+
+    return _invalid_char_pattern.sub('', value)
+
+
+def make_text_reply(to_user_id: str, from_user_id: str, content: str, create_time: Optional[int] = None) -> str:
+    """
+    生成文本回复
+    :param to_user_id: 接收方（用户）
+    :param from_user_id: 发送方（公众号）
+    :param content: 文本内容
+    :param create_time: 消息创建时间，默认为当前时间
+    :return: 回复的XML
+    """
+
+    return TEXT_REPLY_TEMPLATE.format(
+        to_user_id=cdata(to_user_id),
+        from_user_id=cdata(from_user_id),
+        create_time=create_time or int(time.time()),
+        content=cdata(content)
+    )
+
+
+def make_image_reply(to_user_id: str, from_user_id: str, media_id: str, create_time: Optional[int] = None) -> str:
+    """
+    生成图片回复
+    :param to_user_id: 接收方（用户）
+    :param from_user_id: 发送方（公众号）
+    :param media_id: 图片的media_id
+    :param create_time: 消息创建时间，默认为当前时间
+    :return: 回复的XML
+    """
+
+    return IMAGE_REPLY_TEMPLATE.format(
+        to_user_id=cdata(to_user_id),
+        from_user_id=cdata(from_user_id),
+        create_time=create_time or int(time.time()),
+        media_id=cdata(media_id)
+    )
+
+
+def make_voice_reply(to_user_id: str, from_user_id: str, media_id: str, create_time: Optional[int] = None) -> str:
+    """
+    生成语音回复
+    :param to_user_id: 接收方（用户）
+    :param from_user_id: 发送方（公众号）
+    :param media_id: 语音的media_id
+    :param create_time: 消息创建时间，默认为当前时间
+    :return: 回复的XML
+    """
+
+    return VOICE_REPLY_TEMPLATE.format(
+        to_user_id=cdata(to_user_id),
+        from_user_id=cdata(from_user_id),
+        create_time=create_time or int(time.time()),
+        media_id=cdata(media_id)
+    )
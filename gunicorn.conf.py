@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/29
+contact: 【公众号】思维兵工厂
+description: gunicorn 配置，生产环境的多进程部署入口
+
+    gunicorn -c gunicorn.conf.py
+
+进程数、线程数等读取配置文件【config.json】中的 server_* 配置项，命令行参数可以覆盖；
+主进程预加载项目（preload_app），fork之前加载好只读数据，子进程写时复制共享；
+平滑重启：kill -HUP <主进程ID>，工作进程处理完当前请求后退出，由新的工作进程接替；
+由于预加载，HUP不会重新加载项目代码，更新代码之后需要重启服务。
+--------------------------------------------
+"""
+
+import multiprocessing
+
+# gunicorn 会把本文件中的变量当作配置项，项目配置不能命名为 config
+from core.config import config as project_config
+from core.prefork import warm_up, after_fork
+
+wsgi_app = 'app:app'
+bind = project_config.server_bind or '0.0.0.0:9000'
+
+workers = project_config.server_workers or multiprocessing.cpu_count() * 2 + 1
+worker_class = 'gthread'
+threads = project_config.server_threads or 4
+
+timeout = project_config.server_timeout or 30
+graceful_timeout = timeout
+
+preload_app = True
+
+
+def on_starting(server):
+    """项目已预加载，fork工作进程之前执行"""
+    warm_up()
+
+
+def post_fork(server, worker):
+    """工作进程fork之后执行"""
+    after_fork()
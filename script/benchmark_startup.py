@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/24
+contact: 【公众号】思维兵工厂
+description: 冷启动基准测试：在全新的解释器中测量导入耗时与首个请求的响应时间
+
+每一轮都启动一个新的 python 进程（带 -X importtime），依次测量：
+    - import_core：导入 core 包（core/__init__.py 会导入配置、模型、指令、消息处理等模块）
+    - config_parse / logger_setup：解析配置文件、初始化日志本身的耗时（依赖已导入）
+    - command_registry：生成指令注册表的耗时（存在指令清单时按清单注册，否则导入并实例化全部指令模块）
+    - import_app：导入 app.py
+    - first_get / first_post：第一个 /wechat GET、POST 请求的响应时间
+    - second_post：第二个 POST 请求，作为热启动的对照
+同时解析 -X importtime 的输出，统计各模块的导入耗时（key_modules 中是项目内主要模块的自身/累计耗时），
+并检查重量级依赖是否在首个请求之后被导入。
+
+结果保存为json，可以用 --compare 与之前的结果比较，发现冷启动耗时的回退。
+
+用法（在项目根目录执行）：
+    python script/benchmark_startup.py --runs 5
+    python script/benchmark_startup.py --runs 5 --compare benchmark_results/startup_xxx.json
+--------------------------------------------
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Optional
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+default_output_dir = os.path.join(project_dir, 'benchmark_results')
+
+result_marker = 'BENCHMARK_RESULT:'
+
+# 项目内主要模块，单独输出其导入耗时
+key_modules = (
+    'core',
+    'core.config',
+    'core.models',
+    'core.command',
+    'core.handle_post',
+    'core.handle_request',
+    'core.handle_db',
+    'app',
+)
+
+# 冷启动时不应导入的重量级依赖：只在对应功能被调用时才需要
+heavy_modules = (
+    'openai',
+    'boto3',
+    'qiniu',
+    'webdav4',
+    'Crypto',
+    'pytz',
+    'requests',
+    'aiohttp',
+    'core.utils.storage',
+    'core.utils.weather',
+)
+
+# 在新进程中执行的测量代码
+probe_code = r'''
+import os, sys, json, time, hashlib
+sys.path.insert(0, {project_dir!r})
+
+phases = {{}}
+
+def measure(name, func):
+    start = time.perf_counter()
+    result = func()
+    phases[name] = (time.perf_counter() - start) * 1000
+    return result
+
+measure('import_core', lambda: __import__('core'))
+
+import core.config as config_module
+import core.command as command_module
+
+config_obj = measure('config_parse', config_module.ProjectConfig)
+measure('logger_setup', config_obj.make_logger)
+
+# 指令模块已在导入 core 时导入（或按清单尚未导入），这里只测量注册表本身的生成耗时
+measure('command_registry', command_module.build_command_registry)
+
+app_module = measure('import_app', lambda: __import__('app'))
+
+client = app_module.app.test_client()
+token = config_module.config.wechat_config.wechat_token or ''
+
+def make_signature():
+    timestamp, nonce = str(int(time.time())), 'benchmark'
+    signature = hashlib.sha1(''.join(sorted([token, timestamp, nonce])).encode('utf-8')).hexdigest()
+    return {{'signature': signature, 'timestamp': timestamp, 'nonce': nonce}}
+
+def post_message(msg_id):
+    xml = (
+        '<xml><ToUserName><![CDATA[gh_benchmark]]></ToUserName>'
+        f'<FromUserName><![CDATA[{{os.environ["BENCHMARK_USER_ID"]}}]]></FromUserName>'
+        f'<CreateTime>{{int(time.time())}}</CreateTime><MsgType><![CDATA[text]]></MsgType>'
+        f'<Content><![CDATA[{{os.environ["BENCHMARK_CONTENT"]}}]]></Content><MsgId>{{msg_id}}</MsgId></xml>'
+    )
+    return client.post('/wechat', query_string=make_signature(), data=xml.encode('utf-8'))
+
+get_response = measure('first_get', lambda: client.get('/wechat', query_string={{**make_signature(), 'echostr': 'ok'}}))
+
+msg_id = int(time.time() * 1000)
+post_response = measure('first_post', lambda: post_message(msg_id))
+measure('second_post', lambda: post_message(msg_id + 1))
+
+print({result_marker!r} + json.dumps({{
+    'phases': phases,
+    'status': {{'get': get_response.status_code, 'post': post_response.status_code}},
+    'heavy_modules': sorted(name for name in {heavy_modules!r} if name in sys.modules),
+}}))
+'''
+
+
+def get_git_commit() -> str:
+    """获取当前的git提交，用于标记测试结果"""
+
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=project_dir, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return 'unknown'
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, int]]:
+    """
+    解析 -X importtime 的输出
+    :param stderr: 子进程的标准错误输出
+    :return: {模块名: {'self_us': 自身耗时, 'cumulative_us': 累计耗时}}
+    """
+
+    imports = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        try:
+            self_us, cumulative_us, module_name = line[len('import time:'):].split('|')
+            imports[module_name.strip()] = {
+                'self_us': int(self_us.strip()),
+                'cumulative_us': int(cumulative_us.strip()),
+            }
+        except ValueError:
+            continue
+
+    return imports
+
+
+def run_once(python: str, user_id: str, content: str) -> Dict:
+    """
+    在全新的解释器中执行一轮测量
+    :param python: python解释器路径
+    :param user_id: 测试消息的发送者
+    :param content: 测试消息的内容
+    :return: 本轮的测量结果
+    """
+
+    code = probe_code.format(
+        project_dir=project_dir,
+        result_marker=result_marker,
+        heavy_modules=heavy_modules,
+    )
+
+    start = time.perf_counter()
+    process = subprocess.run(
+        [python, '-X', 'importtime', '-c', code],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        env={**os.environ, 'BENCHMARK_USER_ID': user_id, 'BENCHMARK_CONTENT': content},
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    result = None
+    for line in process.stdout.splitlines():
+        if line.startswith(result_marker):
+            result = json.loads(line[len(result_marker):])
+
+    if process.returncode != 0 or result is None:
+        raise RuntimeError(f'测量进程执行失败（退出码：{process.returncode}）：\n{process.stderr[-3000:]}')
+
+    result['phases']['process_wall'] = wall_ms
+    result['imports'] = parse_importtime(process.stderr)
+    return result
+
+
+def summarize(runs: List[Dict], top: int) -> Dict:
+    """
+    汇总多轮测量结果：各阶段取中位数，模块导入耗时取中位数后按累计耗时排序
+    :param runs: 每一轮的测量结果
+    :param top: 保留的模块数量
+    :return: 汇总结果
+    """
+
+    phase_names = list(runs[0]['phases'])
+    phases = {
+        name: {
+            'median_ms': round(statistics.median(run['phases'][name] for run in runs), 2),
+            'min_ms': round(min(run['phases'][name] for run in runs), 2),
+            'max_ms': round(max(run['phases'][name] for run in runs), 2),
+        } for name in phase_names
+    }
+
+    module_names = set()
+    for run in runs:
+        module_names.update(run['imports'])
+
+    imports = []
+    for module_name in module_names:
+        samples = [run['imports'][module_name] for run in runs if module_name in run['imports']]
+        imports.append({
+            'module': module_name,
+            'self_ms': round(statistics.median(item['self_us'] for item in samples) / 1000, 2),
+            'cumulative_ms': round(statistics.median(item['cumulative_us'] for item in samples) / 1000, 2),
+        })
+
+    # 按顶层包汇总自身耗时，便于看出 sqlalchemy、openai 等依赖各自的占比
+    packages = {}
+    for item in imports:
+        package = item['module'].split('.')[0]
+        packages[package] = round(packages.get(package, 0) + item['self_ms'], 2)
+
+    imports_dict = {item['module']: item for item in imports}
+
+    return {
+        'phases': phases,
+        'key_modules': {name: imports_dict[name] for name in key_modules if name in imports_dict},
+        'top_imports': sorted(imports, key=lambda item: item['cumulative_ms'], reverse=True)[:top],
+        'top_packages': dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]),
+        'heavy_modules': sorted(set(name for run in runs for name in run['heavy_modules'])),
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    与之前的结果比较各阶段的中位数，并输出对比表格
+    :param current: 本次的结果
+    :param baseline: 之前的结果
+    :param threshold: 回退阈值，如0.2表示变慢超过20%
+    :param min_delta_ms: 变慢的绝对值低于此值时忽略，避免微小波动被当作回退
+    :return: 回退的阶段列表
+    """
+
+    regressions = []
+
+    print(f"\n对比 {baseline.get('git_commit')} -> {current.get('git_commit')}")
+    print(f"{'阶段':<24}{'之前(ms)':>12}{'本次(ms)':>12}{'变化':>10}")
+
+    for name, phase in current['summary']['phases'].items():
+        old_phase = baseline['summary']['phases'].get(name)
+        if not old_phase:
+            continue
+
+        old_ms, new_ms = old_phase['median_ms'], phase['median_ms']
+        ratio = (new_ms - old_ms) / old_ms if old_ms else 0
+
+        flag = ''
+        if ratio > threshold and new_ms - old_ms > min_delta_ms:
+            flag = '  <-- 回退'
+            regressions.append(name)
+
+        print(f"{name:<24}{old_ms:>12.2f}{new_ms:>12.2f}{ratio:>+10.1%}{flag}")
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='冷启动基准测试：导入耗时与首个请求的响应时间')
+    parser.add_argument('--runs', type=int, default=5, help='测量轮数，每轮一个新进程；默认5')
+    parser.add_argument('--python', default=sys.executable, help='用于测量的python解释器；默认当前解释器')
+    parser.add_argument('--content', default='帮助', help='测试POST请求的消息内容；默认：帮助')
+    parser.add_argument('--user-id', default='benchmark_user', help='测试POST请求的发送者')
+    parser.add_argument('--top', type=int, default=30, help='输出导入耗时最多的模块数量；默认30')
+    parser.add_argument('--output', help='结果文件路径；默认保存到 benchmark_results 目录')
+    parser.add_argument('--compare', help='与之前的结果文件比较')
+    parser.add_argument('--threshold', type=float, default=0.2, help='回退阈值，默认0.2，即变慢超过20%%')
+    parser.add_argument('--min-delta-ms', type=float, default=5, help='变慢低于此毫秒数时不算回退；默认5')
+    args = parser.parse_args(argv)
+
+    runs = []
+    for index in range(args.runs):
+        run = run_once(args.python, args.user_id, args.content)
+        runs.append(run)
+        print(f"第{index + 1}轮：首个POST响应 {run['phases']['first_post']:.1f}ms，"
+              f"进程总耗时 {run['phases']['process_wall']:.1f}ms")
+
+    result = {
+        'git_commit': get_git_commit(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': len(runs),
+        'summary': summarize(runs, args.top),
+        'samples': [run['phases'] for run in runs],
+    }
+
+    summary = result['summary']
+    print(f"\n{'阶段':<24}{'中位数(ms)':>12}{'最小(ms)':>12}{'最大(ms)':>12}")
+    for name, phase in summary['phases'].items():
+        print(f"{name:<24}{phase['median_ms']:>12.2f}{phase['min_ms']:>12.2f}{phase['max_ms']:>12.2f}")
+
+    print(f"\n项目模块的导入耗时：")
+    for name, item in summary['key_modules'].items():
+        print(f"{name:<24}自身 {item['self_ms']:>8.2f}ms  累计 {item['cumulative_ms']:>8.2f}ms")
+
+    print(f"\n导入耗时最多的模块（累计耗时）：")
+    for item in summary['top_imports'][:15]:
+        print(f"{item['cumulative_ms']:>10.2f}ms  {item['module']}")
+
+    if summary['heavy_modules']:
+        print(f"\n首个请求之后已导入的重量级依赖：{'、'.join(summary['heavy_modules'])}")
+
+    output_path = args.output
+    if not output_path:
+        os.makedirs(default_output_dir, exist_ok=True)
+        output_path = os.path.join(
+            default_output_dir, f"startup_{result['git_commit']}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+        )
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n结果已保存：{output_path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        if compare(result, baseline, args.threshold, args.min_delta_ms):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------
+project: wechat_official_SCF
+author: 子不语
+date: 2024/12/27
+contact: 【公众号】思维兵工厂
+description: XML编解码基准测试：core.utils.wechat_xml 与 xmltodict 的对比
+
+每条消息都要解析一次请求、生成一次回复，分别测量：
+    - parse：解析文本、图片、位置、事件等典型消息；
+    - reply_text / reply_image：生成文本、图片回复。
+测量前先校验两种实现的解析结果一致。
+
+用法（在项目根目录执行）：
+    python script/benchmark_xml.py --number 20000
+--------------------------------------------
+"""
+
+import os
+import sys
+import time
+import timeit
+import argparse
+from typing import Callable, Dict
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_dir)
+
+import xmltodict
+
+from core.utils.wechat_xml import parse_message, make_text_reply, make_image_reply
+
+sample_messages = {
+    'text': """<xml><ToUserName><![CDATA[gh_123456]]></ToUserName>
+<FromUserName><![CDATA[oUser_abcdefg]]></FromUserName>
+<CreateTime>1735200000</CreateTime>
+<MsgType><![CDATA[text]]></MsgType>
+<Content><![CDATA[帮助 <a>&amp; 中文内容]]></Content>
+<MsgId>24812345678901234</MsgId>
+<MsgDataId>xxxx</MsgDataId>
+<Idx>xxxx</Idx></xml>""",
+    'image': """<xml><ToUserName><![CDATA[gh_123456]]></ToUserName>
+<FromUserName><![CDATA[oUser_abcdefg]]></FromUserName>
+<CreateTime>1735200000</CreateTime>
+<MsgType><![CDATA[image]]></MsgType>
+<PicUrl><![CDATA[http://mmbiz.qpic.cn/xxx]]></PicUrl>
+<MediaId><![CDATA[media_id_123]]></MediaId>
+<MsgId>24812345678901235</MsgId></xml>""",
+    'location': """<xml><ToUserName><![CDATA[gh_123456]]></ToUserName>
+<FromUserName><![CDATA[oUser_abcdefg]]></FromUserName>
+<CreateTime>1735200000</CreateTime>
+<MsgType><![CDATA[location]]></MsgType>
+<Location_X>23.134521</Location_X>
+<Location_Y>113.358803</Location_Y>
+<Scale>20</Scale>
+<Label><![CDATA[位置信息]]></Label>
+<MsgId>24812345678901236</MsgId></xml>""",
+    'event': """<xml><ToUserName><![CDATA[gh_123456]]></ToUserName>
+<FromUserName><![CDATA[oUser_abcdefg]]></FromUserName>
+<CreateTime>1735200000</CreateTime>
+<MsgType><![CDATA[event]]></MsgType>
+<Event><![CDATA[location_select]]></Event>
+<EventKey><![CDATA[6]]></EventKey>
+<SendLocationInfo><Location_X><![CDATA[23]]></Location_X><Label><![CDATA[ ]]></Label><Poiname></Poiname></SendLocationInfo>
+</xml>""",
+}
+
+reply_text = '这是一条回复内容，包含特殊字符 <>&"\' 以及 ]]> ' * 5
+
+
+def xmltodict_parse(data: bytes) -> Dict:
+    return xmltodict.parse(data.decode('utf-8')).get('xml', {})
+
+
+def xmltodict_text_reply() -> str:
+    return xmltodict.unparse({
+        'xml': {
+            'ToUserName': 'oUser_abcdefg',
+            'FromUserName': 'gh_123456',
+            'CreateTime': int(time.time()),
+            'MsgType': 'text',
+            'Content': reply_text,
+        }
+    })
+
+
+def xmltodict_image_reply() -> str:
+    return xmltodict.unparse({
+        'xml': {
+            'ToUserName': 'oUser_abcdefg',
+            'FromUserName': 'gh_123456',
+            'CreateTime': int(time.time()),
+            'MsgType': 'image',
+            'Image': {'MediaId': 'media_id_123'},
+        }
+    })
+
+
+def check_consistency() -> None:
+    """两种实现的解析结果必须一致；生成的回复能被解析回原始内容"""
+
+    for name, message in sample_messages.items():
+        data = message.encode('utf-8')
+        expected, actual = xmltodict_parse(data), parse_message(data)
+        if expected != actual:
+            raise AssertionError(f'【{name}】消息解析结果不一致：\n{expected}\n{actual}')
+
+    reply = parse_message(make_text_reply('oUser_abcdefg', 'gh_123456', reply_text))
+    if reply['Content'] != reply_text.strip():
+        raise AssertionError(f'文本回复内容不一致：{reply["Content"]}')
+
+
+def measure(func: Callable, number: int, repeat: int) -> float:
+    """返回单次调用的最短耗时，单位：微秒"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='XML编解码基准测试')
+    parser.add_argument('--number', type=int, default=20000, help='每轮调用次数')
+    parser.add_argument('--repeat', type=int, default=5, help='轮数，取最快的一轮')
+    args = parser.parse_args()
+
+    check_consistency()
+
+    cases = []
+    for name, message in sample_messages.items():
+        data = message.encode('utf-8')
+        cases.append((f'parse_{name}', lambda d=data: xmltodict_parse(d), lambda d=data: parse_message(d)))
+
+    cases.append(('reply_text', xmltodict_text_reply,
+                  lambda: make_text_reply('oUser_abcdefg', 'gh_123456', reply_text)))
+    cases.append(('reply_image', xmltodict_image_reply,
+                  lambda: make_image_reply('oUser_abcdefg', 'gh_123456', 'media_id_123')))
+
+    print(f'{"case":<16}{"xmltodict(us)":>15}{"wechat_xml(us)":>16}{"speedup":>10}')
+    for name, baseline, current in cases:
+        baseline_us = measure(baseline, args.number, args.repeat)
+        current_us = measure(current, args.number, args.repeat)
+        print(f'{name:<16}{baseline_us:>15.2f}{current_us:>16.2f}{baseline_us / current_us:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()